@@ -1,4 +1,98 @@
 from interfaces.interfaceDefinition import InterfaceDefinition
+import types
+import os
+import copy
+import marshal
+import sys
+import time
+import argparse
+import array
+import json
+import math
+import builtins
+import shutil
+import subprocess
+import multiprocessing
+import asyncio
+
+UNSET = object()
+
+class LimitExceeded(Exception):
+    """
+    Exception raised when the execution exceeds one of the limits of the executor
+
+    Attributes:
+        limit (str): the name of the exceeded limit
+    """
+
+    def __init__(self, limit, message):
+        """
+        Constructor of the class
+
+        Args:
+            limit (str): the name of the exceeded limit
+            message (str): the message of the exception
+
+        Returns:
+            None
+        """
+        super().__init__(message)
+        self.limit = limit
+
+class VerificationError(Exception):
+    """
+    Exception raised when the verifier finds an instruction that can pop an empty stack
+
+    Attributes:
+        index (int): the index of the instruction
+    """
+
+    def __init__(self, index, message):
+        """
+        Constructor of the class
+
+        Args:
+            index (int): the index of the instruction
+            message (str): the message of the exception
+
+        Returns:
+            None
+        """
+        super().__init__(message)
+        self.index = index
+
+class NumericStack(array.array):
+    """
+    Class that represent a compact stack of 64-bit integers, for the programs that use only integer values
+
+    Methods:
+        clear(): remove all the values of the stack
+
+    Note:
+        Every value takes 8 bytes instead of a pointer and an int object. The booleans become 0 and 1,
+        a float or a string raises a TypeError and an integer outside of 64 bits raises an OverflowError
+    """
+
+    def __new__(cls, values=()):
+        """
+        Create the stack
+
+        Args:
+            values (iterable): the initial values of the stack
+
+        Returns:
+            NumericStack: the stack
+        """
+        return super().__new__(cls, "q", values)
+
+    def clear(self):
+        """
+        Remove all the values of the stack
+
+        Returns:
+            None
+        """
+        del self[:]
 
 class IOOperator:
     """
@@ -7,6 +101,9 @@ class IOOperator:
     Methods:
         write(string): write a string
         read(): read a string
+        flush(): write the buffered strings
+        writeAsync(string): write a string, in the asynchronous execution
+        readAsync(string): read a string, in the asynchronous execution
     """
 
     def __init__(self):
@@ -18,6 +115,15 @@ class IOOperator:
         """
         pass
 
+    def flush(self):
+        """
+        Write the buffered strings, if the operator has a buffer
+
+        Returns:
+            None
+        """
+        pass
+
     def write(self, string):
         """
         Write a string
@@ -39,6 +145,36 @@ class IOOperator:
         """
         return ""
 
+    async def writeAsync(self, string):
+        """
+        Write a string, in the asynchronous execution of the executor
+
+        Args:
+            string (str): the string to write
+
+        Returns:
+            None
+
+        Note:
+            The operators that can't wait write the string with write
+        """
+        self.write(string)
+
+    async def readAsync(self, string):
+        """
+        Read a string, in the asynchronous execution of the executor
+
+        Args:
+            string (str): the prompt of the value
+
+        Returns:
+            str: the read string
+
+        Note:
+            The operators that can't wait read the string with read
+        """
+        return self.read(string)
+
 class TerminalIO(IOOperator):
     """
     Class that represent the terminal IO operator
@@ -99,6 +235,316 @@ class TerminalIO(IOOperator):
         """
         return input(string)
 
+class StreamIO(TerminalIO):
+    """
+    Class that represent an IO operator on streams, without prompts, to run the programs without a terminal
+
+    Attributes:
+        output: the stream where the strings are written (default: sys.stdout)
+        input: the stream where the strings are read (default: sys.stdin)
+
+    Methods:
+        write(string): write a string
+        read(): read a string
+        flush(): flush the output stream
+    """
+
+    def __init__(self, output=None, input=None, language="eng"):
+        """
+        Constructor of the class
+
+        Args:
+            output: the stream where the strings are written (default: sys.stdout)
+            input: the stream where the strings are read (default: sys.stdin)
+            language (str): the language of the operator
+
+        Returns:
+            None
+        """
+        super().__init__(language)
+        self.output = sys.stdout if output is None else output
+        self.input = sys.stdin if input is None else input
+
+    def write(self, string):
+        """
+        Write a string followed by a new line, the stream buffers it
+
+        Args:
+            string (str): the string to write
+
+        Returns:
+            None
+        """
+        self.output.write(f"{string}\n")
+
+    def read(self, string):
+        """
+        Read a line, the prompt is not written
+
+        Returns:
+            str: the read string, without the new line
+
+        Raises:
+            EOFError: if the input stream is ended
+        """
+        line = self.input.readline()
+        if not line:
+            raise EOFError(string)
+        return line.rstrip("\n")
+
+    def flush(self):
+        """
+        Flush the output stream
+
+        Returns:
+            None
+        """
+        self.output.flush()
+
+class BufferedIO(StreamIO):
+    """
+    Class that represent an IO operator on streams that writes the strings in blocks and reads all the input at once
+
+    Attributes:
+        bufferSize (int): the number of characters after which the buffer is written
+        buffer (list): the strings not written yet
+        size (int): the number of characters in the buffer
+        lines (list): the lines of the input, None before the first read
+        position (int): the index of the next line of the input
+
+    Methods:
+        write(string): write a string
+        read(): read a string
+        flush(): write the buffered strings
+    """
+
+    def __init__(self, output=None, input=None, language="eng", bufferSize=65536):
+        """
+        Constructor of the class
+
+        Args:
+            output: the stream where the strings are written (default: sys.stdout)
+            input: the stream where the strings are read (default: sys.stdin)
+            language (str): the language of the operator
+            bufferSize (int): the number of characters after which the buffer is written
+
+        Returns:
+            None
+        """
+        super().__init__(output, input, language)
+        self.bufferSize = bufferSize
+        self.buffer = []
+        self.size = 0
+        self.lines = None
+        self.position = 0
+
+    def write(self, string):
+        """
+        Add a string to the buffer, the buffer is written when it is full
+
+        Args:
+            string (str): the string to write
+
+        Returns:
+            None
+        """
+        string = f"{string}\n"
+        self.buffer.append(string)
+        self.size += len(string)
+        if self.size >= self.bufferSize:
+            self.flush()
+
+    def read(self, string):
+        """
+        Read a line, the whole input is read at the first call
+
+        Returns:
+            str: the read string
+
+        Raises:
+            EOFError: if the input is ended
+
+        Note:
+            The input stream is read until its end, so this operator is meant for files and pipes, not for the terminal
+        """
+        if self.lines is None:
+            self.lines = self.input.read().splitlines()
+        if self.position >= len(self.lines):
+            raise EOFError(string)
+        self.position += 1
+        return self.lines[self.position-1]
+
+    def flush(self):
+        """
+        Write the buffered strings and flush the output stream
+
+        Returns:
+            None
+        """
+        if self.buffer:
+            self.output.write("".join(self.buffer))
+            self.buffer = []
+            self.size = 0
+        self.output.flush()
+
+class MemoryIO(TerminalIO):
+    """
+    Class that represent an IO operator in memory, useful for the tests and for embedding the executor
+
+    Attributes:
+        outputs (list): the written values
+        inputs (list): the values to read
+        position (int): the index of the next value to read
+
+    Methods:
+        write(string): write a string
+        read(): read a string
+        getOutput(): return the written values as text
+    """
+
+    def __init__(self, inputs=(), language="eng"):
+        """
+        Constructor of the class
+
+        Args:
+            inputs (list): the values to read
+            language (str): the language of the operator
+
+        Returns:
+            None
+        """
+        super().__init__(language)
+        self.outputs = []
+        self.inputs = list(inputs)
+        self.position = 0
+
+    def write(self, string):
+        """
+        Save a value, without converting it
+
+        Args:
+            string: the value to write
+
+        Returns:
+            None
+        """
+        self.outputs.append(string)
+
+    def read(self, string):
+        """
+        Read the next value
+
+        Returns:
+            str: the read value
+
+        Raises:
+            EOFError: if there are no more values
+        """
+        if self.position >= len(self.inputs):
+            raise EOFError(string)
+        self.position += 1
+        return self.inputs[self.position-1]
+
+    def getOutput(self):
+        """
+        Return the written values as text, one value for each line
+
+        Returns:
+            str: the written values
+        """
+        return "".join(f"{value}\n" for value in self.outputs)
+
+class QueueIO(TerminalIO):
+    """
+    Class that represent an IO operator that exchanges the values with asyncio queues, useful for the executors running in an event loop
+
+    Attributes:
+        inputs (asyncio.Queue): the values to read, None is the end of the input
+        outputs (asyncio.Queue): the written values
+
+    Methods:
+        write(string): write a string without waiting
+        read(): read a string without waiting
+        writeAsync(string): write a string, waiting if the queue is full
+        readAsync(string): read a string, waiting until a value is available
+    """
+
+    def __init__(self, inputs=None, outputs=None, language="eng"):
+        """
+        Constructor of the class
+
+        Args:
+            inputs (asyncio.Queue): the values to read (default: a new queue)
+            outputs (asyncio.Queue): the written values (default: a new unbounded queue)
+            language (str): the language of the operator
+
+        Returns:
+            None
+        """
+        super().__init__(language)
+        self.inputs = asyncio.Queue() if inputs is None else inputs
+        self.outputs = asyncio.Queue() if outputs is None else outputs
+
+    def write(self, string):
+        """
+        Put a value into the output queue, without converting it and without waiting
+
+        Args:
+            string: the value to write
+
+        Returns:
+            None
+
+        Raises:
+            asyncio.QueueFull: if the output queue is full
+        """
+        self.outputs.put_nowait(string)
+
+    def read(self, string):
+        """
+        Take the next value of the input queue, without waiting
+
+        Returns:
+            str: the read value
+
+        Raises:
+            EOFError: if there are no values or the input is ended
+        """
+        try:
+            value = self.inputs.get_nowait()
+        except asyncio.QueueEmpty:
+            raise EOFError(string)
+        if value is None:
+            raise EOFError(string)
+        return value
+
+    async def writeAsync(self, string):
+        """
+        Put a value into the output queue, waiting if the queue is full
+
+        Args:
+            string: the value to write
+
+        Returns:
+            None
+        """
+        await self.outputs.put(string)
+
+    async def readAsync(self, string):
+        """
+        Take the next value of the input queue, waiting until a value is available
+
+        Returns:
+            str: the read value
+
+        Raises:
+            EOFError: if the input is ended
+        """
+        value = await self.inputs.get()
+        if value is None:
+            raise EOFError(string)
+        return value
+
 class push:
     """
     Class that represent the PUSH command
@@ -107,13 +553,17 @@ class push:
         executor.stack.append(value)
 
     def toCpp(self, executor, value):
+        if isinstance(value, int):
+            return f"\n        stack.push(Element({value}));\n"
+        if isinstance(value, float):
+            return f"\n        stack.push(Element((float) {value!r}));\n"
         return f"\n        stack.push(Element(\"{value}\"));\n"
 
 class pop:
     """
     Class that represent the POP command
     """
-    def __call__(self, executor):
+    def __call__(self, executor, operand=None):
         executor.stack.pop()
 
     def toCpp(self, executor):
@@ -123,9 +573,12 @@ class print_:
     """
     Class that represent the PRINT command
     """
-    def __call__(self, executor):
+    def __call__(self, executor, operand=None):
         executor.io.write(executor.stack[-1])
 
+    async def callAsync(self, executor, operand=None):
+        await executor.io.writeAsync(executor.stack[-1])
+
     def toCpp(self, executor):
         return f"\n        std::cout << stack.top() << std::endl;\n"
 
@@ -133,9 +586,14 @@ class add:
     """
     Class that represent the ADD command
     """
-    def __call__(self, executor):
+    def __call__(self, executor, operand=None):
         executor.stack.append(executor.stack.pop() + executor.stack.pop())
 
+    def fast(self, executor, operand=None):
+        stack = executor.stack
+        value = stack.pop()
+        stack[-1] = value + stack[-1]
+
     def toCpp(self, executor):
         return "\n        ele1 = stack.top();\n        stack.pop();\n        ele2 = stack.top();\n        stack.pop();\n        stack.push(ele1 + ele2);\n"
 
@@ -143,9 +601,14 @@ class sub:
     """
     Class that represent the SUB command
     """
-    def __call__(self, executor):
+    def __call__(self, executor, operand=None):
         executor.stack.append(executor.stack.pop(-2) - executor.stack.pop())
 
+    def fast(self, executor, operand=None):
+        stack = executor.stack
+        value = stack.pop()
+        stack[-1] = stack[-1] - value
+
     def toCpp(self, executor):
         return "\n        ele1 = stack.top();\n        stack.pop();\n        ele2 = stack.top();\n        stack.pop();\n        stack.push(ele2 - ele1);\n"
 
@@ -153,9 +616,14 @@ class mul:
     """
     Class that represent the MUL command
     """
-    def __call__(self, executor):
+    def __call__(self, executor, operand=None):
         executor.stack.append(executor.stack.pop() * executor.stack.pop())
 
+    def fast(self, executor, operand=None):
+        stack = executor.stack
+        value = stack.pop()
+        stack[-1] = value * stack[-1]
+
     def toCpp(self, executor):
         return "\n        ele1 = stack.top();\n        stack.pop();\n        ele2 = stack.top();\n        stack.pop();\n        stack.push(ele1 * ele2);\n"
 
@@ -163,9 +631,14 @@ class div:
     """
     Class that represent the DIV command
     """
-    def __call__(self, executor):
+    def __call__(self, executor, operand=None):
         executor.stack.append(executor.stack.pop(-2) / executor.stack.pop())
 
+    def fast(self, executor, operand=None):
+        stack = executor.stack
+        value = stack.pop()
+        stack[-1] = stack[-1] / value
+
     def toCpp(self, executor):
         return "\n        ele1 = stack.top();\n        stack.pop();\n        ele2 = stack.top();\n        stack.pop();\n        stack.push(ele2 / ele1);\n"
 
@@ -173,7 +646,7 @@ class swap:
     """
     Class that represent the SWAP command
     """
-    def __call__(self, executor):
+    def __call__(self, executor, operand=None):
         executor.stack[-1], executor.stack[-2] = executor.stack[-2], executor.stack[-1]
 
     def toCpp(self, executor):
@@ -183,7 +656,7 @@ class dup:
     """
     Class that represent the DUP command
     """
-    def __call__(self, executor):
+    def __call__(self, executor, operand=None):
         executor.stack.append(executor.stack[-1])
 
     def toCpp(self, executor):
@@ -193,17 +666,18 @@ class end:
     """
     Class that represent the END command
     """
-    def __call__(self, executor):
+    def __call__(self, executor, operand=None):
         executor.terminated = True
+        executor.io.flush()
 
     def toCpp(self, executor):
-        return "\n        return 0;\n"
+        return "\n        std::exit(0);\n"
 
 class clear:
     """
     Class that represent the CLEAR command
     """
-    def __call__(self, executor):
+    def __call__(self, executor, operand=None):
         executor.stack.clear()
 
     def toCpp(self, executor):
@@ -213,9 +687,14 @@ class mod:
     """
     Class that represent the MOD command
     """
-    def __call__(self, executor):
+    def __call__(self, executor, operand=None):
         executor.stack.append(executor.stack.pop(-2) % executor.stack.pop())
 
+    def fast(self, executor, operand=None):
+        stack = executor.stack
+        value = stack.pop()
+        stack[-1] = stack[-1] % value
+
     def toCpp(self, executor):
         return "\n        ele1 = stack.top();\n        stack.pop();\n        ele2 = stack.top();\n        stack.pop();\n        stack.push(ele2 % ele1);\n"
 
@@ -223,9 +702,14 @@ class min_:
     """
     Class that represent the MIN command
     """
-    def __call__(self, executor):
+    def __call__(self, executor, operand=None):
         executor.stack.append(min(executor.stack.pop(), executor.stack.pop()))
 
+    def fast(self, executor, operand=None):
+        stack = executor.stack
+        value = stack.pop()
+        stack[-1] = min(value, stack[-1])
+
     def toCpp(self, executor):
         return "\n        ele1 = stack.top();\n        stack.pop();\n        ele2 = stack.top();\n        stack.pop();\n        stack.push(std::min(ele1.intValue, ele2.intValue));\n"
 
@@ -233,9 +717,14 @@ class max_:
     """
     Class that represent the MAX command
     """
-    def __call__(self, executor):
+    def __call__(self, executor, operand=None):
         executor.stack.append(max(executor.stack.pop(-2), executor.stack.pop()))
 
+    def fast(self, executor, operand=None):
+        stack = executor.stack
+        value = stack.pop()
+        stack[-1] = max(stack[-1], value)
+
     def toCpp(self, executor):
         return "\n        ele1 = stack.top();\n        stack.pop();\n        ele2 = stack.top();\n        stack.pop();\n        stack.push(std::max(ele1.intValue, ele2.intValue));\n"
 
@@ -243,9 +732,14 @@ class equal:
     """
     Class that represent the EQUAL command
     """
-    def __call__(self, executor):
+    def __call__(self, executor, operand=None):
         executor.stack.append(executor.stack.pop(-2) == executor.stack.pop())
 
+    def fast(self, executor, operand=None):
+        stack = executor.stack
+        value = stack.pop()
+        stack[-1] = stack[-1] == value
+
     def toCpp(self, executor):
         return "\n        ele1 = stack.top();\n        stack.pop();\n        ele2 = stack.top();\n        stack.pop();\n        stack.push(ele1 == ele2);\n"
 
@@ -253,9 +747,14 @@ class greater:
     """
     Class that represent the GREATER command
     """
-    def __call__(self, executor):
+    def __call__(self, executor, operand=None):
         executor.stack.append(executor.stack.pop(-2) > executor.stack.pop())
 
+    def fast(self, executor, operand=None):
+        stack = executor.stack
+        value = stack.pop()
+        stack[-1] = stack[-1] > value
+
     def toCpp(self, executor):
         return "\n        ele1 = stack.top();\n        stack.pop();\n        ele2 = stack.top();\n        stack.pop();\n        stack.push(ele1 < ele2);\n"
 
@@ -263,9 +762,14 @@ class less:
     """
     Class that represent the LESS command
     """
-    def __call__(self, executor):
+    def __call__(self, executor, operand=None):
         executor.stack.append(executor.stack.pop(-2) < executor.stack.pop())
 
+    def fast(self, executor, operand=None):
+        stack = executor.stack
+        value = stack.pop()
+        stack[-1] = stack[-1] < value
+
     def toCpp(self, executor):
         return "\n        ele1 = stack.top();\n        stack.pop();\n        ele2 = stack.top();\n        stack.pop();\n        stack.push(ele1 > ele2);\n"
 
@@ -273,9 +777,13 @@ class not_:
     """
     Class that represent the NOT command
     """
-    def __call__(self, executor):
+    def __call__(self, executor, operand=None):
         executor.stack.append(not executor.stack.pop())
 
+    def fast(self, executor, operand=None):
+        stack = executor.stack
+        stack[-1] = not stack[-1]
+
     def toCpp(self, executor):
         return "\n        ele1 = stack.top();\n        stack.pop();\n        stack.push(!ele1);\n"
 
@@ -283,21 +791,21 @@ class and_:
     """
     Class that represent the AND command
     """
-    def __call__(self, executor):
+    def __call__(self, executor, operand=None):
         executor.stack.append(executor.stack.pop(-2) and executor.stack.pop())
 
     def toCpp(self, executor):
-        return "\n        ele1 = stack.top();\n        stack.pop();\n        ele2 = stack.top();\n        stack.pop();\n        stack.push(ele1 && ele2);\n"
+        return "\n        ele1 = stack.top();\n        stack.pop();\n        ele2 = stack.top();\n        stack.pop();\n        stack.push(ele1);\n        if(!ele2.intValue){\n            stack.push(ele2);\n        }\n"
 
 class or_:
     """
     Class that represent the OR command
     """
-    def __call__(self, executor):
+    def __call__(self, executor, operand=None):
         executor.stack.append(executor.stack.pop(-2) or executor.stack.pop())
 
     def toCpp(self, executor):
-        return "\n        ele1 = stack.top();\n        stack.pop();\n        ele2 = stack.top();\n        stack.pop();\n        stack.push(ele1 || ele2);\n"
+        return "\n        ele1 = stack.top();\n        stack.pop();\n        ele2 = stack.top();\n        stack.pop();\n        stack.push(ele1);\n        if(ele2.intValue){\n            stack.push(ele2);\n        }\n"
 
 class goto:
     """
@@ -308,18 +816,22 @@ class goto:
             if int(executor.stack[-1]) == executor.stack[-1]:
                 executor.index = executor.stack.pop()+offset-1
 
-    def toCpp(self, executor, offset):
-        s = "\n        ele1 = stack.top();\n        stack.pop();\n        ele2 = stack.top();\n        stack.pop();\n        if(ele1.intValue){\n            switch(ele2.intValue+"+str(offset)+"){\n"
-        for i in range(len(executor.instructions)-1):
-            s += f"                case {str(i)}:\n                    goto instr_{str(i)};\n"
-        s += "            }\n        }\n"
-        return s
+    def toCpp(self, executor, offset, target=None, checked=False, prefix="", size=None):
+        if size is None:
+            size = len(executor.instructions)-1
+        label = f"{prefix}instr_{target}" if target in range(size) else f"{prefix}instr_end"
+        s = "\n        ele1 = stack.top();\n        stack.pop();\n        if(ele1.intValue){\n"
+        if target is not None and checked:
+            s += f"            if(stack.top().intValue+{offset} == {target}){{\n                stack.pop();\n                goto {label};\n            }}\n"
+        if target is not None and not checked:
+            return s + f"            stack.pop();\n            goto {label};\n        }}\n"
+        return s + f"            jumpTarget = stack.top().intValue+{offset};\n            stack.pop();\n            goto {prefix}dispatch;\n        }}\n"
 
 class num:
     """
     Class that represent the NUM command
     """
-    def __call__(self, executor):
+    def __call__(self, executor, operand=None):
         executor.stack.append(len(executor.stack))
 
     def toCpp(self, executor):
@@ -329,9 +841,12 @@ class input_:
     """
     Class that represent the INPUT command
     """
-    def __call__(self, executor):
+    def __call__(self, executor, operand=None):
         executor.stack.append(executor.io.read(executor.io.languages[executor.io.language]["defaultPromptIn"]))
 
+    async def callAsync(self, executor, operand=None):
+        executor.stack.append(await executor.io.readAsync(executor.io.languages[executor.io.language]["defaultPromptIn"]))
+
     def toCpp(self, executor):
         return "\n        std::cout<<\"" + executor.io.languages[executor.io.language]["defaultPromptIn"] + "\";\n        std::cin >> str1;\n        stack.push(Element(str1));\n"
 
@@ -339,9 +854,13 @@ class int_:
     """
     Class that represent the INT command
     """
-    def __call__(self, executor):
+    def __call__(self, executor, operand=None):
         executor.stack.append(int(executor.stack.pop()))
 
+    def fast(self, executor, operand=None):
+        stack = executor.stack
+        stack[-1] = int(stack[-1])
+
     def toCpp(self, executor):
         return "\n        ele1 = stack.top();\n        stack.pop();\n        if(ele1.type==1)\n            stack.push(ele1);\n        if (ele1.type==2)\n            stack.push(Element(std::stoi(ele1.stringValue)));\n        if(ele1.type==3)\n            stack.push(Element((int) ele1.floatValue));\n"
 
@@ -349,9 +868,13 @@ class float_:
     """
     Class that represent the FLOAT command
     """
-    def __call__(self, executor):
+    def __call__(self, executor, operand=None):
         executor.stack.append(float(executor.stack.pop()))
 
+    def fast(self, executor, operand=None):
+        stack = executor.stack
+        stack[-1] = float(stack[-1])
+
     def toCpp(self, executor):
         return "\n        ele1 = stack.top();\n        stack.pop();\n        if(ele1.type==1)\n            stack.push((float) ele1.intValue);\n        if (ele1.type==2)\n            stack.push(Element(std::stof(ele1.stringValue)));\n        if(ele1.type==3)\n            stack.push(ele1);\n"
 
@@ -359,9 +882,13 @@ class string:
     """
     Class that represent the STRING command
     """
-    def __call__(self, executor):
+    def __call__(self, executor, operand=None):
         executor.stack.append(str(executor.stack.pop()))
 
+    def fast(self, executor, operand=None):
+        stack = executor.stack
+        stack[-1] = str(stack[-1])
+
     def toCpp(self, executor):
         return "\n        ele1 = stack.top();\n        stack.pop();\n        if(ele1.type==1)\n            stack.push(Element(std::to_string(ele1.intValue)));\n        if (ele1.type==2)\n            stack.push(ele1);\n        if(ele1.type==3)\n            stack.push(std::to_string(ele1.floatValue));\n"
 
@@ -369,7 +896,17 @@ class comment:
     """
     Class that represent the COMMENT command
     """
-    def __call__(self, executor):
+    def __call__(self, executor, operand=None):
+        pass
+
+    def toCpp(self, executor):
+        return "\n"
+
+class pragma:
+    """
+    Class that represent the PRAGMA command (the pragma is applied when the instruction is added)
+    """
+    def __call__(self, executor, operand=None):
         pass
 
     def toCpp(self, executor):
@@ -379,8 +916,9 @@ class store:
     """
     Class that represent the STORE command
     """
-    def __call__(self, executor):
-        executor.variables[executor.stack.pop()] = executor.stack.pop()
+    def __call__(self, executor, operand=None):
+        value = executor.stack.pop()
+        executor.storeVariable(executor.stack.pop(), value)
 
     def toCpp(self, executor):
         return  f"\n        ele1 = stack.top();\n        stack.pop();\n        ele2 = stack.top();\n        stack.pop();\n        variables[ele2.stringValue] = ele1;\n"
@@ -389,8 +927,8 @@ class load:
     """
     Class that represent the LOAD command
     """
-    def __call__(self, executor):
-        executor.stack.append(executor.variables[executor.stack.pop()])
+    def __call__(self, executor, operand=None):
+        executor.stack.append(executor.loadVariable(executor.stack.pop()))
 
     def toCpp(self, executor):
         return f"\n        ele1 = stack.top();\n        stack.pop();\n        stack.push(variables[ele1.stringValue]);\n"
@@ -399,12 +937,9 @@ class import_:
     """
     Class that represent the IMPORT command
     """
-    def __call__ (self, executor):
+    def __call__ (self, executor, operand=None):
         filename = executor.stack.pop()
-        offset = len(executor.instructions)
-        with open(filename, "r") as file:
-            for line in file:
-                executor.addInstruction(line, offset)
+        executor.loadModule(filename, len(executor.instructions))
     def toCpp(self, executor):
         return "\n"
 
@@ -412,7 +947,7 @@ class define:
     """
     Class that represent the DEFINE command
     """
-    def __call__(self, executor):
+    def __call__(self, executor, operand=None):
         numberOfInstructions = executor.stack.pop()
         name = executor.stack.pop()
         instructions = []
@@ -425,16 +960,42 @@ class define:
         executor.functions[name] = instructions
 
     def toCpp(self, executor):
-        return "\n"
+        return "\n        ele1 = stack.top();\n        stack.pop();\n        stack.pop();\n        for(int i = 0; i < ele1.intValue; i++){\n            ele2 = stack.top();\n            stack.pop();\n            if(ele2.stringValue == \"PUSH\")\n                stack.pop();\n        }\n"
 
 class compile:
     """
     Class that represent the COMPILE command
+
+    Note:
+        The program is compiled with the native values of NativeCompiler when the types can be inferred, otherwise with the Element values
     """
-    def __call__(self, executor):
+    def __call__(self, executor, operand=None):
+        if executor.sandbox is not None:
+            executor.sandbox.checkCompile(executor)
         filename = executor.stack.pop()
+        s = None
+        if executor.nativeCompiler is not None:
+            s = executor.nativeCompiler.toCpp(executor, executor.instructions[:-1])
+        if s is None:
+            s = self.genericToCpp(executor)
+        with open(filename, "w") as file:
+            file.write(s)
+        if executor.nativeBuild and executor.nativeCompiler is not None:
+            executor.nativeCompiler.build(filename)
+
+    def genericToCpp(self, executor):
+        """
+        Return the C++ code of the program with the Element values, that can contain every type
+
+        Args:
+            executor (Executor): the executor of the program
+
+        Returns:
+            str: the C++ code of the program and of its functions
+        """
         s = """
 #include <iostream>
+#include <cstdlib>
 #include <stack>
 #include <unordered_map>
 #include <string>
@@ -578,20 +1139,60 @@ struct Element {
     }
 };
 
+"""
+        for number, name in enumerate(executor.functions):
+            s += f"void function_{number}(std::stack<Element>& stack, std::unordered_map<std::string, Element>& variables);\n"
+        for number, name in enumerate(executor.functions):
+            s += f"\nvoid function_{number}(std::stack<Element>& stack, std::unordered_map<std::string, Element>& variables) {{\n    Element ele1, ele2;\n    std::string str1;\n    int jumpTarget = 0;\n"
+            s += self.bodyToCpp(executor, executor.functions[name], f"function_{number}_")
+            s += f"\n    function_{number}_instr_end:\n    return;\n}}\n"
+        s += """
 int main() {
     std::stack<Element> stack;
     std::unordered_map<std::string, Element> variables;
     Element ele1, ele2;
     std::string str1;
+    int jumpTarget = 0;
 """
-        for index, instruction in enumerate(executor.instructions):
-            if index != len(executor.instructions)-1:
-                s += f"    instr_{index}: //{instruction.command}{instruction.toCpp(executor)}"
-                if(instruction.command == "INSTR"):
-                    s += "\n        stack.push(Element(" + str(index) + "));\n"
-        s = s + "\n}"
-        with open(filename, "w") as file:
-            file.write(s)
+        s += self.bodyToCpp(executor, executor.instructions[:-1], "")
+        return s + "\n    instr_end:\n    return 0;\n}"
+
+    def bodyToCpp(self, executor, instructions, prefix):
+        """
+        Return the C++ code of the main program or of a function
+
+        Args:
+            executor (Executor): the executor of the program
+            instructions (list): the instructions to compile
+            prefix (str): the prefix of the labels
+
+        Returns:
+            str: the C++ code of the instructions, with the dispatch table of the dynamic jumps if needed
+        """
+        s = ""
+        operations = [executor.decodeInstruction(index, instructions) for index in range(len(instructions))]
+        jumps = JumpResolver().analyze(executor, operations)
+        targets = [target for target, guard, condition in jumps.values()]
+        dynamic = any(operation.command == "GOTO" for position, operation in enumerate(operations) if position not in jumps)
+        checked = dynamic
+        for index, instruction in enumerate(instructions):
+            if index in jumps:
+                target, guard, condition = jumps[index]
+                jumpChecked = dynamic or any(guard < other <= index for other in targets)
+                checked = checked or jumpChecked
+                s += f"    {prefix}instr_{index}: //{instruction.command}{executor.instructionsDict['GOTO'].toCpp(executor, instruction.offset, target, jumpChecked, prefix, len(instructions))}"
+            elif operations[index].command == "GOTO":
+                s += f"    {prefix}instr_{index}: //{instruction.command}{executor.instructionsDict['GOTO'].toCpp(executor, instruction.offset, None, False, prefix, len(instructions))}"
+            else:
+                s += f"    {prefix}instr_{index}: //{instruction.command}{instruction.toCpp(executor)}"
+            if(instruction.command == "INSTR"):
+                s += "\n        stack.push(Element(" + str(index) + "));\n"
+        if checked:
+            s += f"\n    goto {prefix}instr_end;\n    {prefix}dispatch:\n        switch(jumpTarget){{\n"
+            for i in range(len(instructions)):
+                s += f"            case {str(i)}:\n                goto {prefix}instr_{str(i)};\n"
+            s += f"        }}\n        goto {prefix}instr_end;\n"
+        return s
 
     def toCpp(self, executor):
         return "\n"
@@ -600,15 +1201,9 @@ class include:
     """
     Class that represent the INCLUDE command
     """
-    def __call__ (self, executor):
-        number = 0
-        offset = len(executor.instructions)
+    def __call__ (self, executor, operand=None):
         filename = executor.stack.pop()
-        with open(filename, "r") as file:
-            for line in file:
-                executor.addInstruction(line, offset)
-                number += 1
-        executor.index += number
+        executor.index += executor.loadModule(filename, len(executor.instructions))
 
     def toCpp(self, executor):
         return "\n"
@@ -618,204 +1213,4077 @@ class instr:
     Class that represent the INSTR command
     """
 
-    def __call__(self, executor):
-        executor.stack.append(executor.index)
+    def __call__(self, executor, operand=None):
+        executor.stack.append(executor.index if operand is None else operand)
     
     def toCpp(self, executor):
         return ""
 
+class function:
+    """
+    Class that represent the call of a function created with the DEFINE command
+    """
+
+    def __call__(self, executor, name):
+        executor.callFunction(name)
+
+    def toCpp(self, executor, name):
+        return f"\n        function_{list(executor.functions).index(name)}(stack, variables);\n"
+
+class ret:
+    """
+    Class that represent the return from a function
+    """
+
+    def __call__(self, executor, operand=None):
+        executor.returnFunction()
+
+class jump:
+    """
+    Class that represent a jump to an instruction known at compile time
+    """
+
+    def __call__(self, executor, target):
+        executor.index = target-1
+
+class branch:
+    """
+    Class that represent a GOTO whose target is known at compile time
+    """
+
+    def __call__(self, executor, target):
+        if executor.stack.pop():
+            executor.stack.pop()
+            executor.index = target-1
+
+class loadSlot:
+    """
+    Class that represent a LOAD whose variable has a slot
+    """
+
+    def __call__(self, executor, slot):
+        value = executor.slots[slot]
+        if value is UNSET:
+            raise KeyError(executor.slotKeys[slot])
+        executor.stack.append(value)
+
+class storeSlot:
+    """
+    Class that represent a STORE whose variable has a slot (the name is not in the stack)
+    """
+
+    def __call__(self, executor, slot):
+        executor.slots[slot] = executor.stack.pop()
+
+class pushPush:
+    """
+    Class that represent the superinstruction PUSH PUSH
+    """
+
+    def __call__(self, executor, values):
+        executor.stack.extend(values)
+
+class pushAdd:
+    """
+    Class that represent the superinstruction PUSH ADD
+    """
+
+    def __call__(self, executor, value):
+        executor.stack[-1] = value + executor.stack[-1]
+
+class pushSub:
+    """
+    Class that represent the superinstruction PUSH SUB
+    """
+
+    def __call__(self, executor, value):
+        executor.stack[-1] = executor.stack[-1] - value
+
+class pushMul:
+    """
+    Class that represent the superinstruction PUSH MUL
+    """
+
+    def __call__(self, executor, value):
+        executor.stack[-1] = value * executor.stack[-1]
+
+class pushGreater:
+    """
+    Class that represent the superinstruction PUSH GREATER
+    """
+
+    def __call__(self, executor, value):
+        executor.stack[-1] = executor.stack[-1] > value
+
+class pushLess:
+    """
+    Class that represent the superinstruction PUSH LESS
+    """
+
+    def __call__(self, executor, value):
+        executor.stack[-1] = executor.stack[-1] < value
+
+class pushEqual:
+    """
+    Class that represent the superinstruction PUSH EQUAL
+    """
+
+    def __call__(self, executor, value):
+        executor.stack[-1] = executor.stack[-1] == value
+
+class pushLoad:
+    """
+    Class that represent the superinstruction PUSH LOAD
+    """
+
+    def __call__(self, executor, name):
+        executor.stack.append(executor.loadVariable(name))
+
+class pushStore:
+    """
+    Class that represent the superinstruction PUSH STORE
+    """
+
+    def __call__(self, executor, value):
+        executor.storeVariable(executor.stack.pop(), value)
+
+class loadAdd:
+    """
+    Class that represent the superinstruction LOAD ADD
+    """
+
+    def __call__(self, executor, operand=None):
+        value = executor.loadVariable(executor.stack.pop())
+        executor.stack[-1] = value + executor.stack[-1]
+
+class dupStore:
+    """
+    Class that represent the superinstruction DUP STORE
+    """
+
+    def __call__(self, executor, operand=None):
+        value = executor.stack.pop()
+        executor.storeVariable(value, value)
+
 class Instruction:
     """
-    Class that represent an instruction
+    Class that represent an instruction, its attributes are slots so a loaded program doesn't need a dictionary for every instruction
 
     Attributes:
-        string (str): the string of the instruction
-        command (str): the command of the instruction
+        string (str): the string of the instruction, None if the source is not kept
+        command (str): the command of the instruction, interned
         value (str): the value of the instruction
         decoration (str): the decoration of the instruction
         offset (int): the offset of the instruction
     
     Methods:
-        parse(string, offset): parse the string of the instruction
+        parse(string, offset, typedLiterals, keepSource): parse the string of the instruction
+        parseLiteral(string): parse the value of a PUSH instruction into a native value
         execute(executor): execute the instruction
         toCpp(executor): return the C++ code of the instruction
     """
+
+    __slots__ = ("string", "command", "value", "decoration", "offset")
+
     def __init__(self):
         """
         Constructor of the class
         
         Returns:
-            None
+            None
+        """
+        self.string = ""
+        self.command = ""
+        self.value = None
+        self.decoration = None
+        self.offset = 0
+    
+    def parse(self, string, offset=0, typedLiterals=False, keepSource=True):
+        """
+        Parse the string of the instruction
+
+        Args:
+            string (str): the string of the instruction
+            offset (int): the offset of the instruction
+            typedLiterals (bool): if True, the value of a PUSH instruction is parsed into an int, a float or a quoted string
+            keepSource (bool): if False, the string is not kept in the instruction
+
+        Returns:
+            None
+
+        Note:
+            The command, the decoration and the string values are interned, so the instructions of a program share them
+        """
+        self.string = string if keepSource else None
+        self.offset = offset
+        tokens = string.split()
+        self.command = sys.intern(tokens[0].upper())
+        if typedLiterals and len(tokens) > 1 and self.command == "PUSH":
+            self.value, self.decoration = self.parseLiteral(string.split(None, 1)[1])
+        else:
+            if len(tokens) > 1 and self.command != "PUSH":
+                self.decoration = tokens[1]
+            elif len(tokens) > 1 and self.command == "PUSH":
+                self.value = tokens[1]
+            if len(tokens) > 2:
+                self.decoration = tokens[2]
+        if type(self.value) is str:
+            self.value = sys.intern(self.value)
+        if self.decoration is not None:
+            self.decoration = sys.intern(self.decoration)
+
+    def parseLiteral(self, string):
+        """
+        Parse the value of a PUSH instruction into a native value
+
+        Args:
+            string (str): the text following the PUSH command
+
+        Returns:
+            tuple: the value (int, float or str) and the decoration of the instruction
+
+        Note:
+            A value between double quotes is a string and can contain spaces, a value that is not a number is kept as a string
+        """
+        if string.startswith("\"") and string.find("\"", 1) != -1:
+            close = string.find("\"", 1)
+            rest = string[close+1:].split()
+            return string[1:close], rest[0] if rest else None
+        token = string.split()
+        decoration = token[1] if len(token) > 1 else None
+        if any(char.isdigit() for char in token[0]):
+            for type_ in (int, float):
+                try:
+                    return type_(token[0]), decoration
+                except ValueError:
+                    pass
+        return token[0], decoration
+    
+    def execute(self, executor):
+        """
+        Execute the instruction
+
+        Args:
+            executor (Executor): the executor of the instruction
+
+        Returns:
+            None
+        """
+        if self.command == "PUSH":
+            executor.instructionsDict[self.command](executor, self.value)
+        elif self.command == "GOTO":
+            executor.instructionsDict[self.command](executor, self.offset)
+        elif self.command in executor.functions:
+            for instruction in executor.functions[self.command]:
+                instruction.execute(executor)
+        else:
+            executor.instructionsDict[self.command](executor)
+    
+    def toCpp(self, executor):
+        """
+        Return the C++ code of the instruction
+
+        Args:
+            executor (Executor): the executor of the instruction
+
+        Returns:
+            str: the C++ code of the instruction
+        """
+        if self.command == "PUSH":
+            return executor.instructionsDict[self.command].toCpp(executor, self.value)
+        elif self.command == "GOTO":
+            return executor.instructionsDict[self.command].toCpp(executor, self.offset)
+        elif self.command in executor.functions:
+            return executor.internalDict["FUNCTION"].toCpp(executor, self.command)
+        else:
+            return executor.instructionsDict[self.command].toCpp(executor)
+
+class Operation:
+    """
+    Class that represent an operation of the bytecode, before it is compiled
+
+    Attributes:
+        command (str): the command or the internal operation
+        operand: the operand of the operation
+        source (int): the index of the first instruction represented by the operation
+        length (int): the number of instructions represented by the operation
+        guard (int): the index of the first instruction the operation depends on
+
+    Note:
+        An operation is valid only if the execution reaches it sequentially from its guard (or its source),
+        the jumps that land between the guard and the end of the operation run an unoptimized copy of those instructions
+    """
+
+    def __init__(self, command, operand=None, source=0, length=1, guard=None):
+        """
+        Constructor of the class
+
+        Args:
+            command (str): the command or the internal operation
+            operand: the operand of the operation
+            source (int): the index of the first instruction represented by the operation
+            length (int): the number of instructions represented by the operation
+            guard (int): the index of the first instruction the operation depends on (default: source)
+
+        Returns:
+            None
+        """
+        self.command = command
+        self.operand = operand
+        self.source = source
+        self.length = length
+        self.guard = source if guard is None else guard
+
+class OptimizationPass:
+    """
+    Class that represent a pass that optimizes the operations of a unit, it is not implemented (implemented in the subclasses)
+
+    Static Attributes:
+        pureCommands (dict): the commands that compute a value from the values of the stack, with the number of values they use
+        shortCircuitCommands (set): the pure commands that leave their second value on the stack when the first one decides the result
+
+    Methods:
+        evaluate(executor, command, values): compute the value of a pure command with constant arguments
+        __call__(executor, operations): return the optimized operations
+    """
+
+    pureCommands = {
+        "ADD": 2, "SUB": 2, "MUL": 2, "DIV": 2, "MOD": 2, "MIN": 2, "MAX": 2, "EQUAL": 2, "GREATER": 2,
+        "LESS": 2, "AND": 2, "OR": 2, "NOT": 1, "INT": 1, "FLOAT": 1, "STRING": 1
+    }
+
+    shortCircuitCommands = {"AND", "OR"}
+
+    def evaluate(self, executor, command, values):
+        """
+        Compute the value of a pure command with constant arguments
+
+        Args:
+            executor (Executor): the executor of the operations
+            command (str): the pure command
+            values (list): the arguments of the command
+
+        Returns:
+            list: the stack with the result, None if the command fails or the result could be too big
+
+        Note:
+            The stack can contain more than one value (AND and OR can leave their second value under the result)
+        """
+        if command == "MUL" and any(not isinstance(value, (int, float)) for value in values):
+            return None
+        scratch = types.SimpleNamespace(stack=list(values))
+        try:
+            executor.instructionsDict[command](scratch)
+        except Exception:
+            return None
+        return scratch.stack
+
+    def __call__(self, executor, operations):
+        """
+        Return the optimized operations
+
+        Args:
+            executor (Executor): the executor of the operations
+            operations (list): the operations to optimize
+
+        Returns:
+            list: the optimized operations
+        """
+        return operations
+
+class PeepholeOptimizer(OptimizationPass):
+    """
+    Class that represent the pass that folds the constant arithmetic and removes the comments and the useless pairs of commands
+
+    Attributes:
+        removed (int): the number of instructions that are not dispatched anymore
+        folded (int): the number of folded commands
+
+    Static Attributes:
+        pairs (dict): the pairs of commands that don't change the stack, with the number of values they need on the stack
+        dropCommands (set): the commands that do nothing at runtime
+        stackEffects (dict): the commands with a fixed effect on the stack, with the number of values they use and push
+
+    Methods:
+        tail(operations, count): find the last operations that can be replaced
+        proven(operations, position, count): find where the operations before a position start to push enough values
+        report(): return the statistics of the pass
+        __call__(executor, operations): return the optimized operations
+    """
+
+    pairs = {("DUP", "POP"): 1, ("SWAP", "SWAP"): 2, ("PUSH", "POP"): 0}
+
+    dropCommands = {"COMMENT", "PRAGMA"}
+
+    stackEffects = {
+        "PUSH": (0, 1), "POP": (1, 0), "PRINT": (1, 1), "SWAP": (2, 2), "DUP": (1, 2), "STORE": (2, 0), "LOAD": (1, 1),
+        "INPUT": (0, 1), "NUM": (0, 1), "ADD": (2, 1), "SUB": (2, 1), "MUL": (2, 1), "DIV": (2, 1), "MOD": (2, 1), "MIN": (2, 1),
+        "MAX": (2, 1), "EQUAL": (2, 1), "GREATER": (2, 1), "LESS": (2, 1), "NOT": (1, 1), "INT": (1, 1), "FLOAT": (1, 1), "STRING": (1, 1)
+    }
+
+    def __init__(self):
+        """
+        Constructor of the class
+
+        Returns:
+            None
+        """
+        self.removed = 0
+        self.folded = 0
+
+    def tail(self, operations, count):
+        """
+        Find the last operations that can be replaced, skipping the removed pairs between them
+
+        Args:
+            operations (list): the optimized operations
+            count (int): the number of operations to find
+
+        Returns:
+            tuple: the position of the first operation found and the operations, None if there are not enough operations
+        """
+        found = []
+        position = len(operations)
+        while len(found) < count and position > 0:
+            position -= 1
+            if operations[position].command is not None:
+                if operations[position].guard != operations[position].source:
+                    return None
+                found.insert(0, operations[position])
+        if len(found) < count:
+            return None
+        return position, found
+
+    def proven(self, operations, position, count):
+        """
+        Find where the operations before a position start to push enough values, so that the stack has at least a number of values
+
+        Args:
+            operations (list): the optimized operations
+            position (int): the position of the operation that needs the values
+            count (int): the number of values needed
+
+        Returns:
+            int: the index of the first instruction the values depend on, None if the values can't be proven
+        """
+        guard = operations[position].guard
+        while count > 0:
+            position -= 1
+            if position < 0:
+                return None
+            operation = operations[position]
+            if operation.command is None:
+                continue
+            if operation.command not in self.stackEffects:
+                return None
+            pops, pushes = self.stackEffects[operation.command]
+            guard = min(guard, operation.guard)
+            count = 0 if pushes >= count else count - pushes + pops
+        return guard
+
+    def report(self):
+        """
+        Return the statistics of the pass
+
+        Returns:
+            dict: the number of removed instructions and of folded commands
+        """
+        return {"removed": self.removed, "folded": self.folded}
+
+    def __call__(self, executor, operations):
+        """
+        Return the optimized operations
+
+        Args:
+            executor (Executor): the executor of the operations
+            operations (list): the operations to optimize
+
+        Returns:
+            list: the optimized operations
+
+        Note:
+            The removed pairs become operations without a command, so a jump between them runs the original instructions.
+            A pair is removed only when the previous operations prove that the stack has the values it needs,
+            otherwise removing it would hide the error of the missing values
+        """
+        result = []
+        for operation in operations:
+            if operation.command in self.dropCommands:
+                continue
+            end = operation.source+operation.length
+            if operation.command in self.pureCommands:
+                found = self.tail(result, self.pureCommands[operation.command])
+                if found is not None and all(other.command == "PUSH" for other in found[1]):
+                    values = self.evaluate(executor, operation.command, [other.operand for other in found[1]])
+                    if values is not None and len(values) == 1:
+                        del result[found[0]:]
+                        result.append(Operation("PUSH", values[-1], found[1][0].source, end-found[1][0].source))
+                        self.folded += 1
+                        continue
+            found = self.tail(result, 1)
+            if found is not None and (found[1][0].command, operation.command) in self.pairs:
+                guard = self.proven(result, found[0], self.pairs[(found[1][0].command, operation.command)])
+                if guard is not None:
+                    del result[found[0]:]
+                    result.append(Operation(None, None, found[1][0].source, end-found[1][0].source, guard))
+                    continue
+            result.append(operation)
+        self.removed += len(operations) - sum(1 for operation in result if operation.command is not None)
+        return result
+
+class SlotResolver(OptimizationPass):
+    """
+    Class that represent the pass that gives a slot to the variables whose name is pushed as a constant
+
+    Attributes:
+        resolved (int): the number of LOAD and STORE commands that use a slot
+
+    Static Attributes:
+        stackEffects (dict): the commands with a fixed effect on the stack, with the number of values they use and push
+
+    Methods:
+        report(): return the statistics of the pass
+        __call__(executor, operations): return the optimized operations
+    """
+
+    stackEffects = {
+        "POP": (1, 0), "PRINT": (1, 1), "SWAP": (2, 2), "DUP": (1, 2), "STORE": (2, 0), "LOAD": (1, 1), "INPUT": (0, 1),
+        "COMMENT": (0, 0), "PRAGMA": (0, 0), "ADD": (2, 1), "SUB": (2, 1), "MUL": (2, 1), "DIV": (2, 1), "MOD": (2, 1),
+        "MIN": (2, 1), "MAX": (2, 1), "EQUAL": (2, 1), "GREATER": (2, 1), "LESS": (2, 1),
+        "NOT": (1, 1), "INT": (1, 1), "FLOAT": (1, 1), "STRING": (1, 1)
+    }
+
+    def __init__(self):
+        """
+        Constructor of the class
+
+        Returns:
+            None
+        """
+        self.resolved = 0
+
+    def report(self):
+        """
+        Return the statistics of the pass
+
+        Returns:
+            dict: the number of LOAD and STORE commands that use a slot
+        """
+        return {"resolved": self.resolved}
+
+    def __call__(self, executor, operations):
+        """
+        Return the optimized operations
+
+        Args:
+            executor (Executor): the executor of the operations
+            operations (list): the operations to optimize
+
+        Returns:
+            list: the optimized operations
+
+        Note:
+            A PUSH followed by a LOAD becomes a single LOAD with a slot. The PUSH of the name of a STORE is removed
+            when no command between them uses it, and the STORE depends on the position of the removed PUSH
+        """
+        result = []
+        removed = set()
+        stack = []
+        for operation in operations:
+            command = operation.command
+            if command is None:
+                result.append(operation)
+            elif command == "PUSH":
+                result.append(operation)
+                stack.append(operation if operation.guard == operation.source else None)
+            elif command == "LOAD" and stack and stack[-1] is not None and result[-1] is stack[-1] and operation.source == stack[-1].source+stack[-1].length:
+                push = result.pop()
+                result.append(Operation("LOAD_SLOT", executor.slotFor(push.operand), push.source, operation.source+operation.length-push.source))
+                stack[-1] = None
+                self.resolved += 1
+            elif command == "STORE" and len(stack) >= 2 and stack[-2] is not None:
+                removed.add(id(stack[-2]))
+                result.append(Operation("STORE_SLOT", executor.slotFor(stack[-2].operand), operation.source, operation.length, stack[-2].guard))
+                del stack[-2:]
+                self.resolved += 1
+            elif command in self.stackEffects:
+                pops, pushes = self.stackEffects[command]
+                result.append(operation)
+                del stack[max(len(stack)-pops, 0):]
+                stack.extend([None] * pushes)
+            else:
+                result.append(operation)
+                stack = []
+        return [operation for operation in result if id(operation) not in removed]
+
+class SuperinstructionFuser(OptimizationPass):
+    """
+    Class that represent the pass that fuses the pairs of commands that have a superinstruction
+
+    Attributes:
+        profile (dict): the weight of every pair of commands, usually how many times it was executed
+        fused (int): the number of fused pairs
+
+    Static Attributes:
+        superinstructions (dict): the pairs of commands mapped to their superinstruction
+
+    Methods:
+        countPairs(operations): count the pairs of commands that can be fused
+        operand(first, second): return the operand of the superinstruction of two operations
+        report(): return the statistics of the pass
+        __call__(executor, operations): return the optimized operations
+    """
+
+    superinstructions = {
+        ("PUSH", "PUSH"): "PUSH_PUSH",
+        ("PUSH", "ADD"): "PUSH_ADD",
+        ("PUSH", "SUB"): "PUSH_SUB",
+        ("PUSH", "MUL"): "PUSH_MUL",
+        ("PUSH", "GREATER"): "PUSH_GREATER",
+        ("PUSH", "LESS"): "PUSH_LESS",
+        ("PUSH", "EQUAL"): "PUSH_EQUAL",
+        ("PUSH", "LOAD"): "PUSH_LOAD",
+        ("PUSH", "STORE"): "PUSH_STORE",
+        ("LOAD", "ADD"): "LOAD_ADD",
+        ("DUP", "STORE"): "DUP_STORE"
+    }
+
+    def __init__(self, profile=None):
+        """
+        Constructor of the class
+
+        Args:
+            profile (dict): the weight of every pair of commands, only the pairs in the profile are fused (default: every pair with weight 1)
+
+        Returns:
+            None
+        """
+        self.profile = {pair: 1 for pair in self.superinstructions} if profile is None else profile
+        self.fused = 0
+
+    def countPairs(self, operations):
+        """
+        Count the pairs of commands that can be fused
+
+        Args:
+            operations (list): the operations to analyze
+
+        Returns:
+            dict: every pair of commands that has a superinstruction mapped to the number of times it appears
+        """
+        counts = {}
+        for first, second in zip(operations, operations[1:]):
+            if (first.command, second.command) in self.superinstructions:
+                counts[(first.command, second.command)] = counts.get((first.command, second.command), 0) + 1
+        return counts
+
+    def operand(self, first, second):
+        """
+        Return the operand of the superinstruction of two operations
+
+        Args:
+            first (Operation): the first operation
+            second (Operation): the second operation
+
+        Returns:
+            the operand of the superinstruction
+        """
+        if first.command == "PUSH" and second.command == "PUSH":
+            return (first.operand, second.operand)
+        return first.operand
+
+    def report(self):
+        """
+        Return the statistics of the pass
+
+        Returns:
+            dict: the number of fused pairs
+        """
+        return {"fused": self.fused}
+
+    def __call__(self, executor, operations):
+        """
+        Return the optimized operations
+
+        Args:
+            executor (Executor): the executor of the operations
+            operations (list): the operations to optimize
+
+        Returns:
+            list: the optimized operations
+
+        Note:
+            When the pairs overlap, the fused pairs are the ones with the greatest total weight in the profile
+        """
+        weights = []
+        for first, second in zip(operations, operations[1:]):
+            pair = (first.command, second.command)
+            if pair in self.superinstructions and self.profile.get(pair, 0) > 0 and first.guard == first.source and second.guard == second.source \
+                    and second.source == first.source+first.length:
+                weights.append(self.profile[pair])
+            else:
+                weights.append(None)
+        best = [0] * (len(operations)+2)
+        for position in range(len(operations)-2, -1, -1):
+            best[position] = best[position+1]
+            if weights[position] is not None:
+                best[position] = max(best[position], weights[position] + best[position+2])
+        result = []
+        position = 0
+        while position < len(operations):
+            if position < len(weights) and weights[position] is not None and best[position] == weights[position] + best[position+2]:
+                first, second = operations[position], operations[position+1]
+                command = self.superinstructions[(first.command, second.command)]
+                result.append(Operation(command, self.operand(first, second), first.source, first.length+second.length))
+                self.fused += 1
+                position += 2
+            else:
+                result.append(operations[position])
+                position += 1
+        return result
+
+class JumpResolver(OptimizationPass):
+    """
+    Class that represent the pass that resolves the GOTO commands whose target is a constant
+
+    Static Attributes:
+        shuffleCommands (dict): the commands that only move the values of the stack, with the number of values they use
+        neutralCommands (dict): the other commands that can be analyzed, with the number of values they pop and push
+
+    Methods:
+        analyze(executor, operations): find the GOTO operations with a constant target
+        __call__(executor, operations): replace the resolved GOTO operations with jumps
+    """
+
+    shuffleCommands = {"POP": 1, "SWAP": 2, "DUP": 1}
+
+    neutralCommands = {
+        "PRINT": (0, 0), "COMMENT": (0, 0), "PRAGMA": (0, 0), "NUM": (0, 1), "INPUT": (0, 1), "STORE": (2, 0), "LOAD": (1, 1)
+    }
+
+    def analyze(self, executor, operations):
+        """
+        Find the GOTO operations with a constant target, running the constant values through the stack of every straight sequence of operations
+
+        Args:
+            executor (Executor): the executor of the operations
+            operations (list): the operations to analyze
+
+        Returns:
+            dict: the position of every resolved GOTO mapped to a tuple (target, guard, condition), where condition is None when it is computed at runtime
+        """
+        unknown = (None, None)
+        stack = []
+        jumps = {}
+        for position, operation in enumerate(operations):
+            command = operation.command
+            if command is None:
+                continue
+            if command == "PUSH" or command == "INSTR":
+                stack.append((operation.operand, operation.guard))
+            elif command == "GOTO":
+                if len(stack) >= 2 and stack[-2][1] is not None and type(stack[-2][0]) is int:
+                    condition = bool(stack[-1][0]) if stack[-1][1] is not None else None
+                    jumps[position] = (stack[-2][0] + operation.operand, stack[-2][1], condition)
+                stack = []
+            elif command in self.shuffleCommands:
+                stack = [unknown] * (self.shuffleCommands[command] - len(stack)) + stack
+                executor.instructionsDict[command](types.SimpleNamespace(stack=stack))
+            elif command in self.pureCommands:
+                stack = [unknown] * (self.pureCommands[command] - len(stack)) + stack
+                arguments = stack[len(stack)-self.pureCommands[command]:]
+                del stack[len(stack)-self.pureCommands[command]:]
+                values = None
+                if all(source is not None for value, source in arguments):
+                    values = self.evaluate(executor, command, [value for value, source in arguments])
+                if values is not None:
+                    stack.extend((value, min(source for value, source in arguments)) for value in values)
+                elif command in self.shortCircuitCommands:
+                    stack = [unknown]
+                else:
+                    stack.append(unknown)
+            elif command == "CLEAR":
+                stack = []
+            elif command in self.neutralCommands:
+                pops, pushes = self.neutralCommands[command]
+                stack = stack[:max(len(stack)-pops, 0)] + [unknown] * pushes
+            else:
+                stack = []
+        return jumps
+
+    def __call__(self, executor, operations):
+        """
+        Replace the resolved GOTO operations with jumps
+
+        Args:
+            executor (Executor): the executor of the operations
+            operations (list): the operations to optimize
+
+        Returns:
+            list: the optimized operations
+        """
+        jumps = self.analyze(executor, operations)
+        result = []
+        for position, operation in enumerate(operations):
+            if position not in jumps:
+                result.append(operation)
+                continue
+            target, guard, condition = jumps[position]
+            first = result[-2] if len(result) >= 2 else None
+            if condition is not None and first is not None and first.command == "PUSH" and result[-1].command == "PUSH" and first.guard == guard \
+                    and result[-1].source == first.source+first.length and operation.source == result[-1].source+result[-1].length:
+                del result[-2:]
+                if condition:
+                    result.append(Operation("JUMP", target, first.source, operation.source+operation.length-first.source))
+                else:
+                    result.append(Operation("PUSH", first.operand, first.source, operation.source+operation.length-first.source))
+            else:
+                result.append(Operation("BRANCH", target, operation.source, operation.length, guard))
+        return result
+
+class ControlFlowGraph:
+    """
+    Class that represent the control-flow graph of the instructions of a program, split into basic blocks
+
+    Static Attributes:
+        terminators (set): the commands that end a basic block
+        dynamicCommands (set): the commands whose next instruction is known only at runtime
+
+    Attributes:
+        size (int): the number of instructions of the program
+        operations (list): the unoptimized operation of every instruction
+        jumps (dict): the GOTO instructions with a constant target, from JumpResolver.analyze
+        blocks (list): the basic blocks, as tuples (first index, last index)
+        successors (dict): the first index of every basic block mapped to the first indexes of the blocks that can follow it,
+            the size of the program is the end of the program
+        reachable (list): for every instruction, True if it can be executed
+        reason (str): why the flow of the program can't be known before the execution, None if it is known
+
+    Methods:
+        build(executor, start): build the graph of the program of an executor
+        following(index): return the indexes of the instructions that can follow an instruction
+        blockOf(index): return the basic block of an instruction
+        unreachable(): return the indexes of the instructions that can't be executed
+        eliminate(executor): remove the instructions that can't be executed from the program of an executor
+    """
+
+    terminators = {"GOTO", "END", "INCLUDE"}
+
+    dynamicCommands = {"INCLUDE"}
+
+    def __init__(self):
+        """
+        Constructor of the class
+
+        Returns:
+            None
+        """
+        self.size = 0
+        self.operations = []
+        self.jumps = {}
+        self.blocks = []
+        self.successors = {}
+        self.reachable = []
+        self.reason = None
+
+    def following(self, index):
+        """
+        Return the indexes of the instructions that can follow an instruction
+
+        Args:
+            index (int): the index of the instruction
+
+        Returns:
+            list: the indexes of the following instructions, the size of the program is the end of the program
+
+        Raises:
+            ValueError: if the following instructions are known only at runtime
+        """
+        operation = self.operations[index]
+        command = operation.command
+        if command in self.dynamicCommands:
+            raise ValueError(f"the instruction after {command} at instruction {index} is known only at runtime")
+        if command == "END":
+            return []
+        if command != "GOTO":
+            return [index+1]
+        if index not in self.jumps:
+            raise ValueError(f"the target of the GOTO at instruction {index} is known only at runtime")
+        target, guard, condition = self.jumps[index]
+        if target < 0:
+            raise ValueError(f"the GOTO at instruction {index} jumps before the program")
+        following = []
+        if condition is not False:
+            following.append(min(target, self.size))
+        if condition is not True and index+1 not in following:
+            following.append(index+1)
+        return following
+
+    def build(self, executor, start=0):
+        """
+        Build the graph of the program of an executor, following every path from an instruction
+
+        Args:
+            executor (Executor): the executor of the program
+            start (int): the index of the first executed instruction
+
+        Returns:
+            bool: True if the flow of the program is known, False otherwise (the reason is in the reason attribute and every instruction is reachable)
+
+        Note:
+            The GOTO targets must be constants resolved by JumpResolver, and no jump can land between the PUSH of a target and its GOTO.
+            A function call, IMPORT and DEFINE continue with the next instruction, INCLUDE skips the instructions it loads so it is never known
+        """
+        self.size = len(executor.instructions)
+        self.operations = [executor.decodeInstruction(index) for index in range(self.size)]
+        self.jumps = JumpResolver().analyze(executor, self.operations)
+        self.reason = None
+        self.reachable = [False] * self.size
+        leaders = {0, start}
+        pending = [start] if start < self.size else []
+        try:
+            while pending:
+                index = pending.pop()
+                if self.reachable[index]:
+                    continue
+                self.reachable[index] = True
+                following = self.following(index)
+                if self.operations[index].command in self.terminators:
+                    leaders.update(following)
+                pending.extend(index for index in following if index < self.size and not self.reachable[index])
+            targets = {start} | {self.jumps[index][0] for index in range(self.size) if self.reachable[index] and index in self.jumps and self.jumps[index][2] is not False}
+            for index, (target, guard, condition) in self.jumps.items():
+                if self.reachable[index] and any(guard < other <= index for other in targets):
+                    raise ValueError(f"the GOTO at instruction {index} can be reached by a jump after its target is pushed")
+        except ValueError as e:
+            self.reason = str(e)
+            self.reachable = [True] * self.size
+        leaders.update(index+1 for index in range(self.size) if self.operations[index].command in self.terminators)
+        leaders = sorted(leader for leader in leaders if leader < self.size)
+        self.blocks = [(first, (leaders[position+1] if position+1 < len(leaders) else self.size)-1) for position, first in enumerate(leaders)]
+        self.successors = {}
+        for first, last in self.blocks:
+            try:
+                self.successors[first] = self.following(last)
+            except ValueError:
+                self.successors[first] = None
+        return self.reason is None
+
+    def blockOf(self, index):
+        """
+        Return the basic block of an instruction
+
+        Args:
+            index (int): the index of the instruction
+
+        Returns:
+            tuple: the first and the last index of the block, None if the index is outside the program
+        """
+        for first, last in self.blocks:
+            if first <= index <= last:
+                return (first, last)
+        return None
+
+    def unreachable(self):
+        """
+        Return the indexes of the instructions that can't be executed
+
+        Returns:
+            list: the indexes of the unreachable instructions
+        """
+        return [index for index in range(self.size) if not self.reachable[index]]
+
+    def eliminate(self, executor):
+        """
+        Remove the instructions that can't be executed from the program of an executor, changing the offsets of the GOTO
+        instructions so they land on the same instructions
+
+        Args:
+            executor (Executor): the executor whose graph was built
+
+        Returns:
+            int: the number of removed instructions
+
+        Raises:
+            ValueError: if the instructions can't be removed
+
+        Note:
+            The pushed targets are not changed, the offset of every GOTO is moved by the instructions removed before its target.
+            Nothing is removed when an INSTR would change its index, because its value can be used as a target
+        """
+        removed = self.unreachable()
+        if not removed:
+            return 0
+        if len(executor.instructions) != self.size:
+            raise ValueError("the program changed after the graph was built")
+        mapping = []
+        kept = 0
+        for index in range(self.size):
+            mapping.append(kept)
+            kept += self.reachable[index]
+        for index in range(self.size):
+            if self.reachable[index] and self.operations[index].command == "INSTR" and mapping[index] != index:
+                raise ValueError(f"the INSTR at instruction {index} would change its index")
+        instructions = []
+        for index, instruction in enumerate(executor.instructions):
+            if not self.reachable[index]:
+                continue
+            if index in self.jumps and self.jumps[index][2] is not False:
+                target = self.jumps[index][0]
+                moved = mapping[target] if target < self.size else target - len(removed)
+                instruction = copy.copy(instruction)
+                instruction.offset += moved - target
+            instructions.append(instruction)
+        executor.instructions = instructions
+        executor.index = mapping[executor.index] if executor.index < self.size else executor.index - len(removed)
+        return len(removed)
+
+class StackVerifier:
+    """
+    Class that represent the verifier that follows every path of a program to compute the depth of the stack and the types
+    of its values before every instruction, it rejects the programs that can pop an empty stack
+
+    Static Attributes:
+        stackEffects (dict): the commands with a fixed effect, with the number of values they need, the number of values they pop
+            and the types they push (None if the type is computed)
+        requiredValues (dict): the other commands that use the values of the stack, with the number of values they need
+        unverifiableCommands (set): the commands whose effect depends on values known only at runtime
+        samples (dict): a sample value of every type, used to compute the type of the result of a command
+
+    Attributes:
+        states (list): for every instruction (and for the end of the program) the minimum depth of the stack, the maximum depth
+            (None if it is unbounded) and the types of the values on top of the stack, None if the instruction is never reached
+        reason (str): why the last program can't be verified, None if it is verified
+        warnings (dict): the index of every instruction whose operands always have the wrong types mapped to the message
+
+    Methods:
+        kind(value): return the type of a value
+        join(first, second): return the state that contains two states
+        result(executor, index, command, operands): return the type of the result of a command
+        transfer(executor, operation, state, jumps): return the states after an instruction
+        __call__(executor): verify the program of an executor
+    """
+
+    stackEffects = {
+        "POP": (1, 1, ()), "PRINT": (1, 0, ()), "COMMENT": (0, 0, ()), "PRAGMA": (0, 0, ()), "NUM": (0, 0, ("int",)),
+        "INPUT": (0, 0, ("str",)), "INSTR": (0, 0, ("int",)), "STORE": (2, 2, ()), "LOAD": (1, 1, ("any",)), "COMPILE": (1, 1, ()),
+        "NOT": (1, 1, ("bool",)), "INT": (1, 1, ("int",)), "FLOAT": (1, 1, ("float",)), "STRING": (1, 1, ("str",)),
+        "EQUAL": (2, 2, ("bool",)), "GREATER": (2, 2, ("bool",)), "LESS": (2, 2, ("bool",)), "ADD": (2, 2, None), "SUB": (2, 2, None),
+        "MUL": (2, 2, None), "DIV": (2, 2, None), "MOD": (2, 2, None), "MIN": (2, 2, None), "MAX": (2, 2, None)
+    }
+
+    requiredValues = {"DUP": 1, "SWAP": 2, "AND": 2, "OR": 2, "GOTO": 2}
+
+    unverifiableCommands = {"IMPORT", "INCLUDE", "DEFINE", "FUNCTION"}
+
+    samples = {"int": 1, "float": 1.0, "bool": True, "str": "1"}
+
+    def __init__(self):
+        """
+        Constructor of the class
+
+        Returns:
+            None
+        """
+        self.states = []
+        self.reason = None
+        self.warnings = {}
+
+    def kind(self, value):
+        """
+        Return the type of a value
+
+        Args:
+            value: the value
+
+        Returns:
+            str: int, float, bool, str or any
+        """
+        return {bool: "bool", int: "int", float: "float", str: "str"}.get(type(value), "any")
+
+    def join(self, first, second):
+        """
+        Return the state that contains two states, the maximum depth becomes unbounded when it grows
+
+        Args:
+            first (tuple): the state already reached
+            second (tuple): the new state
+
+        Returns:
+            tuple: the minimum depth, the maximum depth and the types of the values on top of the stack
+        """
+        low = min(first[0], second[0])
+        high = None if first[1] is None or second[1] is None or second[1] > first[1] else first[1]
+        types = []
+        for old, new in zip(reversed(first[2]), reversed(second[2])):
+            types.insert(0, old if old == new else "any")
+        return (low, high, tuple(types))
+
+    def result(self, executor, index, command, operands):
+        """
+        Return the type of the result of a command, running it on sample values of the types of its operands
+
+        Args:
+            executor (Executor): the executor of the program
+            index (int): the index of the instruction
+            command (str): the command
+            operands (tuple): the types of the operands, the last one is the top
+
+        Returns:
+            str: the type of the result, any if it depends on the values
+
+        Note:
+            A TypeError on the sample values is added to the warnings, because it happens with every value of those types
+        """
+        if "any" in operands:
+            return "any"
+        if command in ("MIN", "MAX"):
+            return operands[0] if operands[0] == operands[1] else "any"
+        scratch = types.SimpleNamespace(stack=[self.samples[kind] for kind in operands])
+        try:
+            executor.instructionsDict[command](scratch)
+        except TypeError:
+            if not (command == "MOD" and operands[0] == "str"):
+                self.warnings[index] = f"{command} at instruction {index} can't use the types {operands[0]} and {operands[1]}"
+            return "any"
+        except Exception:
+            return "any"
+        return self.kind(scratch.stack[-1])
+
+    def transfer(self, executor, operation, state, jumps):
+        """
+        Return the states after an instruction
+
+        Args:
+            executor (Executor): the executor of the program
+            operation (Operation): the unoptimized operation of the instruction
+            state (tuple): the minimum depth, the maximum depth and the types of the values on top of the stack
+            jumps (dict): the GOTO instructions with a constant target, from JumpResolver.analyze
+
+        Returns:
+            list: the states after the instruction, as tuples (index, state)
+
+        Raises:
+            VerificationError: if the instruction can pop an empty stack
+            ValueError: if the effect of the instruction can't be known before the execution
+        """
+        low, high, kinds = state
+        index = operation.source
+        command = operation.command
+        if command in self.unverifiableCommands:
+            raise ValueError(f"the effect of {operation.operand if command == 'FUNCTION' else command} at instruction {index} is known only at runtime")
+        needs = self.requiredValues.get(command, self.stackEffects.get(command, (0,))[0])
+        if command == "GOTO" and index in jumps and jumps[index][2] is False:
+            needs = 1
+        if low < needs:
+            raise VerificationError(index, f"{command} at instruction {index} can pop an empty stack (it needs {needs} values, the stack can have {low})")
+        if command == "END":
+            return []
+        if command == "PUSH":
+            return [(index+1, (low+1, None if high is None else high+1, kinds + (self.kind(operation.operand),)))]
+        if command == "DUP":
+            return [(index+1, (low+1, None if high is None else high+1, kinds + (kinds[-1] if kinds else "any",)))]
+        if command == "SWAP" and len(kinds) >= 2:
+            return [(index+1, (low, high, kinds[:-2] + (kinds[-1], kinds[-2])))]
+        if command == "SWAP":
+            return [(index+1, (low, high, kinds + ("any",) if kinds else ()))]
+        if command == "CLEAR":
+            return [(index+1, (0, 0, ()))]
+        if command in ("AND", "OR"):
+            top = kinds[-1] if len(kinds) >= 2 and kinds[-1] == kinds[-2] else "any"
+            return [(index+1, (low-1, high, (top,)))]
+        if command == "GOTO":
+            if index not in jumps:
+                raise ValueError(f"the target of the GOTO at instruction {index} is known only at runtime")
+            target, guard, condition = jumps[index]
+            if target < 0:
+                raise ValueError(f"the GOTO at instruction {index} jumps before the program")
+            following = []
+            if condition is not False:
+                following.append((target, (low-2, None if high is None else high-2, kinds[:-2] if len(kinds) >= 2 else ())))
+            if condition is not True:
+                following.append((index+1, (low-1, None if high is None else high-1, kinds[:-1])))
+            return following
+        needs, pops, pushes = self.stackEffects[command]
+        if pushes is None:
+            pushes = (self.result(executor, index, command, kinds[-2:] if len(kinds) >= 2 else ("any", "any")),)
+        rest = kinds[:len(kinds)-pops] if pops <= len(kinds) else ()
+        return [(index+1, (low-pops+len(pushes), None if high is None else high-pops+len(pushes), rest + pushes))]
+
+    def __call__(self, executor):
+        """
+        Verify the program of an executor, starting from its index with the values of its stack
+
+        Args:
+            executor (Executor): the executor of the program
+
+        Returns:
+            bool: True if the program can't pop an empty stack, False if it can't be verified (the reason is in the reason attribute)
+
+        Raises:
+            VerificationError: if an instruction can pop an empty stack
+
+        Note:
+            The GOTO targets must be constants resolved by JumpResolver, and no jump can land between the PUSH of a target and its GOTO.
+            The programs with IMPORT, INCLUDE, DEFINE or a function call can't be verified
+        """
+        instructions = executor.instructions
+        self.states = [None] * (len(instructions)+1)
+        self.reason = None
+        self.warnings = {}
+        operations = [executor.decodeInstruction(index) for index in range(len(instructions))]
+        jumps = JumpResolver().analyze(executor, operations)
+        targets = {target for target, guard, condition in jumps.values() if condition is not False}
+        for index, (target, guard, condition) in jumps.items():
+            if any(guard < other <= index for other in targets):
+                self.reason = f"the GOTO at instruction {index} can be reached by a jump after its target is pushed"
+                return False
+        if executor.index >= len(instructions):
+            return True
+        self.states[executor.index] = (len(executor.stack), len(executor.stack), tuple(self.kind(value) for value in executor.stack))
+        pending = [executor.index]
+        try:
+            while pending:
+                index = pending.pop()
+                for following, state in self.transfer(executor, operations[index], self.states[index], jumps):
+                    following = min(following, len(instructions))
+                    if self.states[following] is None:
+                        self.states[following] = state
+                    else:
+                        joined = self.join(self.states[following], state)
+                        if joined == self.states[following]:
+                            continue
+                        self.states[following] = joined
+                    if following < len(instructions):
+                        pending.append(following)
+        except ValueError as e:
+            self.reason = str(e)
+            return False
+        return True
+
+class NativeCompiler:
+    """
+    Class that represent the C++ backend that infers the type of every value of the stack and of every variable,
+    so the program uses native int64_t, double, bool and std::string values instead of Element
+
+    Static Attributes:
+        cppTypes (dict): every inferred type mapped to its C++ type, the prefix of its variables and its initial value
+        supportedCommands (set): the commands that the backend can compile
+        prelude (str): the C++ code of the helper functions
+
+    Attributes:
+        native (bool): True if the last program was compiled with native values
+        reason (str): why the last program couldn't be compiled with native values, None if it was compiled
+        compiler (str): the C++ compiler used by build, None to use g++ or clang++
+        flags (list): the flags of the C++ compiler
+
+    Methods:
+        decode(executor, instructions): return the optimized operations of the instructions
+        labels(operations, size): return the position of the operation where every instruction starts
+        transfer(executor, operation, stack, assigned, variables): return the states after an operation
+        analyze(executor, operations, size): infer the types of the stack before every operation
+        value(names, depth, kind, to): return the C++ expression of a value of the stack
+        variable(names, slot, kind): return the C++ variable of a NALM variable
+        literal(value): return the C++ literal of a value
+        operationToCpp(executor, operation, stack, variables, labels, names): return the C++ code of an operation
+        toCpp(executor, instructions): return the C++ code of the program, None if it can't be compiled with native values
+        build(source, output): compile the C++ code into a binary
+
+    Note:
+        AND and OR are not supported: they leave their second value on the stack when the first one decides the result,
+        so the depth of the stack after them depends on the values and can't be given a native variable
+    """
+
+    cppTypes = {
+        "int": ("int64_t", "i", "0"),
+        "float": ("double", "f", "0.0"),
+        "bool": ("bool", "b", "false"),
+        "str": ("std::string", "s", "")
+    }
+
+    supportedCommands = {
+        "PUSH", "POP", "PRINT", "ADD", "SUB", "MUL", "DIV", "SWAP", "DUP", "CLEAR", "MOD", "MIN", "MAX", "EQUAL", "GREATER",
+        "LESS", "NOT", "NUM", "INPUT", "INT", "FLOAT", "STRING", "END", "INSTR", "JUMP", "BRANCH", "LOAD_SLOT", "STORE_SLOT"
+    }
+
+    prelude = """
+#include <cstdint>
+#include <cstdio>
+#include <cstdlib>
+#include <cmath>
+#include <cerrno>
+#include <charconv>
+#include <iostream>
+#include <limits>
+#include <string>
+
+static void nalmError(const char* message, int index) {
+    std::cout.flush();
+    std::cerr << "error at instruction " << index << ": " << message << "\\n";
+    std::exit(1);
+}
+
+static int64_t nalmAdd(int64_t a, int64_t b, int index) {
+    int64_t result;
+    if (__builtin_add_overflow(a, b, &result)) nalmError("integer overflow", index);
+    return result;
+}
+
+static int64_t nalmSub(int64_t a, int64_t b, int index) {
+    int64_t result;
+    if (__builtin_sub_overflow(a, b, &result)) nalmError("integer overflow", index);
+    return result;
+}
+
+static int64_t nalmMul(int64_t a, int64_t b, int index) {
+    int64_t result;
+    if (__builtin_mul_overflow(a, b, &result)) nalmError("integer overflow", index);
+    return result;
+}
+
+static double nalmDiv(double a, double b, int index) {
+    if (b == 0.0) nalmError("division by zero", index);
+    return a / b;
+}
+
+static int64_t nalmMod(int64_t a, int64_t b, int index) {
+    if (b == 0) nalmError("integer modulo by zero", index);
+    if (b == -1) return 0;
+    int64_t result = a % b;
+    if (result != 0 && ((result < 0) != (b < 0))) result += b;
+    return result;
+}
+
+static double nalmFmod(double a, double b, int index) {
+    if (b == 0.0) nalmError("float modulo", index);
+    double result = std::fmod(a, b);
+    if (result != 0.0 && ((result < 0) != (b < 0))) result += b;
+    else if (result == 0.0) result = std::copysign(0.0, b);
+    return result;
+}
+
+static std::string nalmTrim(const std::string& text) {
+    size_t first = text.find_first_not_of(" \\t\\n\\r\\f\\v");
+    if (first == std::string::npos) return "";
+    size_t last = text.find_last_not_of(" \\t\\n\\r\\f\\v");
+    return text.substr(first, last - first + 1);
+}
+
+static int64_t nalmParseInt(const std::string& text, int index) {
+    std::string digits;
+    for (char c : nalmTrim(text)) if (c != '_') digits += c;
+    const char* first = digits.c_str();
+    if (!digits.empty() && digits[0] == '+') first++;
+    int64_t result = 0;
+    auto parsed = std::from_chars(first, digits.c_str() + digits.size(), result);
+    if (digits.empty() || parsed.ec != std::errc() || parsed.ptr != digits.c_str() + digits.size()) nalmError("invalid literal for int()", index);
+    return result;
+}
+
+static int64_t nalmTruncate(double value, int index) {
+    if (!(value > -9223372036854775808.0 && value < 9223372036854775808.0)) nalmError("cannot convert float to integer", index);
+    return (int64_t)value;
+}
+
+static double nalmParseFloat(const std::string& text, int index) {
+    std::string trimmed = nalmTrim(text);
+    char* end = nullptr;
+    errno = 0;
+    double result = std::strtod(trimmed.c_str(), &end);
+    if (trimmed.empty() || end != trimmed.c_str() + trimmed.size()) nalmError("could not convert string to float", index);
+    return result;
+}
+
+static std::string nalmFloat(double value) {
+    if (std::isnan(value)) return "nan";
+    if (std::isinf(value)) return value > 0 ? "inf" : "-inf";
+    if (value == 0.0) return std::signbit(value) ? "-0.0" : "0.0";
+    char buffer[64];
+    auto result = std::to_chars(buffer, buffer + sizeof(buffer), value, std::chars_format::scientific);
+    std::string text(buffer, result.ptr);
+    size_t mark = text.find('e');
+    int exponent = std::atoi(text.c_str() + mark + 1);
+    bool negative = text[0] == '-';
+    std::string digits;
+    for (size_t i = negative ? 1 : 0; i < mark; i++) if (text[i] != '.') digits += text[i];
+    std::string out;
+    if (exponent < -4 || exponent >= 16) {
+        out = digits.substr(0, 1);
+        if (digits.size() > 1) out += "." + digits.substr(1);
+        char suffix[8];
+        std::snprintf(suffix, sizeof(suffix), "e%c%02d", exponent < 0 ? '-' : '+', std::abs(exponent));
+        out += suffix;
+    } else if (exponent < 0) {
+        out = "0." + std::string(-exponent - 1, '0') + digits;
+    } else if ((int)digits.size() <= exponent + 1) {
+        out = digits + std::string(exponent + 1 - digits.size(), '0') + ".0";
+    } else {
+        out = digits.substr(0, exponent + 1) + "." + digits.substr(exponent + 1);
+    }
+    return negative ? "-" + out : out;
+}
+
+static std::string nalmInput(const char* prompt, int index) {
+    std::string line;
+    std::cout << prompt << std::flush;
+    if (!std::getline(std::cin, line)) nalmError("EOF when reading a line", index);
+    return line;
+}
+
+static void nalmEnd() {
+    std::cout.flush();
+    std::exit(0);
+}
+"""
+
+    def __init__(self, compiler=None, flags=None):
+        """
+        Constructor of the class
+
+        Args:
+            compiler (str): the C++ compiler used by build (default: g++ or clang++, the first one that is installed)
+            flags (list): the flags of the C++ compiler (default: -O2 -std=c++17)
+
+        Returns:
+            None
+        """
+        self.native = False
+        self.reason = None
+        self.compiler = compiler
+        self.flags = ["-O2", "-std=c++17"] if flags is None else flags
+
+    def decode(self, executor, instructions):
+        """
+        Return the optimized operations of the instructions, with the constant folding, the resolved jumps and the variable slots
+
+        Args:
+            executor (Executor): the executor of the program
+            instructions (list): the instructions to compile
+
+        Returns:
+            list: the operations, without the removed ones
+        """
+        operations = [executor.decodeInstruction(index, instructions) for index in range(len(instructions))]
+        for optimizer in [PeepholeOptimizer(), JumpResolver(), SlotResolver()]:
+            operations = optimizer(executor, operations)
+        return [operation for operation in operations if operation.command is not None]
+
+    def labels(self, operations, size):
+        """
+        Return the position of the operation where every instruction starts
+
+        Args:
+            operations (list): the operations of the program
+            size (int): the number of instructions
+
+        Returns:
+            list: for every instruction (and for the end of the program) the position of its operation, None if a jump can't land there
+        """
+        labels = [len(operations)] * (size+1)
+        position = len(operations)
+        for index in range(size-1, -1, -1):
+            while position > 0 and operations[position-1].source >= index:
+                position -= 1
+            labels[index] = position
+        for operation in operations:
+            for index in range(operation.guard+1, min(operation.source+operation.length, size)):
+                labels[index] = None
+        return labels
+
+    def transfer(self, executor, operation, stack, assigned, variables):
+        """
+        Return the states after an operation
+
+        Args:
+            executor (Executor): the executor of the program
+            operation (Operation): the operation
+            stack (tuple): the types of the values of the stack, the last one is the top
+            assigned (frozenset): the slots of the variables that are assigned in every path
+            variables (dict): the type of every variable slot, it is updated by the STORE operations
+
+        Returns:
+            list: the states after the operation, as tuples (target, stack, assigned), where target is None for the next operation
+
+        Raises:
+            ValueError: if the types can't be inferred
+        """
+        command = operation.command
+        numeric = {"int", "float", "bool"}
+        pops = {"POP": 1, "PRINT": 1, "DUP": 1, "SWAP": 2, "NOT": 1, "INT": 1, "FLOAT": 1, "STRING": 1, "STORE_SLOT": 1, "BRANCH": 1}
+        pops.update({pure: 2 for pure in ["ADD", "SUB", "MUL", "DIV", "MOD", "MIN", "MAX", "EQUAL", "GREATER", "LESS"]})
+        if len(stack) < pops.get(command, 0):
+            raise ValueError(f"{command} at instruction {operation.source} can pop an empty stack")
+        if command == "PUSH":
+            kind = {bool: "bool", int: "int", float: "float", str: "str"}.get(type(operation.operand))
+            if kind is None or (kind == "int" and not -2**63 < operation.operand < 2**63):
+                raise ValueError(f"the value of PUSH at instruction {operation.source} has no native type")
+            return [(None, stack + (kind,), assigned)]
+        if command in ("NUM", "INSTR"):
+            return [(None, stack + ("int",), assigned)]
+        if command == "INPUT":
+            return [(None, stack + ("str",), assigned)]
+        if command == "POP":
+            return [(None, stack[:-1], assigned)]
+        if command == "PRINT":
+            return [(None, stack, assigned)]
+        if command == "DUP":
+            return [(None, stack + stack[-1:], assigned)]
+        if command == "SWAP":
+            return [(None, stack[:-2] + (stack[-1], stack[-2]), assigned)]
+        if command == "CLEAR":
+            return [(None, (), assigned)]
+        if command == "END":
+            return []
+        if command == "NOT":
+            return [(None, stack[:-1] + ("bool",), assigned)]
+        if command in ("INT", "FLOAT", "STRING"):
+            return [(None, stack[:-1] + ({"INT": "int", "FLOAT": "float", "STRING": "str"}[command],), assigned)]
+        if command == "LOAD_SLOT":
+            if operation.operand not in assigned:
+                raise ValueError(f"the variable {executor.slotKeys[operation.operand]!r} can be loaded before it is stored")
+            return [(None, stack + (variables[operation.operand],), assigned)]
+        if command == "STORE_SLOT":
+            if variables.setdefault(operation.operand, stack[-1]) != stack[-1]:
+                raise ValueError(f"the variable {executor.slotKeys[operation.operand]!r} has the types {variables[operation.operand]} and {stack[-1]}")
+            return [(None, stack[:-1], assigned | {operation.operand})]
+        if command == "JUMP":
+            return [(operation.operand, stack, assigned)]
+        if command == "BRANCH":
+            if len(stack) < 2 or stack[-2] != "int":
+                raise ValueError(f"the target of the GOTO at instruction {operation.source} is not an integer")
+            return [(operation.operand, stack[:-2], assigned), (None, stack[:-1], assigned)]
+        top, second = stack[-1], stack[-2]
+        if command == "ADD" and top == "str" and second == "str":
+            result = "str"
+        elif command in ("ADD", "SUB", "MUL", "MOD") and top in numeric and second in numeric:
+            result = "float" if "float" in (top, second) else "int"
+        elif command == "DIV" and top in numeric and second in numeric:
+            result = "float"
+        elif command in ("MIN", "MAX") and top == second:
+            result = top
+        elif command == "EQUAL" or (command in ("GREATER", "LESS") and (top in numeric and second in numeric or top == second == "str")):
+            result = "bool"
+        else:
+            raise ValueError(f"{command} at instruction {operation.source} has the operands {second} and {top}")
+        return [(None, stack[:-2] + (result,), assigned)]
+
+    def analyze(self, executor, operations, size):
+        """
+        Infer the types of the stack before every operation, following every path of the program
+
+        Args:
+            executor (Executor): the executor of the program
+            operations (list): the operations of the program
+            size (int): the number of instructions
+
+        Returns:
+            tuple: the states before every operation (None if it is never reached), the type of every variable slot and the labels
+
+        Raises:
+            ValueError: if the program has a command that can't be compiled, or if a value or a variable can have more than one type
+        """
+        for operation in operations:
+            if operation.command not in self.supportedCommands:
+                raise ValueError(f"{operation.command} at instruction {operation.source} can't be compiled with native values")
+        labels = self.labels(operations, size)
+        states = [None] * (len(operations)+1)
+        variables = {}
+        pending = [0]
+        states[0] = ((), frozenset())
+        while pending:
+            position = pending.pop()
+            if position == len(operations):
+                continue
+            stack, assigned = states[position]
+            for target, newStack, newAssigned in self.transfer(executor, operations[position], stack, assigned, variables):
+                if target is None:
+                    following = position+1
+                elif target < 0:
+                    raise ValueError(f"the GOTO at instruction {operations[position].source} jumps before the program")
+                else:
+                    following = labels[min(target, size)]
+                    if following is None:
+                        raise ValueError(f"the GOTO at instruction {operations[position].source} jumps inside an optimized operation")
+                if states[following] is None:
+                    states[following] = (newStack, newAssigned)
+                    pending.append(following)
+                elif states[following][0] != newStack:
+                    raise ValueError(f"the stack at instruction {operations[following].source if following < len(operations) else size} can have the types {states[following][0]} and {newStack}")
+                elif not states[following][1] <= newAssigned:
+                    states[following] = (newStack, states[following][1] & newAssigned)
+                    pending.append(following)
+        return states, variables, labels
+
+    def value(self, names, depth, kind, to=None):
+        """
+        Return the C++ expression of a value of the stack, converted to another type if needed
+
+        Args:
+            names (set): the names of the used C++ variables, it is updated
+            depth (int): the position of the value in the stack
+            kind (str): the type of the value
+            to (str): the type of the expression: "int", "float", "bool" (its truth value) or "str" (its text), None for the value itself
+
+        Returns:
+            str: the C++ expression
+        """
+        name = f"{self.cppTypes[kind][1]}{depth}"
+        names.add((name, kind))
+        if to is None or to == kind:
+            return name
+        if to == "int":
+            return f"(int64_t){name}"
+        if to == "float":
+            return f"(double){name}"
+        if to == "bool":
+            return f"!{name}.empty()" if kind == "str" else f"({name} != 0)"
+        if kind == "float":
+            return f"nalmFloat({name})"
+        if kind == "bool":
+            return f"std::string({name} ? \"True\" : \"False\")"
+        return f"std::to_string({name})"
+
+    def variable(self, names, slot, kind):
+        """
+        Return the C++ variable of a NALM variable
+
+        Args:
+            names (set): the names of the used C++ variables, it is updated
+            slot (int): the slot of the variable
+            kind (str): the type of the variable
+
+        Returns:
+            str: the name of the C++ variable
+        """
+        name = f"v{self.cppTypes[kind][1]}{slot}"
+        names.add((name, kind))
+        return name
+
+    def literal(self, value):
+        """
+        Return the C++ literal of a value
+
+        Args:
+            value: an int, a float, a bool or a str
+
+        Returns:
+            str: the C++ literal
+        """
+        if isinstance(value, bool):
+            return "true" if value else "false"
+        if isinstance(value, int):
+            return f"INT64_C({value})"
+        if isinstance(value, float):
+            if value != value:
+                return "std::numeric_limits<double>::quiet_NaN()"
+            if value in (float("inf"), float("-inf")):
+                return f"{'-' if value < 0 else ''}std::numeric_limits<double>::infinity()"
+            return repr(value)
+        text = value.encode("utf-8")
+        escaped = "".join(chr(byte) if 32 <= byte < 127 and chr(byte) not in "\"\\?" else f"\\{byte:03o}" for byte in text)
+        return f"std::string(\"{escaped}\", {len(text)})"
+
+    def operationToCpp(self, executor, operation, stack, variables, labels, names):
+        """
+        Return the C++ code of an operation
+
+        Args:
+            executor (Executor): the executor of the program
+            operation (Operation): the operation
+            stack (tuple): the types of the values of the stack before the operation
+            variables (dict): the type of every variable slot
+            labels (list): the position of the operation where every instruction starts
+            names (set): the names of the used C++ variables, it is updated
+
+        Returns:
+            str: the C++ code
+        """
+        command = operation.command
+        index = operation.source+operation.length-1
+        depth = len(stack)
+        top = depth-1
+        second = depth-2
+        get = lambda position, to=None: self.value(names, position, stack[position], to)
+        put = lambda kind, position=second: self.value(names, position, kind)
+        label = lambda target: "instr_end" if min(target, len(labels)-1) == len(labels)-1 else f"op_{labels[target]}"
+        if command == "PUSH":
+            return f"{put(self.transfer(executor, operation, stack, frozenset(), {})[0][1][-1], depth)} = {self.literal(operation.operand)};"
+        if command in ("NUM", "INSTR"):
+            return f"{put('int', depth)} = INT64_C({depth if command == 'NUM' else operation.operand});"
+        if command == "INPUT":
+            prompt = executor.io.languages[executor.io.language]["defaultPromptIn"] if hasattr(executor.io, "languages") else ""
+            return f"{put('str', depth)} = nalmInput({self.literal(prompt)}.c_str(), {index});"
+        if command in ("POP", "CLEAR"):
+            return ""
+        if command == "PRINT":
+            text = get(top, "str") if stack[top] in ("float", "bool") else get(top)
+            return f"std::cout << {text} << '\\n';"
+        if command == "DUP":
+            return f"{put(stack[top], depth)} = {get(top)};"
+        if command == "SWAP":
+            if stack[top] == stack[second]:
+                return f"std::swap({get(top)}, {get(second)});"
+            return f"{put(stack[top], second)} = {get(top)};\n    {put(stack[second], top)} = {get(second)};"
+        if command == "END":
+            return "nalmEnd();"
+        if command == "NOT":
+            return f"{put('bool', top)} = !{get(top, 'bool')};"
+        if command in ("INT", "FLOAT", "STRING"):
+            kind = {"INT": "int", "FLOAT": "float", "STRING": "str"}[command]
+            if stack[top] == kind:
+                return ""
+            if stack[top] == "str":
+                return f"{put(kind, top)} = {'nalmParseInt' if kind == 'int' else 'nalmParseFloat'}({get(top)}, {index});"
+            if stack[top] == "float" and kind == "int":
+                return f"{put(kind, top)} = nalmTruncate({get(top)}, {index});"
+            return f"{put(kind, top)} = {get(top, kind)};"
+        if command == "LOAD_SLOT":
+            return f"{put(variables[operation.operand], depth)} = {self.variable(names, operation.operand, variables[operation.operand])};"
+        if command == "STORE_SLOT":
+            return f"{self.variable(names, operation.operand, stack[top])} = {get(top)};"
+        if command == "JUMP":
+            return f"goto {label(operation.operand)};"
+        if command == "BRANCH":
+            return f"if ({get(top, 'bool')}) goto {label(operation.operand)};"
+        kind = self.transfer(executor, operation, stack, frozenset(), {})[0][1][-1]
+        numeric = "float" if "float" in (stack[top], stack[second]) else "int"
+        if command == "ADD" and kind == "str":
+            return f"{put(kind)} = {get(top)} + {get(second)};"
+        if command in ("ADD", "SUB", "MUL"):
+            first, last = (top, second) if command != "SUB" else (second, top)
+            if kind == "int":
+                return f"{put(kind)} = nalm{command.capitalize()}({get(first, 'int')}, {get(last, 'int')}, {index});"
+            return f"{put(kind)} = {get(first, 'float')} {'+' if command == 'ADD' else '-' if command == 'SUB' else '*'} {get(last, 'float')};"
+        if command == "DIV":
+            return f"{put(kind)} = nalmDiv({get(second, 'float')}, {get(top, 'float')}, {index});"
+        if command == "MOD":
+            return f"{put(kind)} = {'nalmMod' if kind == 'int' else 'nalmFmod'}({get(second, kind)}, {get(top, kind)}, {index});"
+        if command == "MIN":
+            return f"if (!({get(second)} < {get(top)})) {get(second)} = {get(top)};"
+        if command == "MAX":
+            return f"if ({get(top)} > {get(second)}) {get(second)} = {get(top)};"
+        if command == "EQUAL" and "str" in (stack[top], stack[second]) and stack[top] != stack[second]:
+            return f"{put('bool')} = false;"
+        if command == "EQUAL" and stack[top] == stack[second] == "str":
+            return f"{put('bool')} = {get(second)} == {get(top)};"
+        operator = {"EQUAL": "==", "GREATER": ">", "LESS": "<"}[command]
+        if stack[top] == stack[second] == "str":
+            return f"{put('bool')} = {get(second)} {operator} {get(top)};"
+        return f"{put('bool')} = {get(second, numeric)} {operator} {get(top, numeric)};"
+
+    def toCpp(self, executor, instructions):
+        """
+        Return the C++ code of the program with native values
+
+        Args:
+            executor (Executor): the executor of the program
+            instructions (list): the instructions to compile
+
+        Returns:
+            str: the C++ code, None if the program can't be compiled with native values (the reason is saved in the reason attribute)
+
+        Note:
+            Every position of the stack becomes a local variable for every type it can have, so the values stay in the registers.
+            The program can't be compiled if a position of the stack or a variable can have two types in the same point,
+            if it uses functions, files or dynamic GOTO and variable names, or if the integers can be bigger than 64 bits
+        """
+        self.native = False
+        try:
+            operations = self.decode(executor, instructions)
+            states, variables, labels = self.analyze(executor, operations, len(instructions))
+        except ValueError as e:
+            self.reason = str(e)
+            return None
+        targets = {labels[min(operation.operand, len(instructions))] for position, operation in enumerate(operations)
+                   if operation.command in ("JUMP", "BRANCH") and states[position] is not None}
+        names = set()
+        body = ""
+        for position, operation in enumerate(operations):
+            if position in targets:
+                body += f"    op_{position}:\n"
+            if states[position] is None:
+                continue
+            code = self.operationToCpp(executor, operation, states[position][0], variables, labels, names)
+            body += f"    // {operation.command} (instruction {operation.source})\n" + (f"    {code}\n" if code else "")
+        declarations = "".join(f"    {self.cppTypes[kind][0]} {name}{' = ' + self.cppTypes[kind][2] if self.cppTypes[kind][2] else ''};\n" for name, kind in sorted(names))
+        self.native = True
+        self.reason = None
+        return f"{self.prelude}\nint main() {{\n    std::ios::sync_with_stdio(false);\n{declarations}{body}    instr_end:\n    std::cout.flush();\n    return 0;\n}}\n"
+
+    def build(self, source, output=None):
+        """
+        Compile the C++ code into a binary with g++ or clang++
+
+        Args:
+            source (str): the C++ file
+            output (str): the binary (default: the name of the C++ file without the extension)
+
+        Returns:
+            str: the binary, None if there is no compiler or the compilation fails (the reason is saved in the reason attribute)
+        """
+        compiler = self.compiler or shutil.which("g++") or shutil.which("clang++")
+        if compiler is None:
+            self.reason = "no C++ compiler found"
+            return None
+        output = os.path.splitext(source)[0] if output is None else output
+        result = subprocess.run([compiler] + self.flags + ["-o", output, source], capture_output=True, text=True)
+        if result.returncode != 0:
+            self.reason = result.stderr
+            return None
+        return output
+
+class PythonJit:
+    """
+    Class that represent the tier between the bytecode and the C++ backend, it translates the straight sequences of operations
+    and the simple loops of the bytecode into Python functions that keep the values of the stack in local variables
+
+    Static Attributes:
+        binaryCommands (dict): the commands that use the two values on top of the stack, with the expression of their result
+        unaryCommands (dict): the commands that use the value on top of the stack, with the expression of their result
+        constantCommands (dict): the superinstructions that replace the top of the stack, with the expression of their result
+
+    Attributes:
+        threshold (int): the number of times a jump must land on an operation before its region is compiled
+        maxLength (int): the maximum number of operations of a region
+        counts (dict): the position of every operation where a jump landed mapped to the number of times, until its region is compiled
+        regions (dict): the position of every compiled region mapped to its function, the position of every line and the constants, None if the region can't be compiled
+        code (list): the bytecode of the regions, the regions are discarded when the executor compiles a new bytecode
+        failure (int): the position of the operation that raised the last exception inside a region
+        compiled (int): the number of compiled regions
+        rejected (int): the number of regions that can't be compiled
+        entered (int): the number of executions of the compiled regions
+        commands (dict): every opcode mapped to its command
+
+    Methods:
+        enter(executor, code, entries, pc): run the region that starts at an operation, compiling it when it becomes hot
+        recover(executor, error, region): restore the stack and the steps of the executor after an exception inside a region
+        report(): return the statistics of the JIT
+        compileRegion(executor, code, entries, start): compile the region that starts at an operation
+        translate(region, executor, operation, pc, position, start, entries): add the Python code of an operation to a region
+        constant(region, value): return the Python expression of a constant
+        local(region): return a new local variable
+        emit(region, line, pc, position, indent): add a line to a region
+        take(region, count, pc, position): return the expressions of the values on top of the stack, removing them
+        flush(region, values, pc, position, indent): add the code that pushes the values of the local variables into the stack
+        exit(region, pc, position, indent): add the code that leaves the region before an operation
+    """
+
+    binaryCommands = {
+        "ADD": "{b} + {a}", "SUB": "{a} - {b}", "MUL": "{b} * {a}", "DIV": "{a} / {b}", "MOD": "{a} % {b}", "MIN": "min({b}, {a})",
+        "MAX": "max({a}, {b})", "EQUAL": "{a} == {b}", "GREATER": "{a} > {b}", "LESS": "{a} < {b}"
+    }
+
+    unaryCommands = {"NOT": "not {b}", "INT": "int({b})", "FLOAT": "float({b})", "STRING": "str({b})"}
+
+    constantCommands = {
+        "PUSH_ADD": "{value} + {top}", "PUSH_SUB": "{top} - {value}", "PUSH_MUL": "{value} * {top}", "PUSH_GREATER": "{top} > {value}",
+        "PUSH_LESS": "{top} < {value}", "PUSH_EQUAL": "{top} == {value}"
+    }
+
+    def __init__(self, threshold=50, maxLength=1000):
+        """
+        Constructor of the class
+
+        Args:
+            threshold (int): the number of times a jump must land on an operation before its region is compiled
+            maxLength (int): the maximum number of operations of a region
+
+        Returns:
+            None
+        """
+        self.threshold = threshold
+        self.maxLength = maxLength
+        self.counts = {}
+        self.regions = {}
+        self.code = None
+        self.failure = None
+        self.compiled = 0
+        self.rejected = 0
+        self.entered = 0
+        self.commands = {opcode: command for command, opcode in Executor.opcodes.items()}
+
+    def enter(self, executor, code, entries, pc):
+        """
+        Run the region that starts at an operation, compiling it when a jump lands on it for the threshold time
+
+        Args:
+            executor (Executor): the executor of the bytecode
+            code (list): the bytecode of the executor
+            entries (list): the entries of the running frame
+            pc (int): the position of the operation where the jump landed
+
+        Returns:
+            int: the position of the operation where the execution continues, pc if the region is not compiled
+
+        Raises:
+            Exception: the exception raised inside the region, the failure attribute is the position of the operation that raised it
+        """
+        if code is not self.code:
+            self.code = code
+            self.counts = {}
+            self.regions = {}
+        if pc not in self.regions:
+            count = self.counts.get(pc, 0) + 1
+            if count < self.threshold:
+                self.counts[pc] = count
+                return pc
+            self.counts.pop(pc, None)
+            self.regions[pc] = self.compileRegion(executor, code, entries, pc)
+        region = self.regions[pc]
+        if region is None:
+            return pc
+        self.entered += 1
+        try:
+            return region[0](executor, executor.stack, executor.slots)
+        except Exception as e:
+            self.recover(executor, e, region)
+            raise e
+
+    def recover(self, executor, error, region):
+        """
+        Restore the stack and the steps of the executor after an exception inside a region
+
+        Args:
+            executor (Executor): the executor of the bytecode
+            error (Exception): the exception raised inside the region
+            region (tuple): the function, the position of every line and the constants of the region
+
+        Returns:
+            None
+
+        Note:
+            The values kept in local variables are pushed into the stack, except the ones already used by the failing operation,
+            so the stack is the same as if the operation failed in the bytecode
+        """
+        function, where, constants = region
+        traceback = error.__traceback__
+        while traceback.tb_frame.f_code is not function.__code__:
+            traceback = traceback.tb_next
+        frame = traceback.tb_frame
+        pc, position, live = where[traceback.tb_lineno-1]
+        executor.steps += frame.f_locals["steps"] + position
+        executor.stack.extend(frame.f_locals[value] if value in frame.f_locals else constants[value] for value in live)
+        self.failure = pc
+
+    def report(self):
+        """
+        Return the statistics of the JIT
+
+        Returns:
+            dict: the number of compiled regions, of rejected regions and of executions of the compiled regions
+        """
+        return {"compiled": self.compiled, "rejected": self.rejected, "entered": self.entered}
+
+    def compileRegion(self, executor, code, entries, start):
+        """
+        Compile the region that starts at an operation
+
+        Args:
+            executor (Executor): the executor of the bytecode
+            code (list): the bytecode of the executor
+            entries (list): the entries of the running frame
+            start (int): the position of the first operation of the region
+
+        Returns:
+            tuple: the function, the position of every line and the constants of the region, None if the region is empty
+
+        Note:
+            The region follows the bytecode from its first operation until a control operation leaves it. A JUMP or a BRANCH
+            back to the first operation becomes a loop, the other control operations are left to the bytecode.
+            When the BRANCH is not taken and the next instruction doesn't follow it in the bytecode, its condition is pushed back
+            and the region leaves before it. The function returns the position of the operation where the bytecode continues
+        """
+        region = types.SimpleNamespace(
+            lines=["def region(executor, stack, slots):", "    write = executor.io.write", "    steps = 0", "    while True:"],
+            where=[None] * 4, values=[], live=[], names=0, constants={}, globals={"UNSET": UNSET}, loop=False
+        )
+        pc = start
+        position = 0
+        while True:
+            if pc >= len(code) or position >= self.maxLength:
+                self.exit(region, pc, position)
+                break
+            if not self.translate(region, executor, code[pc], pc, position, start, entries):
+                break
+            pc += 1
+            position += 1
+        if position == 0 and not region.loop:
+            self.rejected += 1
+            return None
+        builtins.exec(builtins.compile("\n".join(region.lines), f"<nalm-jit-{start}>", "exec"), region.globals)
+        self.compiled += 1
+        return (region.globals["region"], region.where, region.constants)
+
+    def translate(self, region, executor, operation, pc, position, start, entries):
+        """
+        Add the Python code of an operation to a region
+
+        Args:
+            region (SimpleNamespace): the region being compiled
+            executor (Executor): the executor of the bytecode
+            operation (tuple): the operation of the bytecode
+            pc (int): the position of the operation
+            position (int): the number of operations of the region before this one
+            start (int): the position of the first operation of the region
+            entries (list): the entries of the running frame
+
+        Returns:
+            bool: False if the region ends with this operation
+        """
+        opcode, handler, operand, source, control = operation
+        command = self.commands[opcode]
+        values = region.values
+        region.live = list(values)
+        if control:
+            target = entries[operand] if command in ("JUMP", "BRANCH") and type(operand) is int and 0 <= operand < len(entries) else None
+            following = source+1 < len(entries) and entries[source+1] == pc+1
+            if command == "JUMP" and target == start:
+                region.loop = True
+                self.flush(region, values, pc, position)
+                self.emit(region, f"steps += {position+1}", pc, position)
+                self.emit(region, "continue", pc, position)
+                return False
+            if command == "BRANCH" and target == start:
+                region.loop = True
+                condition = self.take(region, 1, pc, position)[0]
+                self.emit(region, f"if {condition}:", pc, position)
+                if values:
+                    self.flush(region, values[:-1], pc, position, 3)
+                else:
+                    self.emit(region, "stack.pop()", pc, position, 3)
+                self.emit(region, f"steps += {position+1}", pc, position, 3)
+                self.emit(region, "continue", pc, position, 3)
+                if not following:
+                    values.append(condition)
+                    self.exit(region, pc, position)
+                    return False
+                return True
+            if command == "BRANCH" and following:
+                self.emit(region, f"if {values[-1] if values else 'stack[-1]'}:", pc, position)
+                self.exit(region, pc, position, 3)
+                if values:
+                    values.pop()
+                else:
+                    self.emit(region, "stack.pop()", pc, position)
+                return True
+            self.exit(region, pc, position)
+            return False
+        if command == "PUSH" or command == "INSTR" and operand is not None:
+            values.append(self.constant(region, operand))
+        elif command == "PUSH_PUSH":
+            values.extend(self.constant(region, value) for value in operand)
+        elif command in ("COMMENT", "PRAGMA"):
+            pass
+        elif command == "POP":
+            if values:
+                values.pop()
+            else:
+                self.emit(region, "stack.pop()", pc, position)
+        elif command == "DUP":
+            if not values:
+                values.append(self.local(region))
+                self.emit(region, f"{values[-1]} = stack[-1]", pc, position)
+            else:
+                values.append(values[-1])
+        elif command == "SWAP" and len(values) >= 2:
+            values[-1], values[-2] = values[-2], values[-1]
+        elif command == "SWAP":
+            self.flush(region, values, pc, position)
+            self.emit(region, "stack[-1], stack[-2] = stack[-2], stack[-1]", pc, position)
+        elif command == "PRINT":
+            self.emit(region, f"write({values[-1] if values else 'stack[-1]'})", pc, position)
+        elif command == "NUM":
+            name = self.local(region)
+            self.emit(region, f"{name} = len(stack) + {len(values)}", pc, position)
+            values.append(name)
+        elif command == "CLEAR":
+            values.clear()
+            self.emit(region, "stack.clear()", pc, position)
+        elif command in self.binaryCommands or command in self.unaryCommands:
+            count = 2 if command in self.binaryCommands else 1
+            region.live = values[:max(len(values)-count, 0)]
+            arguments = self.take(region, count, pc, position)
+            name = self.local(region)
+            template = self.binaryCommands[command] if count == 2 else self.unaryCommands[command]
+            self.emit(region, f"{name} = " + template.format(a=arguments[0], b=arguments[-1]), pc, position)
+            values.append(name)
+        elif command in self.constantCommands:
+            value = self.constant(region, operand)
+            if values:
+                name = self.local(region)
+                self.emit(region, f"{name} = " + self.constantCommands[command].format(value=value, top=values[-1]), pc, position)
+                values[-1] = name
+            else:
+                self.emit(region, "stack[-1] = " + self.constantCommands[command].format(value=value, top="stack[-1]"), pc, position)
+        elif command == "LOAD_SLOT":
+            name = self.local(region)
+            self.emit(region, f"{name} = slots[{operand}]", pc, position)
+            self.emit(region, f"if {name} is UNSET:", pc, position)
+            self.emit(region, f"raise KeyError({self.constant(region, executor.slotKeys[operand])})", pc, position, 3)
+            values.append(name)
+        elif command == "STORE_SLOT":
+            region.live = values[:-1]
+            self.emit(region, f"slots[{operand}] = {self.take(region, 1, pc, position)[0]}", pc, position)
+        else:
+            self.flush(region, values, pc, position)
+            region.live = []
+            name = f"h{pc}"
+            region.globals[name] = handler
+            self.emit(region, f"{name}(executor, {self.constant(region, operand)})", pc, position)
+        return True
+
+    def constant(self, region, value):
+        """
+        Return the Python expression of a constant
+
+        Args:
+            region (SimpleNamespace): the region being compiled
+            value: the constant
+
+        Returns:
+            str: the literal of the constant, or the name of a global variable if it has no literal
+        """
+        if type(value) in (int, bool, str) or type(value) is float and math.isfinite(value):
+            expression = repr(value)
+        else:
+            expression = f"k{len(region.globals)}"
+            region.globals[expression] = value
+        region.constants[expression] = value
+        return expression
+
+    def local(self, region):
+        """
+        Return a new local variable
+
+        Args:
+            region (SimpleNamespace): the region being compiled
+
+        Returns:
+            str: the name of the variable
+        """
+        region.names += 1
+        return f"v{region.names}"
+
+    def emit(self, region, line, pc, position, indent=2):
+        """
+        Add a line to a region
+
+        Args:
+            region (SimpleNamespace): the region being compiled
+            line (str): the Python code of the line
+            pc (int): the position of the operation of the line
+            position (int): the number of operations of the region before the operation of the line
+            indent (int): the indentation level of the line
+
+        Returns:
+            None
+        """
+        region.lines.append("    " * indent + line)
+        region.where.append((pc, position, region.live))
+
+    def take(self, region, count, pc, position):
+        """
+        Return the expressions of the values on top of the stack, removing them from the local variables or from the stack
+
+        Args:
+            region (SimpleNamespace): the region being compiled
+            count (int): the number of values
+            pc (int): the position of the operation that uses the values
+            position (int): the number of operations of the region before the operation
+
+        Returns:
+            list: the expressions of the values, the top of the stack is the last one
+        """
+        values = region.values
+        taken = values[max(len(values)-count, 0):]
+        del values[max(len(values)-count, 0):]
+        while len(taken) < count:
+            taken.insert(0, self.local(region))
+            self.emit(region, f"{taken[0]} = stack.pop()", pc, position)
+        return taken
+
+    def flush(self, region, values, pc, position, indent=2):
+        """
+        Add the code that pushes the values of the local variables into the stack, the values are removed from the region when they are its values
+
+        Args:
+            region (SimpleNamespace): the region being compiled
+            values (list): the expressions of the values
+            pc (int): the position of the current operation
+            position (int): the number of operations of the region before the current operation
+            indent (int): the indentation level of the code
+
+        Returns:
+            None
+        """
+        if len(values) == 1:
+            self.emit(region, f"stack.append({values[0]})", pc, position, indent)
+        elif values:
+            self.emit(region, f"stack.extend(({', '.join(values)}))", pc, position, indent)
+        if values is region.values:
+            values.clear()
+
+    def exit(self, region, pc, position, indent=2):
+        """
+        Add the code that leaves the region before an operation, the operation is executed by the bytecode
+
+        Args:
+            region (SimpleNamespace): the region being compiled
+            pc (int): the position of the operation
+            position (int): the number of operations of the region before the operation
+            indent (int): the indentation level of the code
+
+        Returns:
+            None
+        """
+        self.flush(region, list(region.values), pc, position, indent)
+        self.emit(region, f"executor.steps += steps + {position}", pc, position, indent)
+        self.emit(region, f"return {pc}", pc, position, indent)
+
+class ModuleCache:
+    """
+    Class that represent a cache of the files loaded with IMPORT and INCLUDE
+
+    Attributes:
+        modules (dict): the absolute path of every file mapped to its modification time, its size and its parsed instructions
+        hits (int): the number of loads served by the cache
+        misses (int): the number of loads that parsed the file
+        debugInfo (bool): if True, the instructions keep their source text
+
+    Methods:
+        load(filename, typedLiterals): return the parsed instructions of a file
+        relocate(instructions, offset): return the instructions with the given offset
+        invalidate(filename): remove a file, or all the files, from the cache
+        inspect(): return the content of the cache
+    """
+    def __init__(self, debugInfo=False):
+        """
+        Constructor of the class
+
+        Args:
+            debugInfo (bool): if True, the instructions keep their source text
+
+        Returns:
+            None
+        """
+        self.modules = {}
+        self.hits = 0
+        self.misses = 0
+        self.debugInfo = debugInfo
+
+    def load(self, filename, typedLiterals=False):
+        """
+        Return the parsed instructions of a file, parsing it only if it is not in the cache or if it has changed
+
+        Args:
+            filename (str): the name of the file
+            typedLiterals (bool): if True, the values of the PUSH instructions are parsed into native values
+
+        Returns:
+            list: the instructions of the file, with offset 0
+
+        Note:
+            A file is parsed again when its modification time or its size change.
+            If a line can't be parsed, the file is not cached.
+            The lines that are repeated in the file share the same instruction
+        """
+        path = os.path.abspath(filename)
+        stat = os.stat(path)
+        key = (stat.st_mtime_ns, stat.st_size)
+        module = self.modules.get(path)
+        if module is None or module[0] != key:
+            module = (key, {})
+            self.modules[path] = module
+        if typedLiterals in module[1]:
+            self.hits += 1
+            return module[1][typedLiterals]
+        self.misses += 1
+        instructions = []
+        parsed = {}
+        typed = typedLiterals
+        with open(path, "r") as file:
+            for line in file:
+                instruction = parsed.get((line, typed))
+                if instruction is None:
+                    instruction = Instruction()
+                    instruction.parse(line, 0, typed, self.debugInfo)
+                    parsed[(line, typed)] = instruction
+                if instruction.command == "PRAGMA" and instruction.decoration is not None:
+                    if instruction.decoration.upper() == "TYPED":
+                        typed = True
+                    elif instruction.decoration.upper() == "LEGACY":
+                        typed = False
+                instructions.append(instruction)
+        module[1][typedLiterals] = instructions
+        return instructions
+
+    def relocate(self, instructions, offset):
+        """
+        Return the instructions with the given offset
+
+        Args:
+            instructions (list): the instructions with offset 0
+            offset (int): the offset of the instructions
+
+        Returns:
+            list: the instructions with the given offset
+
+        Note:
+            The offset is used only by GOTO, so the other instructions are shared and not copied
+        """
+        if offset == 0:
+            return instructions
+        relocated = []
+        for instruction in instructions:
+            if instruction.command == "GOTO":
+                instruction = copy.copy(instruction)
+                instruction.offset = offset
+            relocated.append(instruction)
+        return relocated
+
+    def invalidate(self, filename=None):
+        """
+        Remove a file, or all the files, from the cache
+
+        Args:
+            filename (str): the name of the file (default: all the files)
+
+        Returns:
+            None
+        """
+        if filename is None:
+            self.modules = {}
+        else:
+            self.modules.pop(os.path.abspath(filename), None)
+
+    def inspect(self):
+        """
+        Return the content of the cache
+
+        Returns:
+            dict: the absolute path of every file mapped to its modification time (in nanoseconds), its size and its number of instructions
+        """
+        return {path: {"mtime": key[0], "size": key[1], "instructions": max([len(instructions) for instructions in parsed.values()], default=0)} for path, (key, parsed) in self.modules.items()}
+
+class SharedModuleCache(ModuleCache):
+    """
+    Class that represent a cache of the files loaded with IMPORT and INCLUDE, backed by a mapping shared between processes
+
+    Attributes:
+        shared (dict): the path, the modification time, the size and the typedLiterals flag of every parsed file mapped to its instructions,
+            usually a dict of a multiprocessing.Manager
+        sharedHits (int): the number of loads served by the shared mapping
+
+    Methods:
+        load(filename, typedLiterals): return the parsed instructions of a file
+    """
+    def __init__(self, shared):
+        """
+        Constructor of the class
+
+        Args:
+            shared (dict): the mapping shared between processes
+
+        Returns:
+            None
+        """
+        super().__init__()
+        self.shared = shared
+        self.sharedHits = 0
+
+    def load(self, filename, typedLiterals=False):
+        """
+        Return the parsed instructions of a file, looking in the local cache, then in the shared mapping, and parsing it only if it is in neither
+
+        Args:
+            filename (str): the name of the file
+            typedLiterals (bool): if True, the values of the PUSH instructions are parsed into native values
+
+        Returns:
+            list: the instructions of the file, with offset 0
+        """
+        path = os.path.abspath(filename)
+        stat = os.stat(path)
+        key = (stat.st_mtime_ns, stat.st_size)
+        module = self.modules.get(path)
+        if module is None or module[0] != key or typedLiterals not in module[1]:
+            instructions = self.shared.get((path,) + key + (typedLiterals,))
+            if instructions is not None:
+                if module is None or module[0] != key:
+                    module = (key, {})
+                    self.modules[path] = module
+                module[1][typedLiterals] = instructions
+                self.sharedHits += 1
+                return instructions
+        misses = self.misses
+        instructions = super().load(filename, typedLiterals)
+        if self.misses != misses:
+            self.shared[(path,) + key + (typedLiterals,)] = instructions
+        return instructions
+
+defaultModuleCache = ModuleCache()
+
+class Profiler:
+    """
+    Class that represent the profiler of the bytecode, it records the execution of every operation
+
+    Attributes:
+        unit (str): the name of the function being compiled, None for the program
+        indexes (dict): every (function, instruction index) mapped to its count and its time in nanoseconds
+        commands (dict): every command mapped to its count and its time in nanoseconds
+        pairs (dict): every pair of consecutive commands mapped to its count
+        edges (dict): every taken jump (function, source index, destination index) mapped to its count
+        maxStack (int): the maximum size of the stack
+        last (str): the command of the last operation
+
+    Methods:
+        wrap(command, source, handler, control): return a handler that records the execution of an operation
+        fuserProfile(): return the pairs that can be used as the profile of SuperinstructionFuser
+        report(): return the recorded data
+        toJson(): return the recorded data as JSON
+        toText(limit): return the recorded data as a text report
+    """
+
+    jumpCommands = {"GOTO", "JUMP", "BRANCH"}
+
+    def __init__(self):
+        """
+        Constructor of the class
+
+        Returns:
+            None
+        """
+        self.unit = None
+        self.indexes = {}
+        self.commands = {}
+        self.pairs = {}
+        self.edges = {}
+        self.maxStack = 0
+        self.last = None
+
+    def wrap(self, command, source, handler, control):
+        """
+        Return a handler that records the execution of an operation
+
+        Args:
+            command (str): the command of the operation
+            source (int): the index of the last instruction of the operation
+            handler: the handler of the operation
+            control (bool): if the operation is a control operation
+
+        Returns:
+            function: the handler that records the execution and calls the original one
+        """
+        key = (self.unit, source)
+        unit = self.unit
+        jump = control and command in self.jumpCommands
+        def profiled(executor, operand):
+            start = time.perf_counter_ns()
+            try:
+                handler(executor, operand)
+            finally:
+                elapsed = time.perf_counter_ns() - start
+                record = self.indexes.setdefault(key, [0, 0])
+                record[0] += 1
+                record[1] += elapsed
+                record = self.commands.setdefault(command, [0, 0])
+                record[0] += 1
+                record[1] += elapsed
+                pair = (self.last, command)
+                self.pairs[pair] = self.pairs.get(pair, 0) + 1
+                self.last = command
+                if len(executor.stack) > self.maxStack:
+                    self.maxStack = len(executor.stack)
+                if jump and executor.index != source:
+                    edge = (unit, source, executor.index+1)
+                    self.edges[edge] = self.edges.get(edge, 0) + 1
+        return profiled
+
+    def fuserProfile(self):
+        """
+        Return the pairs that have a superinstruction, to be used as the profile of SuperinstructionFuser
+
+        Returns:
+            dict: every pair of commands that has a superinstruction mapped to its count
+
+        Note:
+            The program should be profiled without SuperinstructionFuser, otherwise the fused pairs are not counted
+        """
+        return {pair: count for pair, count in self.pairs.items() if pair in SuperinstructionFuser.superinstructions}
+
+    def report(self):
+        """
+        Return the recorded data
+
+        Returns:
+            dict: the data of the indexes, the commands, the edges and the maximum size of the stack, sorted by time or count
+        """
+        return {
+            "indexes": [{"function": unit, "index": index, "count": count, "time": elapsed} for (unit, index), (count, elapsed) in sorted(self.indexes.items(), key=lambda item: -item[1][1])],
+            "commands": [{"command": command, "count": count, "time": elapsed} for command, (count, elapsed) in sorted(self.commands.items(), key=lambda item: -item[1][1])],
+            "edges": [{"function": unit, "source": source, "destination": destination, "count": count} for (unit, source, destination), count in sorted(self.edges.items(), key=lambda item: -item[1])],
+            "pairs": [{"first": first, "second": second, "count": count} for (first, second), count in sorted(self.pairs.items(), key=lambda item: -item[1]) if first is not None],
+            "maxStack": self.maxStack
+        }
+
+    def toJson(self):
+        """
+        Return the recorded data as JSON
+
+        Returns:
+            str: the JSON of the report
+        """
+        return json.dumps(self.report(), indent=4)
+
+    def toText(self, limit=10):
+        """
+        Return the recorded data as a text report
+
+        Args:
+            limit (int): the maximum number of rows of every table
+
+        Returns:
+            str: the text of the report
+        """
+        report = self.report()
+        lines = [f"max stack: {report['maxStack']}", "", f"{'index':>16} {'count':>12} {'time (ms)':>12}"]
+        for row in report["indexes"][:limit]:
+            name = str(row["index"]) if row["function"] is None else f"{row['function']}:{row['index']}"
+            lines.append(f"{name:>16} {row['count']:>12} {row['time']/1e6:>12.3f}")
+        lines += ["", f"{'command':>16} {'count':>12} {'time (ms)':>12}"]
+        for row in report["commands"][:limit]:
+            lines.append(f"{row['command']:>16} {row['count']:>12} {row['time']/1e6:>12.3f}")
+        lines += ["", f"{'jump':>16} {'count':>12}"]
+        for row in report["edges"][:limit]:
+            name = f"{row['source']} -> {row['destination']}" if row["function"] is None else f"{row['function']}:{row['source']} -> {row['destination']}"
+            lines.append(f"{name:>16} {row['count']:>12}")
+        return "\n".join(lines)
+
+class Debugger:
+    """
+    Class that represent the debugger of an executor, with breakpoints, watches, single-stepping and tracing
+
+    Attributes:
+        breakpoints (dict): every (function, instruction index) mapped to its condition, None if it is unconditional
+        watches (dict): every watched variable mapped to its last value
+        stepping (bool): if True, the execution pauses before every instruction
+        tracing (bool): if True, every executed instruction is recorded in the trace
+        trace (list): the executed instructions, as tuples (function, index, command)
+        events (list): the pauses, as tuples (reason, function, index, command)
+        callback: the function called at every pause with the debugger, the executor and the reason, it returns True to continue
+        skip (tuple): the (function, index) where the execution paused, it doesn't pause there again when it is resumed
+
+    Methods:
+        addBreakpoint(index, condition, function): add a breakpoint
+        removeBreakpoint(index, function): remove a breakpoint
+        addWatch(name): watch a variable
+        removeWatch(name): stop watching a variable
+        step(): pause before every instruction
+        resume(): stop pausing before every instruction
+        hasHooks(): return if the debugger has to check the execution
+        before(executor, index, command): check the execution before an instruction
+        after(executor, index, command): check the watched variables after an instruction
+        pause(executor, function, index, command, reason): pause the execution
+    """
+
+    def __init__(self, callback=None, tracing=False):
+        """
+        Constructor of the class
+
+        Args:
+            callback: the function called at every pause with the debugger, the executor and the reason (default: the execution stops at every pause)
+            tracing (bool): if True, every executed instruction is recorded in the trace
+
+        Returns:
+            None
+        """
+        self.breakpoints = {}
+        self.watches = {}
+        self.stepping = False
+        self.tracing = tracing
+        self.trace = []
+        self.events = []
+        self.callback = callback
+        self.skip = None
+
+    def addBreakpoint(self, index, condition=None, function=None):
+        """
+        Add a breakpoint
+
+        Args:
+            index (int): the index of the instruction
+            condition: a function that receives the top of the stack (UNSET if it is empty), the execution pauses only if it returns True
+            function (str): the name of the function, None for the program
+
+        Returns:
+            None
+        """
+        self.breakpoints[(function, index)] = condition
+
+    def removeBreakpoint(self, index, function=None):
+        """
+        Remove a breakpoint
+
+        Args:
+            index (int): the index of the instruction
+            function (str): the name of the function, None for the program
+
+        Returns:
+            None
+        """
+        self.breakpoints.pop((function, index), None)
+
+    def addWatch(self, name):
+        """
+        Watch a variable, the execution pauses after every instruction that changes it
+
+        Args:
+            name: the name of the variable
+
+        Returns:
+            None
+        """
+        self.watches[name] = UNSET
+
+    def removeWatch(self, name):
+        """
+        Stop watching a variable
+
+        Args:
+            name: the name of the variable
+
+        Returns:
+            None
+        """
+        self.watches.pop(name, None)
+
+    def step(self):
+        """
+        Pause before every instruction
+
+        Returns:
+            None
+        """
+        self.stepping = True
+
+    def resume(self):
+        """
+        Stop pausing before every instruction
+
+        Returns:
+            None
+        """
+        self.stepping = False
+
+    def hasHooks(self):
+        """
+        Return if the debugger has to check the execution
+
+        Returns:
+            bool: True if there are breakpoints or watches, or if it is stepping or tracing
+        """
+        return bool(self.breakpoints or self.watches or self.stepping or self.tracing)
+
+    def before(self, executor, index, command):
+        """
+        Check the execution before an instruction
+
+        Args:
+            executor (Executor): the executor
+            index (int): the index of the instruction
+            command (str): the command of the instruction
+
+        Returns:
+            bool: False if the execution has to stop before the instruction
+        """
+        function = executor.functionName()
+        proceed = True
+        if self.skip == (function, index):
+            self.skip = None
+        elif self.stepping:
+            proceed = self.pause(executor, function, index, command, "step")
+        elif (function, index) in self.breakpoints:
+            condition = self.breakpoints[(function, index)]
+            if condition is None or condition(executor.stack[-1] if executor.stack else UNSET):
+                proceed = self.pause(executor, function, index, command, "breakpoint")
+        if not proceed:
+            self.skip = (function, index)
+        elif self.tracing:
+            self.trace.append((function, index, command))
+        return proceed
+
+    def after(self, executor, index, command):
+        """
+        Check the watched variables after an instruction
+
+        Args:
+            executor (Executor): the executor
+            index (int): the index of the instruction
+            command (str): the command of the instruction
+
+        Returns:
+            bool: False if the execution has to stop after the instruction
+        """
+        proceed = True
+        for name, last in self.watches.items():
+            try:
+                value = executor.loadVariable(name)
+            except KeyError:
+                value = UNSET
+            if value is not last:
+                self.watches[name] = value
+                if last is UNSET or value is UNSET or value != last:
+                    proceed = self.pause(executor, executor.functionName(), index, command, "watch") and proceed
+        return proceed
+
+    def pause(self, executor, function, index, command, reason):
+        """
+        Pause the execution, recording the event and calling the callback
+
+        Args:
+            executor (Executor): the executor
+            function (str): the name of the running function, None for the program
+            index (int): the index of the instruction
+            command (str): the command of the instruction
+            reason (str): "step", "breakpoint" or "watch"
+
+        Returns:
+            bool: True if the execution continues
+        """
+        self.events.append((reason, function, index, command))
+        if self.callback is not None and self.callback(self, executor, reason):
+            return True
+        return False
+
+class Sandbox:
+    """
+    Class that represent the limits of an untrusted program, and the resources it used
+
+    Attributes:
+        instructionBudget (int): the maximum number of steps, None if there is no limit
+        timeout (float): the maximum number of seconds, None if there is no limit
+        maxImportDepth (int): the maximum depth of the IMPORT and INCLUDE commands (the program imports at depth 1), None if there is no limit
+        importPaths (list): the directories of the files that can be imported, None to allow every file
+        allowCompile (bool): if True, the program can write C++ files with COMPILE
+        maxStack (int): the maximum number of values of the stack, None if there is no limit
+        maxVariables (int): the maximum number of variables, None if there is no limit
+        maxStringBytes (int): the maximum memory of the strings of the stack and of the variables, None if there is no limit
+        modules (list): the imported files as tuples (first index, index after the last, depth)
+        imports (int): the number of imported files
+        importDepth (int): the maximum depth of the imported files
+        startSteps (int): the steps of the executor when the sandbox was applied
+        startTime (float): the time.monotonic() value when the sandbox was applied
+
+    Methods:
+        apply(executor): set the limits of the sandbox on an executor
+        checkImport(executor, filename): check that a file can be imported and return its depth
+        checkCompile(executor): check that the program can use COMPILE
+        report(executor): return how much of every limit was used
+    """
+
+    def __init__(self, instructionBudget=None, timeout=None, maxImportDepth=None, importPaths=None, allowCompile=False, maxStack=None, maxVariables=None, maxStringBytes=None):
+        """
+        Constructor of the class
+
+        Args:
+            instructionBudget (int): the maximum number of steps
+            timeout (float): the maximum number of seconds
+            maxImportDepth (int): the maximum depth of the imported files
+            importPaths (list): the directories of the files that can be imported
+            allowCompile (bool): if True, the program can write C++ files with COMPILE
+            maxStack (int): the maximum number of values of the stack
+            maxVariables (int): the maximum number of variables
+            maxStringBytes (int): the maximum memory of the strings of the stack and of the variables, in bytes
+
+        Returns:
+            None
+        """
+        self.instructionBudget = instructionBudget
+        self.timeout = timeout
+        self.maxImportDepth = maxImportDepth
+        self.importPaths = importPaths
+        self.allowCompile = allowCompile
+        self.maxStack = maxStack
+        self.maxVariables = maxVariables
+        self.maxStringBytes = maxStringBytes
+        self.modules = []
+        self.imports = 0
+        self.importDepth = 0
+        self.startSteps = 0
+        self.startTime = time.monotonic()
+
+    def apply(self, executor):
+        """
+        Set the limits of the sandbox on an executor, the budget and the timeout start from now
+
+        Args:
+            executor (Executor): the executor
+
+        Returns:
+            None
+
+        Note:
+            The steps and the clock are checked by the executor at the end of every basic block (at the control operations),
+            so the accounting doesn't slow down the straight sequences of operations. The steps depend only on the program
+            and on the optimization passes, so they are the same in every run
+        """
+        self.modules = []
+        self.imports = 0
+        self.importDepth = 0
+        self.startSteps = executor.steps
+        self.startTime = time.monotonic()
+        executor.instructionBudget = None if self.instructionBudget is None else executor.steps + self.instructionBudget
+        executor.deadline = None if self.timeout is None else self.startTime + self.timeout
+        executor.setMemoryLimits(self.maxStack, self.maxVariables, self.maxStringBytes)
+
+    def checkImport(self, executor, filename):
+        """
+        Check that a file can be imported, the depth of the file is one more than the depth of the file that imports it
+
+        Args:
+            executor (Executor): the executor
+            filename (str): the name of the file
+
+        Returns:
+            int: the depth of the file
+
+        Raises:
+            LimitExceeded: if the file is outside the allowed directories or it is too deep
+        """
+        path = os.path.realpath(filename)
+        if self.importPaths is not None and not any(os.path.commonpath([path, os.path.realpath(directory)]) == os.path.realpath(directory) for directory in self.importPaths):
+            raise LimitExceeded("sandbox", f"the file {filename} is outside the allowed import paths")
+        index = executor.callStack[0][1] if executor.callStack else executor.index
+        depth = 1 + max((depth for first, stop, depth in self.modules if first <= index < stop), default=0)
+        if self.maxImportDepth is not None and depth > self.maxImportDepth:
+            raise LimitExceeded("sandbox", f"import depth of {self.maxImportDepth} exceeded")
+        self.imports += 1
+        self.importDepth = max(self.importDepth, depth)
+        return depth
+
+    def checkCompile(self, executor):
+        """
+        Check that the program can use COMPILE
+
+        Args:
+            executor (Executor): the executor
+
+        Returns:
+            None
+
+        Raises:
+            LimitExceeded: if COMPILE is not allowed
+        """
+        if not self.allowCompile:
+            raise LimitExceeded("sandbox", "COMPILE is not allowed in the sandbox")
+
+    def report(self, executor):
+        """
+        Return how much of every limit was used since the sandbox was applied
+
+        Args:
+            executor (Executor): the executor
+
+        Returns:
+            dict: every limit mapped to the used amount and to the limit, None if there is no limit
+
+        Note:
+            The steps can exceed the budget by the operations of the last basic block, the stack, the variables and the strings are measured now
+        """
+        return {
+            "instructions": {"used": executor.steps - self.startSteps, "limit": self.instructionBudget},
+            "time": {"used": time.monotonic() - self.startTime, "limit": self.timeout},
+            "importDepth": {"used": self.importDepth, "limit": self.maxImportDepth},
+            "imports": {"used": self.imports, "limit": None},
+            "stack": {"used": len(executor.stack), "limit": self.maxStack},
+            "variables": {"used": executor.countVariables(), "limit": self.maxVariables},
+            "stringBytes": {"used": executor.stringBytes(), "limit": self.maxStringBytes}
+        }
+
+class Executor:
+    """
+    Class that represent the executor of the instructions
+
+    Attributes:
+        io (IOOperator): the IO operator of the executor
+        variables (dict): the dictionary of the variables of the executor that don't have a slot
+        slots (list): the values of the variables that have a slot
+        slotNames (dict): the names of the variables that have a slot, mapped to their slot
+        slotKeys (list): the names of the variables, in the order of their slots
+        stack (list): the stack of the executor
+        instructions (list): the list of the instructions of the executor
+        functions (dict): the functions of the executor
+        index (int): the index of the executor, representing the current instruction
+        terminated (bool): the boolean value representing if the executor is terminated
+        instructionsDict (dict): the dictionary of the instructions objects of the executor
+        internalDict (dict): the dictionary of the internal operations, that can't be written in a program
+        useBytecode (bool): the boolean value representing if the instructions are executed as bytecode
+        typedLiterals (bool): the boolean value representing if the values of the PUSH instructions are parsed into native values
+        passes (list): the passes that optimize the operations before they are compiled
+        bytecode (list): the compiled instructions, as tuples (opcode, handler, operand, source index, control)
+        entries (list): for every instruction, the position in the bytecode where its execution starts
+        frameEntries (list): the entries of the running function, or of the program
+        callStack (list): the return stack, as tuples (entries, index) of the callers
+        compiledFunctions (dict): the name of every compiled function mapped to its instructions and its entries
+        moduleCache (ModuleCache): the cache of the files loaded with IMPORT and INCLUDE
+        steps (int): the number of bytecode operations (or instructions, without bytecode) executed
+        instructionBudget (int): the maximum number of steps, None if there is no limit
+        deadline (float): the time.monotonic() value after which the execution stops, None if there is no limit
+        profiler (Profiler): the profiler of the bytecode, None if the profiling is disabled
+        checkpointFile (str): the snapshot file of the periodic checkpoints, None if they are disabled
+        checkpointInterval (int): the number of steps between two checkpoints
+        nextCheckpoint (int): the number of steps of the next checkpoint
+        programImage (tuple): the packed instructions and functions of the last snapshot, reused while they don't change
+        parsedLines (dict): every line added with addInstruction, its offset and the typedLiterals flag mapped to its parsed instruction, shared by the repeated lines
+        debugInfo (bool): if True, the added instructions keep their source text
+        nativeCompiler (NativeCompiler): the backend of COMPILE with native values, None to use always the Element values
+        nativeBuild (bool): if True, COMPILE builds also the binary of the program when a C++ compiler is installed
+        debugger (Debugger): the debugger of the executor, None if it is not attached
+        jit (PythonJit): the JIT that compiles the hot regions of the bytecode into Python functions, None if it is disabled
+        sandbox (Sandbox): the sandbox that checks the imports and COMPILE, None if the program is trusted
+        maxStack (int): the maximum number of values of the stack, None if there is no limit
+        maxVariables (int): the maximum number of assigned variables, None if there is no limit
+        maxStringBytes (int): the maximum memory of the strings of the stack and of the variables, in bytes, None if there is no limit
+        nextMemoryScan (int): the number of steps of the next measure of the memory of the strings
+        compactStack (bool): if True, the stack is a NumericStack instead of a list
+        verified (bool): True if the verifier proved that the program can't pop an empty stack, so the bytecode uses the fast handlers
+
+    Static Attributes:
+        opcodes (dict): dictionary that maps every command and internal operation to its opcode
+        controlCommands (set): the commands that read or change the index, or change the program itself
+
+    Methods:
+        addInstruction(instruction, offset, parsedLines): add an instruction to the executor
+        addInstructions(lines, offset): add a block of instructions to the executor
+        loadModule(filename, offset): add the instructions of a file to the executor
+        loadProgram(filename): add the instructions of a program file, using its compiled bytecode file when it is up to date
+        writeBytecodeFile(filename, key): write the compiled program into a bytecode file
+        readBytecodeFile(filename, key): load the compiled program from a bytecode file
+        packInstructions(instructions): return the instructions as tuples that can be marshalled
+        unpackInstructions(data): return the instructions from the packed tuples
+        saveSnapshot(filename, index): save the state of the executor into a snapshot file
+        loadSnapshot(filename): load the state of the executor from a snapshot file
+        slotFor(name): return the slot of a variable, creating it if needed
+        loadVariable(name): return the value of a variable
+        storeVariable(name, value): set the value of a variable
+        getVariables(): return all the variables of the executor
+        countVariables(): return the number of assigned variables
+        executeInstruction(): execute the current instruction of the executor
+        decodeInstruction(index, instructions): return the unoptimized operation of an instruction
+        bindHandler(command, source, control): return the handler of a command
+        compileOperation(operation): compile an operation into bytecode
+        compileUnit(instructions, start, stop): compile a sequence of instructions into bytecode
+        compileBytecode(): compile the instructions that are not compiled yet
+        compileFunction(instructions, name): compile the instructions of a function into bytecode
+        callFunction(name): start the execution of a function
+        returnFunction(): return from the running function
+        unwind(): return to the program from all the running functions
+        hasLimits(): return True if the execution has a limit or saves the periodic checkpoints
+        checkLimits(resume): raise an exception if the execution exceeds its limits, and save the periodic checkpoint
+        setMemoryLimits(maxStack, maxVariables, maxStringBytes): set the limits of the memory of the execution
+        stringBytes(): return the memory of the strings of the stack and of the variables
+        useCompactStack(enabled): use a NumericStack or a list as the stack
+        enableCheckpoints(filename, interval): save a snapshot every interval steps
+        disableCheckpoints(): stop saving the periodic snapshots
+        functionName(): return the name of the running function
+        attachDebugger(debugger): attach a debugger to the executor
+        detachDebugger(): detach the debugger from the executor
+        executeDebug(): execute the instructions checking the hooks of the debugger
+        enableProfiling(profiler): start recording the execution of the bytecode
+        disableProfiling(): stop recording the execution of the bytecode
+        verify(verifier): verify that the program can't pop an empty stack, and use the fast handlers if it can't
+        eliminateDeadCode(graph): remove the instructions that can't be executed
+        enableJit(jit): start compiling the hot regions of the bytecode into Python functions
+        disableJit(): stop running the compiled regions of the bytecode
+        enableSandbox(sandbox): run the program in a sandbox
+        disableSandbox(): stop checking the imports and COMPILE
+        optimizationReport(): return the statistics of the optimization passes
+        execute(): execute all the instructions of the executor
+        executeAsync(quantum, quota): execute all the instructions of the executor, giving the control to the event loop every quantum steps
+        resetIndex(): reset the index of the executor
+        reset(): reset the executor
+    """
+
+    opcodes = {command: opcode for opcode, command in enumerate([
+        "PUSH", "POP", "PRINT", "ADD", "SUB", "MUL", "DIV", "SWAP", "DUP", "CLEAR", "MOD", "MIN", "MAX",
+        "EQUAL", "GREATER", "LESS", "NOT", "AND", "OR", "GOTO", "NUM", "INPUT", "INT", "FLOAT", "STRING",
+        "COMMENT", "STORE", "LOAD", "IMPORT", "END", "DEFINE", "COMPILE", "INCLUDE", "INSTR", "PRAGMA", "FUNCTION",
+        "JUMP", "BRANCH", "PUSH_PUSH", "PUSH_ADD", "PUSH_SUB", "PUSH_MUL", "PUSH_GREATER", "PUSH_LESS", "PUSH_EQUAL",
+        "PUSH_LOAD", "PUSH_STORE", "LOAD_ADD", "DUP_STORE", "LOAD_SLOT", "STORE_SLOT", "RET"
+    ])}
+
+    controlCommands = {"GOTO", "IMPORT", "END", "DEFINE", "COMPILE", "INCLUDE", "FUNCTION", "JUMP", "BRANCH", "RET"}
+
+    bytecodeMagic = b"NALMC"
+
+    bytecodeVersion = 1
+
+    snapshotMagic = b"NALMS"
+
+    snapshotVersion = 1
+
+    def __init__(self, io, useBytecode=True, typedLiterals=False, passes=None, moduleCache=None):
+        """
+        Constructor of the class
+
+        Args:
+            io (IOOperator): the IO operator of the executor
+            useBytecode (bool): if False, the instructions are executed one by one with Instruction.execute
+            typedLiterals (bool): if True, the values of the PUSH instructions are parsed into int, float or quoted strings (it can be changed with PRAGMA TYPED and PRAGMA LEGACY)
+            passes (list): the passes that optimize the operations before they are compiled, an empty list disables the optimizations (default: PeepholeOptimizer, JumpResolver, SlotResolver and SuperinstructionFuser)
+            moduleCache (ModuleCache): the cache of the files loaded with IMPORT and INCLUDE (default: the cache shared by all the executors)
+
+        Returns:
+            None
+        """
+        self.io = io
+        self.variables = {}
+        self.slots = []
+        self.slotNames = {}
+        self.slotKeys = []
+        self.stack = []
+        self.instructions = []
+        self.functions = {}
+        self.index = 0
+        self.terminated = False
+        self.useBytecode = useBytecode
+        self.typedLiterals = typedLiterals
+        self.passes = [PeepholeOptimizer(), JumpResolver(), SlotResolver(), SuperinstructionFuser()] if passes is None else passes
+        self.bytecode = []
+        self.entries = []
+        self.frameEntries = self.entries
+        self.callStack = []
+        self.compiledFunctions = {}
+        self.definedFunctions = 0
+        self.moduleCache = moduleCache if moduleCache is not None else defaultModuleCache
+        self.steps = 0
+        self.instructionBudget = None
+        self.deadline = None
+        self.profiler = None
+        self.debugger = None
+        self.jit = None
+        self.sandbox = None
+        self.verified = False
+        self.maxStack = None
+        self.maxVariables = None
+        self.maxStringBytes = None
+        self.nextMemoryScan = 0
+        self.compactStack = False
+        self.checkpointFile = None
+        self.checkpointInterval = None
+        self.nextCheckpoint = 0
+        self.programImage = None
+        self.parsedLines = {}
+        self.debugInfo = False
+        self.nativeCompiler = NativeCompiler()
+        self.nativeBuild = False
+        self.instructionsDict = {
+            "PUSH": push(),
+            "POP": pop(),
+            "PRINT": print_(),
+            "ADD": add(),
+            "SUB": sub(),
+            "MUL": mul(),
+            "DIV": div(),
+            "SWAP": swap(),
+            "DUP": dup(),
+            "CLEAR": clear(),
+            "MOD": mod(),
+            "MIN": min_(),
+            "MAX": max_(),
+            "EQUAL": equal(),
+            "GREATER": greater(),
+            "LESS": less(),
+            "NOT": not_(),
+            "AND": and_(),
+            "OR": or_(),
+            "GOTO": goto(),
+            "NUM": num(),
+            "INPUT": input_(),
+            "INT": int_(),
+            "FLOAT": float_(),
+            "STRING": string(),
+            "COMMENT": comment(),
+            "STORE": store(),
+            "LOAD": load(),
+            "IMPORT": import_(),
+            "END": end(),
+            "DEFINE": define(),
+            "COMPILE": compile(),
+            "INCLUDE": include(),
+            "INSTR": instr(),
+            "PRAGMA": pragma()
+        }
+        self.internalDict = {
+            "FUNCTION": function(),
+            "JUMP": jump(),
+            "BRANCH": branch(),
+            "PUSH_PUSH": pushPush(),
+            "PUSH_ADD": pushAdd(),
+            "PUSH_SUB": pushSub(),
+            "PUSH_MUL": pushMul(),
+            "PUSH_GREATER": pushGreater(),
+            "PUSH_LESS": pushLess(),
+            "PUSH_EQUAL": pushEqual(),
+            "PUSH_LOAD": pushLoad(),
+            "PUSH_STORE": pushStore(),
+            "LOAD_ADD": loadAdd(),
+            "DUP_STORE": dupStore(),
+            "LOAD_SLOT": loadSlot(),
+            "STORE_SLOT": storeSlot(),
+            "RET": ret()
+        }
+    
+    def addInstruction(self, instruction, offset=0, parsedLines=None):
+        """
+        Add an instruction to the executor
+
+        Args:
+            instruction (str): the instruction to add
+            offset (int): the offset of the instruction
+            parsedLines (dict): the parsed lines to reuse (default: the parsedLines of the executor)
+
+        Returns:
+            None
+
+        Note:
+            The PRAGMA TYPED and PRAGMA LEGACY instructions change the parsing of the following PUSH instructions.
+            A verified program loses its verification, and it is compiled again with the usual handlers.
+            A line that was already added is not parsed again, the same instruction is shared
+        """
+        if self.verified:
+            self.verified = False
+            self.bytecode = []
+            self.entries = []
+        parsedLines = self.parsedLines if parsedLines is None else parsedLines
+        key = (instruction, offset, self.typedLiterals)
+        instr = parsedLines.get(key)
+        if instr is None:
+            instr = Instruction()
+            instr.parse(instruction, offset, self.typedLiterals, self.debugInfo)
+            parsedLines[key] = instr
+        if instr.command == "PRAGMA" and instr.decoration is not None:
+            if instr.decoration.upper() == "TYPED":
+                self.typedLiterals = True
+            elif instr.decoration.upper() == "LEGACY":
+                self.typedLiterals = False
+        self.instructions.append(instr)
+
+    def addInstructions(self, lines, offset=0):
+        """
+        Add a block of instructions to the executor, the empty lines are skipped
+
+        Args:
+            lines (list): the instructions to add
+            offset (int): the offset of the instructions
+
+        Returns:
+            int: the number of added instructions
+
+        Note:
+            The block is compiled as one unit by the next execution, so the optimization passes work across its lines
+            and its GOTO instructions can jump forward inside it
+        """
+        added = 0
+        for line in lines:
+            if line.strip():
+                self.addInstruction(line, offset)
+                added += 1
+        return added
+    
+    def loadModule(self, filename, offset):
+        """
+        Add the instructions of a file to the executor
+
+        Args:
+            filename (str): the name of the file
+            offset (int): the offset of the instructions
+
+        Returns:
+            int: the number of instructions added
+
+        Raises:
+            LimitExceeded: if the sandbox doesn't allow the file
+
+        Note:
+            The file is parsed only the first time, then its instructions are taken from the module cache.
+            A PRAGMA in the file doesn't change the parsing of the instructions after it is loaded
+        """
+        depth = self.sandbox.checkImport(self, filename) if self.sandbox is not None else None
+        instructions = self.moduleCache.load(filename, self.typedLiterals)
+        self.instructions.extend(self.moduleCache.relocate(instructions, offset))
+        if depth is not None:
+            self.sandbox.modules.append((offset, offset+len(instructions), depth))
+        return len(instructions)
+
+    def loadProgram(self, filename):
+        """
+        Add the instructions of a program file, using its compiled bytecode file (.nalmc) when it is up to date
+
+        Args:
+            filename (str): the name of the program file
+
+        Returns:
+            None
+
+        Note:
+            The bytecode file is placed next to the program file and it is used only if the executor is empty,
+            the program file has the same modification time and size, and the executor has the same optimization passes.
+            Otherwise the program is parsed and compiled, and the bytecode file is written again.
+            The bytecode file is not used when a debugger is attached
+        """
+        path = os.path.abspath(filename)
+        stat = os.stat(path)
+        key = (stat.st_mtime_ns, stat.st_size, self.typedLiterals, tuple(type(optimizer).__name__ for optimizer in self.passes))
+        compiledPath = os.path.splitext(path)[0] + ".nalmc"
+        empty = not self.instructions and not self.bytecode and not self.slotKeys and self.debugger is None
+        if empty and self.useBytecode and self.readBytecodeFile(compiledPath, key):
+            return
+        parsedLines = {}
+        with open(path, "r") as file:
+            for line in file:
+                self.addInstruction(line, 0, parsedLines)
+        if empty and self.useBytecode:
+            self.compileBytecode()
+            self.writeBytecodeFile(compiledPath, key)
+
+    def writeBytecodeFile(self, filename, key):
+        """
+        Write the compiled program into a bytecode file
+
+        Args:
+            filename (str): the name of the bytecode file
+            key (tuple): the modification time and the size of the program file, the typedLiterals flag and the names of the passes
+
+        Returns:
+            bool: True if the file is written
+
+        Note:
+            The file starts with the magic bytes, followed by the marshalled version, key, instructions, bytecode, entries and slots.
+            The errors are ignored, like for the .pyc files of Python
+        """
+        bytecode = [(opcode, operand, source, control) for opcode, handler, operand, source, control in self.bytecode]
+        try:
+            data = marshal.dumps((self.bytecodeVersion, key, self.typedLiterals, self.packInstructions(self.instructions), bytecode, self.entries, self.slotKeys))
+            temporary = f"{filename}.{os.getpid()}.tmp"
+            with open(temporary, "wb") as file:
+                file.write(self.bytecodeMagic + data)
+            os.replace(temporary, filename)
+        except (OSError, ValueError):
+            return False
+        return True
+
+    def readBytecodeFile(self, filename, key):
+        """
+        Load the compiled program from a bytecode file
+
+        Args:
+            filename (str): the name of the bytecode file
+            key (tuple): the modification time and the size of the program file, the typedLiterals flag and the names of the passes
+
+        Returns:
+            bool: True if the program is loaded, False if the file is missing, invalid or out of date
+        """
+        try:
+            with open(filename, "rb") as file:
+                data = file.read()
+            if not data.startswith(self.bytecodeMagic):
+                return False
+            version, fileKey, typedLiterals, instructions, bytecode, entries, slotKeys = marshal.loads(data[len(self.bytecodeMagic):])
+        except (OSError, ValueError, EOFError, TypeError):
+            return False
+        if version != self.bytecodeVersion or fileKey != key:
+            return False
+        commands = {opcode: command for command, opcode in self.opcodes.items()}
+        self.instructions.extend(self.unpackInstructions(instructions))
+        for name in slotKeys:
+            self.slotFor(name)
+        for opcode, operand, source, control in bytecode:
+            self.bytecode.append((opcode, self.bindHandler(commands[opcode], source, control), operand, source, control))
+        self.entries.extend(entries)
+        self.typedLiterals = typedLiterals
+        return True
+
+    def packInstructions(self, instructions):
+        """
+        Return the instructions as tuples that can be marshalled
+
+        Args:
+            instructions (list): the instructions
+
+        Returns:
+            list: the string, the command, the value, the decoration and the offset of every instruction
+        """
+        return [(instruction.string, instruction.command, instruction.value, instruction.decoration, instruction.offset) for instruction in instructions]
+
+    def unpackInstructions(self, data):
+        """
+        Return the instructions from the tuples of packInstructions, without parsing them
+
+        Args:
+            data (list): the tuples of the instructions
+
+        Returns:
+            list: the instructions
+        """
+        instructions = []
+        for string, command, value, decoration, offset in data:
+            instruction = Instruction()
+            instruction.string, instruction.command, instruction.value, instruction.decoration, instruction.offset = string, command, value, decoration, offset
+            instructions.append(instruction)
+        return instructions
+
+    def saveSnapshot(self, filename, index=None):
+        """
+        Save the state of the executor into a snapshot file
+
+        Args:
+            filename (str): the name of the snapshot file
+            index (int): the index where the execution resumes (default: the current index)
+
+        Returns:
+            None
+
+        Note:
+            The snapshot contains the stack, the variables, the instructions, the functions, the index and the running functions.
+            The bytecode is not saved, it is compiled again when the snapshot is loaded. The instructions and the functions are packed
+            only when they change, so the periodic checkpoints of a long execution save only the stack and the variables again.
+            The file is written to a temporary file and then renamed, so an interrupted checkpoint doesn't break the previous one
+        """
+        image = self.programImage
+        if image is None or image[0] is not self.instructions or image[1] != len(self.instructions) or len(image[2]) != len(self.functions) or any(self.functions.get(name) is not body for name, body in image[2]):
+            program = marshal.dumps((self.packInstructions(self.instructions), {name: self.packInstructions(body) for name, body in self.functions.items()}))
+            self.programImage = (self.instructions, len(self.instructions), tuple(self.functions.items()), program)
+        frames = [(self.functionName(entries), frameIndex) for entries, frameIndex in self.callStack]
+        state = (list(self.stack), self.getVariables(), self.functionName(), self.index if index is None else index, frames, self.terminated, self.typedLiterals, self.steps)
+        temporary = f"{filename}.{os.getpid()}.tmp"
+        with open(temporary, "wb") as file:
+            file.write(self.snapshotMagic + marshal.dumps((self.snapshotVersion, self.programImage[3], state)))
+        os.replace(temporary, filename)
+
+    def loadSnapshot(self, filename):
+        """
+        Load the state of the executor from a snapshot file, the executor is resetted before
+
+        Args:
+            filename (str): the name of the snapshot file
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: if the file is not a snapshot or it has another version
+        """
+        with open(filename, "rb") as file:
+            data = file.read()
+        if not data.startswith(self.snapshotMagic):
+            raise ValueError(f"{filename} is not a NALM snapshot")
+        version, program, state = marshal.loads(data[len(self.snapshotMagic):])
+        if version != self.snapshotVersion:
+            raise ValueError(f"{filename} has the snapshot version {version}, expected {self.snapshotVersion}")
+        instructions, functions = marshal.loads(program)
+        stack, variables, function, index, frames, terminated, typedLiterals, steps = state
+        self.reset()
+        self.instructions = self.unpackInstructions(instructions)
+        self.functions = {name: self.unpackInstructions(body) for name, body in functions.items()}
+        self.variables = dict(variables)
+        self.stack = NumericStack(stack) if self.compactStack else list(stack)
+        self.terminated = terminated
+        self.typedLiterals = typedLiterals
+        self.steps = steps
+        if self.useBytecode:
+            self.compileBytecode()
+            for name in [name for name, frameIndex in frames[1:]] + ([function] if frames else []):
+                if name not in self.compiledFunctions:
+                    self.compiledFunctions[name] = (self.functions[name], self.compileFunction(self.functions[name], name))
+            self.callStack = [(self.entries if name is None else self.compiledFunctions[name][1], frameIndex) for name, frameIndex in frames]
+            self.frameEntries = self.entries if function is None else self.compiledFunctions[function][1]
+        self.programImage = (self.instructions, len(self.instructions), tuple(self.functions.items()), program)
+        self.index = index
+
+    def slotFor(self, name):
+        """
+        Return the slot of a variable, creating it if needed
+
+        Args:
+            name: the name of the variable
+
+        Returns:
+            int: the slot of the variable
+
+        Note:
+            If the variable already has a value in the dictionary, the value is moved into the slot
+        """
+        if name not in self.slotNames:
+            self.slotNames[name] = len(self.slots)
+            self.slotKeys.append(name)
+            self.slots.append(self.variables.pop(name, UNSET))
+        return self.slotNames[name]
+
+    def loadVariable(self, name):
+        """
+        Return the value of a variable
+
+        Args:
+            name: the name of the variable
+
+        Returns:
+            the value of the variable
+
+        Raises:
+            KeyError: if the variable is not defined
+        """
+        slot = self.slotNames.get(name)
+        if slot is None:
+            return self.variables[name]
+        if self.slots[slot] is UNSET:
+            raise KeyError(name)
+        return self.slots[slot]
+
+    def storeVariable(self, name, value):
+        """
+        Set the value of a variable
+
+        Args:
+            name: the name of the variable
+            value: the value of the variable
+
+        Returns:
+            None
+        """
+        slot = self.slotNames.get(name)
+        if slot is None:
+            self.variables[name] = value
+        else:
+            self.slots[slot] = value
+
+    def getVariables(self):
+        """
+        Return all the variables of the executor
+
+        Returns:
+            dict: the names of the defined variables mapped to their values
+        """
+        variables = dict(self.variables)
+        for name, value in zip(self.slotKeys, self.slots):
+            if value is not UNSET:
+                variables[name] = value
+        return variables
+
+    def countVariables(self):
+        """
+        Return the number of assigned variables
+
+        Returns:
+            int: the number of variables with a value
+
+        Note:
+            The slots are created when the bytecode is compiled, so the slots of the variables that are never stored are not counted
+        """
+        return len(self.variables) + sum(1 for value in self.slots if value is not UNSET)
+
+    def executeInstruction(self):
+        """
+        Execute the current instruction of the executor
+
+        Returns:
+            None
+        """
+        instruction = self.instructions[self.index]
+        instruction.execute(self)
+
+    def decodeInstruction(self, index, instructions=None):
+        """
+        Return the unoptimized operation of an instruction
+
+        Args:
+            index (int): the index of the instruction
+            instructions (list): the instructions of the program or of a function (default: the instructions of the executor)
+
+        Returns:
+            Operation: the operation of the instruction
+        """
+        instruction = (self.instructions if instructions is None else instructions)[index]
+        command = instruction.command
+        if command in self.functions or command not in self.instructionsDict:
+            return Operation("FUNCTION", command, index)
+        if command == "PUSH":
+            return Operation(command, instruction.value, index)
+        if command == "GOTO":
+            return Operation(command, instruction.offset, index)
+        if command == "INSTR":
+            return Operation(command, index, index)
+        return Operation(command, None, index)
+
+    def bindHandler(self, command, source, control):
+        """
+        Return the handler of a command, the fast one if the program is verified, wrapped by the profiler if the profiling is enabled
+
+        Args:
+            command (str): the command or the internal operation
+            source (int): the index of the last instruction of the operation
+            control (bool): if the operation is a control operation
+
+        Returns:
+            the handler, to be called with the executor and the operand
+        """
+        handler = self.instructionsDict[command] if command in self.instructionsDict else self.internalDict[command]
+        call = handler.fast if self.verified and hasattr(handler, "fast") else handler.__call__
+        if self.profiler is not None:
+            return self.profiler.wrap(command, source, call, control)
+        return call
+
+    def compileOperation(self, operation):
+        """
+        Compile an operation into bytecode
+
+        Args:
+            operation (Operation): the operation to compile
+
+        Returns:
+            tuple: the opcode, the bound handler, the operand, the index of the last instruction of the operation and the control flag
+        """
+        command = operation.command
+        source = operation.source+operation.length-1
+        control = command in self.controlCommands
+        return (self.opcodes[command], self.bindHandler(command, source, control), operation.operand, source, control)
+
+    def compileUnit(self, instructions, start, stop):
+        """
+        Compile a sequence of instructions into bytecode, running the optimization passes on it
+
+        Args:
+            instructions (list): the instructions of the program or of a function
+            start (int): the index of the first instruction
+            stop (int): the index after the last instruction
+
+        Returns:
+            list: the entries of the instructions
+
+        Note:
+            The instructions inside an optimized operation (between its guard and its end) can't be entered by a jump,
+            so their entries point to an unoptimized copy of them, placed after the unit and followed by a jump back.
+            The operations without a command don't produce any bytecode
+        """
+        operations = [self.decodeInstruction(index, instructions) for index in range(start, stop)]
+        for optimizer in (self.passes if self.debugger is None else []):
+            operations = optimizer(self, operations)
+        code = self.bytecode
+        entries = [None] * (stop-start)
+        ranges = []
+        for operation in operations:
+            if entries[operation.source-start] is None:
+                entries[operation.source-start] = len(code)
+            if operation.source+operation.length-operation.guard > 1:
+                ranges.append([operation.guard, operation.source+operation.length])
+            if operation.command is not None:
+                code.append(self.compileOperation(operation))
+        following = len(code)
+        for position in range(len(entries)-1, -1, -1):
+            if entries[position] is None:
+                entries[position] = following
+            following = entries[position]
+        if ranges:
+            code.append(self.compileOperation(Operation("JUMP", stop, stop-1)))
+            ranges.sort()
+            merged = [ranges[0]]
+            for guard, end in ranges[1:]:
+                if guard < merged[-1][1]:
+                    merged[-1][1] = max(merged[-1][1], end)
+                else:
+                    merged.append([guard, end])
+            for guard, end in merged:
+                for index in range(guard+1, end):
+                    entries[index-start] = len(code)
+                    code.append(self.compileOperation(self.decodeInstruction(index, instructions)))
+                code.append(self.compileOperation(Operation("JUMP", end, end-1)))
+        return entries
+
+    def compileBytecode(self):
+        """
+        Compile the instructions that are not compiled yet
+
+        Returns:
+            list: the bytecode of the executor
+
+        Note:
+            The whole program is compiled again when a function shadows one of the commands, otherwise only the new instructions are compiled.
+            While a function is running, the program is not compiled again
+        """
+        if self.callStack:
+            return self.bytecode
+        if len(self.functions) != self.definedFunctions:
+            self.definedFunctions = len(self.functions)
+            if not self.instructionsDict.keys().isdisjoint(self.functions):
+                self.bytecode = []
+                self.entries = []
+        if len(self.entries) > len(self.instructions):
+            self.bytecode = []
+            self.entries = []
+        if not self.bytecode:
+            self.compiledFunctions = {}
+        if len(self.entries) < len(self.instructions):
+            self.entries.extend(self.compileUnit(self.instructions, len(self.entries), len(self.instructions)))
+        self.frameEntries = self.entries
+        return self.bytecode
+
+    def compileFunction(self, instructions, name=None):
+        """
+        Compile the instructions of a function into bytecode
+
+        Args:
+            instructions (list): the instructions of the function
+            name (str): the name of the function, used by the profiler
+
+        Returns:
+            list: the entries of the instructions, the last one is the return from the function
+
+        Note:
+            The bytecode of the function is placed after a jump, so the program never runs into it.
+            The GOTO targets of a function are relative to its first instruction
+        """
+        self.bytecode.append(self.compileOperation(Operation("JUMP", len(self.entries), len(self.entries)-1)))
+        if self.profiler is not None:
+            self.profiler.unit = name
+        entries = self.compileUnit(instructions, 0, len(instructions))
+        entries.append(len(self.bytecode))
+        self.bytecode.append(self.compileOperation(Operation("RET", None, len(instructions))))
+        if self.profiler is not None:
+            self.profiler.unit = None
+        return entries
+
+    def callFunction(self, name):
+        """
+        Start the execution of a function, compiling it the first time it is called
+
+        Args:
+            name (str): the name of the function
+
+        Returns:
+            None
+        """
+        instructions = self.functions[name]
+        if name not in self.compiledFunctions or self.compiledFunctions[name][0] is not instructions:
+            self.compiledFunctions[name] = (instructions, self.compileFunction(instructions, name))
+        self.callStack.append((self.frameEntries, self.index))
+        self.frameEntries = self.compiledFunctions[name][1]
+        self.index = -1
+
+    def returnFunction(self):
+        """
+        Return from the running function
+
+        Returns:
+            None
+        """
+        self.frameEntries, self.index = self.callStack.pop()
+
+    def unwind(self):
+        """
+        Return to the program from all the running functions, the index becomes the one of the first call
+
+        Returns:
+            None
+        """
+        if self.callStack:
+            self.index = self.callStack[0][1]
+            self.callStack = []
+            self.frameEntries = self.entries
+
+    def hasLimits(self):
+        """
+        Return True if the execution has a limit or saves the periodic checkpoints, so checkLimits must be called
+
+        Returns:
+            bool: True if checkLimits must be called
+        """
+        return self.instructionBudget is not None or self.deadline is not None or self.checkpointFile is not None \
+            or self.maxStack is not None or self.maxVariables is not None or self.maxStringBytes is not None
+
+    def checkLimits(self, resume):
+        """
+        Raise an exception if the execution exceeds the instruction budget, the deadline or the limits of the memory, and save the periodic checkpoint
+
+        Args:
+            resume (int): the index where the execution resumes, saved in the checkpoint
+
+        Returns:
+            None
+
+        Raises:
+            LimitExceeded: if a limit is exceeded
+
+        Note:
+            The strings are measured again only after as many steps as the values that were measured,
+            so the cost of the measure is spread over the steps
+        """
+        if self.checkpointFile is not None and self.steps >= self.nextCheckpoint:
+            self.nextCheckpoint = self.steps + self.checkpointInterval
+            self.saveSnapshot(self.checkpointFile, resume)
+        if self.instructionBudget is not None and self.steps > self.instructionBudget:
+            raise LimitExceeded("budget", f"instruction budget of {self.instructionBudget} exceeded")
+        if self.deadline is not None and time.monotonic() > self.deadline:
+            raise LimitExceeded("timeout", "deadline exceeded")
+        if self.maxStack is not None and len(self.stack) > self.maxStack:
+            raise LimitExceeded("memory", f"stack size of {self.maxStack} values exceeded")
+        if self.maxVariables is not None and self.countVariables() > self.maxVariables:
+            raise LimitExceeded("memory", f"limit of {self.maxVariables} variables exceeded")
+        if self.maxStringBytes is not None and self.steps >= self.nextMemoryScan:
+            self.nextMemoryScan = self.steps + len(self.stack) + self.countVariables()
+            if self.stringBytes() > self.maxStringBytes:
+                raise LimitExceeded("memory", f"limit of {self.maxStringBytes} bytes of strings exceeded")
+
+    def setMemoryLimits(self, maxStack=None, maxVariables=None, maxStringBytes=None):
+        """
+        Set the limits of the memory of the execution, they are checked with the other limits at the control operations
+
+        Args:
+            maxStack (int): the maximum number of values of the stack
+            maxVariables (int): the maximum number of assigned variables
+            maxStringBytes (int): the maximum memory of the strings of the stack and of the variables, in bytes
+
+        Returns:
+            None
+
+        Note:
+            A straight sequence of operations can exceed a limit before it is detected, but only by the values it pushes
+        """
+        self.maxStack = maxStack
+        self.maxVariables = maxVariables
+        self.maxStringBytes = maxStringBytes
+        self.nextMemoryScan = self.steps
+
+    def stringBytes(self):
+        """
+        Return the memory of the strings of the stack and of the variables, names included
+
+        Returns:
+            int: the number of bytes, measured with sys.getsizeof
+        """
+        size = sum(sys.getsizeof(value) for value in self.stack if type(value) is str)
+        size += sum(sys.getsizeof(value) for value in self.slots if type(value) is str)
+        for name, value in self.variables.items():
+            size += (sys.getsizeof(name) if type(name) is str else 0) + (sys.getsizeof(value) if type(value) is str else 0)
+        return size
+
+    def useCompactStack(self, enabled=True):
+        """
+        Use a NumericStack or a list as the stack, the values of the stack are kept
+
+        Args:
+            enabled (bool): if True the stack becomes a NumericStack, otherwise a list
+
+        Returns:
+            None
+
+        Raises:
+            TypeError: if the stack has a value that is not an integer or a boolean
+        """
+        self.stack = NumericStack(self.stack) if enabled else list(self.stack)
+        self.compactStack = enabled
+
+    def enableCheckpoints(self, filename, interval):
+        """
+        Save a snapshot every interval steps, the snapshots are saved only at the control operations
+
+        Args:
+            filename (str): the snapshot file
+            interval (int): the number of steps between two snapshots
+
+        Returns:
+            None
+        """
+        self.checkpointFile = filename
+        self.checkpointInterval = interval
+        self.nextCheckpoint = self.steps + interval
+
+    def disableCheckpoints(self):
+        """
+        Stop saving the periodic snapshots
+
+        Returns:
+            None
+        """
+        self.checkpointFile = None
+        self.checkpointInterval = None
+
+    def functionName(self, entries=None):
+        """
+        Return the name of the running function, or of the function of a frame
+
+        Args:
+            entries (list): the entries of the frame (default: the entries of the running frame)
+
+        Returns:
+            str: the name of the function, None for the program
+        """
+        entries = self.frameEntries if entries is None else entries
+        if entries is self.entries:
+            return None
+        for name, (instructions, functionEntries) in self.compiledFunctions.items():
+            if functionEntries is entries:
+                return name
+        return None
+
+    def attachDebugger(self, debugger=None):
+        """
+        Attach a debugger to the executor, the program is compiled again without the optimization passes
+
+        Args:
+            debugger (Debugger): the debugger to attach (default: a new debugger)
+
+        Returns:
+            Debugger: the attached debugger
+
+        Note:
+            Without the optimization passes every instruction has its own operation, so every index can have a breakpoint
+        """
+        self.debugger = Debugger() if debugger is None else debugger
+        if not self.callStack:
+            self.bytecode = []
+            self.entries = []
+        return self.debugger
+
+    def detachDebugger(self):
+        """
+        Detach the debugger from the executor, the program is compiled again with the optimization passes
+
+        Returns:
+            Debugger: the detached debugger, None if no debugger was attached
+
+        Note:
+            If a function is running, the program is compiled again only by the next execution that doesn't start inside a function
+        """
+        debugger = self.debugger
+        self.debugger = None
+        if not self.callStack:
+            self.bytecode = []
+            self.entries = []
+        return debugger
+
+    def executeDebug(self):
+        """
+        Execute the instructions, checking the hooks of the debugger before and after every instruction
+
+        Returns:
+            None
+
+        Note:
+            When the debugger pauses without continuing, the execution stops and the index is the one of the paused instruction
+            (or of the next one, for a watch), calling execute again resumes the execution from there
+        """
+        debugger = self.debugger
+        limited = self.hasLimits()
+        internal = {self.opcodes["JUMP"], self.opcodes["RET"]}
+        commands = {opcode: command for command, opcode in self.opcodes.items()}
+        if self.terminated:
+            return
+        code = self.compileBytecode()
+        entries = self.frameEntries
+        if self.index >= len(entries):
+            return
+        end = len(code)
+        pc = entries[self.index]
+        try:
+            while pc < end:
+                opcode, handler, operand, source, control = code[pc]
+                if opcode not in internal:
+                    self.index = source
+                    if not debugger.before(self, source, commands[opcode]):
+                        return
+                self.steps += 1
+                if control:
+                    self.index = source
+                    handler(self, operand)
+                    if self.terminated:
+                        self.unwind()
+                        self.index += 1
+                        return
+                    code = self.compileBytecode()
+                    entries = self.frameEntries
+                    end = len(code)
+                    if self.index+1 >= len(entries):
+                        if not self.callStack:
+                            self.index += 1
+                            return
+                        self.index = len(entries)-2
+                    pc = entries[self.index+1]
+                    self.index += 1
+                else:
+                    handler(self, operand)
+                    pc += 1
+                    self.index = source+1
+                if debugger.watches and opcode not in internal and not debugger.after(self, source, commands[opcode]):
+                    return
+                if limited:
+                    self.checkLimits(self.index)
+        except LimitExceeded as e:
+            if self.callStack:
+                self.unwind()
+                self.index += 1
+            raise e
+        except Exception as e:
+            self.index = code[pc][3]
+            self.unwind()
+            self.index += 1
+            raise e
+        self.index = len(entries)
+
+    def enableProfiling(self, profiler=None):
+        """
+        Start recording the execution of the bytecode, the program is compiled again with the profiled handlers
+
+        Args:
+            profiler (Profiler): the profiler to use (default: a new profiler)
+
+        Returns:
+            Profiler: the profiler of the executor
+
+        Note:
+            The profiling works only with the bytecode, when it is disabled the bytecode has no overhead.
+            It must be enabled before the execution or between two executions, not while a function is running
+        """
+        self.profiler = Profiler() if profiler is None else profiler
+        self.bytecode = []
+        self.entries = []
+        return self.profiler
+
+    def disableProfiling(self):
+        """
+        Stop recording the execution of the bytecode, the program is compiled again without the profiled handlers
+
+        Returns:
+            Profiler: the profiler that was used, None if the profiling was not enabled
         """
-        self.string = ""
-        self.command = ""
-        self.value = None
-        self.decoration = None
-        self.offset = 0
-    
-    def parse(self, string, offset=0):
+        profiler = self.profiler
+        self.profiler = None
+        self.bytecode = []
+        self.entries = []
+        return profiler
+
+    def verify(self, verifier=None):
         """
-        Parse the string of the instruction
+        Verify that the program can't pop an empty stack, starting from the current index with the current stack,
+        the program is compiled again with the fast handlers if it is verified
 
         Args:
-            string (str): the string of the instruction
-            offset (int): the offset of the instruction
+            verifier (StackVerifier): the verifier to use (default: a new verifier)
 
         Returns:
-            None
+            bool: True if the program is verified, False if it can't be verified (the reason is in the reason attribute of the verifier)
+
+        Raises:
+            VerificationError: if an instruction can pop an empty stack
+
+        Note:
+            The fast handlers replace the top of the stack instead of popping the operands and pushing the result,
+            so when an operation fails for the types of its operands the first operand stays in the stack.
+            While a function is running the program is not verified
         """
-        self.string = string
-        self.offset = offset
-        self.command = string.split()[0].upper()
-        if len(string.split()) > 1 and self.command != "PUSH":
-            self.decoration = string.split()[1]
-        elif len(string.split()) > 1 and self.command == "PUSH":
-            self.value = string.split()[1]
-        if len(string.split()) > 2:
-            self.decoration = string.split()[2]
-    
-    def execute(self, executor):
+        verifier = StackVerifier() if verifier is None else verifier
+        self.verified = False
+        if self.callStack:
+            verifier.reason = "a function is running"
+            return False
+        try:
+            self.verified = verifier(self)
+        finally:
+            self.bytecode = []
+            self.entries = []
+        return self.verified
+
+    def eliminateDeadCode(self, graph=None):
         """
-        Execute the instruction
+        Remove the instructions that can't be executed from the current index, the program is compiled again if any is removed
 
         Args:
-            executor (Executor): the executor of the instruction
+            graph (ControlFlowGraph): the graph to build (default: a new graph)
 
         Returns:
-            None
+            int: the number of removed instructions, 0 also if the flow of the program can't be known (the reason is in the reason attribute of the graph)
+
+        Note:
+            The index is moved to the same instruction. While a function is running nothing is removed
         """
-        if self.command == "PUSH":
-            executor.instructionsDict[self.command](executor, self.value)
-        elif self.command == "GOTO":
-            executor.instructionsDict[self.command](executor, self.offset)
-        elif self.command in executor.functions:
-            for instruction in executor.functions[self.command]:
-                instruction.execute(executor)
-        else:
-            executor.instructionsDict[self.command](executor)
-    
-    def toCpp(self, executor):
+        graph = ControlFlowGraph() if graph is None else graph
+        if self.callStack:
+            graph.reason = "a function is running"
+            return 0
+        if not graph.build(self, self.index):
+            return 0
+        try:
+            removed = graph.eliminate(self)
+        except ValueError as e:
+            graph.reason = str(e)
+            return 0
+        if removed:
+            self.bytecode = []
+            self.entries = []
+            self.frameEntries = self.entries
+            self.verified = False
+        return removed
+
+    def enableJit(self, jit=None):
         """
-        Return the C++ code of the instruction
+        Start compiling the hot regions of the bytecode into Python functions
 
         Args:
-            executor (Executor): the executor of the instruction
+            jit (PythonJit): the JIT to use (default: a new JIT)
 
         Returns:
-            str: the C++ code of the instruction
-        """
-        if self.command == "PUSH":
-            return executor.instructionsDict[self.command].toCpp(executor, self.value)
-        elif self.command == "GOTO":
-            return executor.instructionsDict[self.command].toCpp(executor, self.offset)
-        elif self.command in executor.functions:
-            s = ""
-            for instruction in executor.functions[self.command]:
-                s += instruction.toCpp()
-            return s
-        else:
-            return executor.instructionsDict[self.command].toCpp(executor)
+            PythonJit: the JIT of the executor
 
-class Executor:
-    """
-    Class that represent the executor of the instructions
+        Note:
+            The compiled regions run only without limits, profiler and debugger, so the steps are counted exactly
+            and every operation can be recorded when they are set
+        """
+        self.jit = PythonJit() if jit is None else jit
+        return self.jit
 
-    Attributes:
-        io (IOOperator): the IO operator of the executor
-        variables (dict): the dictionary of the variables of the executor
-        stack (list): the stack of the executor
-        instructions (list): the list of the instructions of the executor
-        functions (dict): the functions of the executor
-        index (int): the index of the executor, representing the current instruction
-        terminated (bool): the boolean value representing if the executor is terminated
-        instructionsDict (dict): the dictionary of the instructions objects of the executor
+    def disableJit(self):
+        """
+        Stop running the compiled regions of the bytecode
 
-    Methods:
-        addInstruction(instruction, offset): add an instruction to the executor
-        executeInstruction(): execute the current instruction of the executor
-        execute(): execute all the instructions of the executor
-        resetIndex(): reset the index of the executor
-        reset(): reset the executor
-    """
+        Returns:
+            PythonJit: the JIT that was used, None if the JIT was not enabled
+        """
+        jit = self.jit
+        self.jit = None
+        return jit
 
-    def __init__(self, io):
+    def enableSandbox(self, sandbox=None):
         """
-        Constructor of the class
+        Run the program in a sandbox, its limits replace the limits of the executor
 
         Args:
-            io (IOOperator): the IO operator of the executor
+            sandbox (Sandbox): the sandbox to use (default: a sandbox without limits that doesn't allow COMPILE)
 
         Returns:
-            None
-        """
-        self.io = io
-        self.variables = {}
-        self.stack = []
-        self.instructions = []
-        self.functions = {}
-        self.index = 0
-        self.terminated = False
-        self.instructionsDict = {
-            "PUSH": push(),
-            "POP": pop(),
-            "PRINT": print_(),
-            "ADD": add(),
-            "SUB": sub(),
-            "MUL": mul(),
-            "DIV": div(),
-            "SWAP": swap(),
-            "DUP": dup(),
-            "CLEAR": clear(),
-            "MOD": mod(),
-            "MIN": min_(),
-            "MAX": max_(),
-            "EQUAL": equal(),
-            "GREATER": greater(),
-            "LESS": less(),
-            "NOT": not_(),
-            "AND": and_(),
-            "OR": or_(),
-            "GOTO": goto(),
-            "NUM": num(),
-            "INPUT": input_(),
-            "INT": int_(),
-            "FLOAT": float_(),
-            "STRING": string(),
-            "COMMENT": comment(),
-            "STORE": store(),
-            "LOAD": load(),
-            "IMPORT": import_(),
-            "END": end(),
-            "DEFINE": define(),
-            "COMPILE": compile(),
-            "INCLUDE": include(),
-            "INSTR": instr()
-        }
-    
-    def addInstruction(self, instruction, offset=0):
+            Sandbox: the sandbox of the executor
         """
-        Add an instruction to the executor
+        self.sandbox = Sandbox() if sandbox is None else sandbox
+        self.sandbox.apply(self)
+        return self.sandbox
 
-        Args:
-            instruction (str): the instruction to add
-            offset (int): the offset of the instruction
+    def disableSandbox(self):
+        """
+        Stop checking the imports and COMPILE, the limits of the sandbox stay on the executor
 
         Returns:
-            None
+            Sandbox: the sandbox that was used, None if there was no sandbox
         """
-        instr = Instruction()
-        instr.parse(instruction, offset)
-        self.instructions.append(instr)
-    
-    def executeInstruction(self):
+        sandbox = self.sandbox
+        self.sandbox = None
+        return sandbox
+
+    def optimizationReport(self):
         """
-        Execute the current instruction of the executor
+        Return the statistics of the optimization passes
 
         Returns:
-            None
+            dict: the name of every pass with statistics mapped to its statistics
         """
-        instruction = self.instructions[self.index]
-        instruction.execute(self)
+        return {type(optimizer).__name__: optimizer.report() for optimizer in self.passes if hasattr(optimizer, "report")}
 
     def execute(self):
         """
@@ -825,16 +5293,189 @@ class Executor:
             None
         
         Note:
-            This method starts the execution of the instructions from the current index, and the index is not resetted after the execution
+            This method starts the execution of the instructions from the current index, and the index is not resetted after the execution.
+            Only the control commands update the index while running, the other instructions are dispatched directly from the bytecode.
+            Inside a function the index is relative to the first instruction of the function.
+            The steps are counted and the limits are checked only at the control operations, so a straight sequence of operations
+            can exceed the budget before it is detected. When a limit is exceeded the index is the one of the next instruction.
+            With the JIT, every operation where a jump lands is counted and its hot region runs as a Python function
+        """
+        if self.debugger is not None and self.useBytecode and self.debugger.hasHooks():
+            return self.executeDebug()
+        limited = self.hasLimits()
+        if not self.useBytecode:
+            while not self.terminated and self.index < len(self.instructions):
+                try:
+                    self.executeInstruction()
+                except Exception as e:
+                    raise e
+                finally:
+                    self.index += 1
+                    self.steps += 1
+                if limited:
+                    self.checkLimits(self.index)
+            return
+        if self.terminated:
+            return
+        jit = self.jit if not limited and self.profiler is None else None
+        code = self.compileBytecode()
+        entries = self.frameEntries
+        if self.index >= len(entries):
+            return
+        end = len(code)
+        pc = entries[self.index]
+        start = pc
+        try:
+            while pc < end:
+                opcode, handler, operand, source, control = code[pc]
+                if control:
+                    self.steps += pc - start + 1
+                    start = pc + 1
+                    self.index = source
+                    handler(self, operand)
+                    if self.terminated:
+                        self.unwind()
+                        self.index += 1
+                        return
+                    code = self.compileBytecode()
+                    entries = self.frameEntries
+                    end = len(code)
+                    if self.index+1 >= len(entries):
+                        if not self.callStack:
+                            self.index += 1
+                            return
+                        self.index = len(entries)-2
+                    pc = entries[self.index+1]
+                    if jit is not None:
+                        try:
+                            pc = jit.enter(self, code, entries, pc)
+                        except Exception as e:
+                            pc = start = jit.failure
+                            raise e
+                    start = pc
+                    if limited:
+                        self.checkLimits(self.index+1)
+                else:
+                    handler(self, operand)
+                    pc += 1
+        except LimitExceeded as e:
+            self.unwind()
+            self.index += 1
+            raise e
+        except Exception as e:
+            self.steps += pc - start + 1
+            self.index = code[pc][3]
+            self.unwind()
+            self.index += 1
+            raise e
+        self.steps += pc - start
+        self.index = len(entries)
+
+    async def executeAsync(self, quantum=1000, quota=None):
+        """
+        Execute all the instructions of the executor as a coroutine, so many executors can run in the same event loop
+
+        Args:
+            quantum (int): the number of steps after which the control is given to the event loop
+            quota (int): the maximum number of steps of this execution, None if there is no limit
+
+        Returns:
+            None
+
+        Raises:
+            LimitExceeded: if the quota, or one of the limits of the executor, is exceeded
+            ValueError: if the debugger has breakpoints or watches
+
+        Note:
+            PRINT and INPUT wait for writeAsync and readAsync of the IO operator, the other operations run like in execute.
+            The control is given to the event loop only at the control operations, so a straight sequence of operations
+            can run longer than the quantum. The quota is checked like the instruction budget, and the JIT is not used
         """
-        while not self.terminated and self.index < len(self.instructions):
+        if self.debugger is not None and self.debugger.hasHooks():
+            raise ValueError("the debugger hooks can't be checked in the asynchronous execution")
+        budget = self.instructionBudget
+        if quota is not None:
+            self.instructionBudget = self.steps + quota if budget is None else min(budget, self.steps + quota)
+        try:
+            limited = self.hasLimits()
+            asyncHandlers = {self.opcodes[command]: handler.callAsync for command, handler in self.instructionsDict.items() if hasattr(handler, "callAsync")}
+            pause = self.steps + quantum
+            if not self.useBytecode:
+                while not self.terminated and self.index < len(self.instructions):
+                    command = self.instructions[self.index].command
+                    try:
+                        if command in self.functions or self.opcodes.get(command) not in asyncHandlers:
+                            self.executeInstruction()
+                        else:
+                            await asyncHandlers[self.opcodes[command]](self)
+                    finally:
+                        self.index += 1
+                        self.steps += 1
+                    if limited:
+                        self.checkLimits(self.index)
+                    if self.steps >= pause:
+                        pause = self.steps + quantum
+                        await asyncio.sleep(0)
+                return
+            if self.terminated:
+                return
+            code = self.compileBytecode()
+            entries = self.frameEntries
+            if self.index >= len(entries):
+                return
+            end = len(code)
+            pc = entries[self.index]
+            start = pc
             try:
-                self.executeInstruction()
-            except Exception as e:
+                while pc < end:
+                    opcode, handler, operand, source, control = code[pc]
+                    if control:
+                        self.steps += pc - start + 1
+                        start = pc + 1
+                        self.index = source
+                        handler(self, operand)
+                        if self.terminated:
+                            self.unwind()
+                            self.index += 1
+                            return
+                        code = self.compileBytecode()
+                        entries = self.frameEntries
+                        end = len(code)
+                        if self.index+1 >= len(entries):
+                            if not self.callStack:
+                                self.index += 1
+                                return
+                            self.index = len(entries)-2
+                        pc = entries[self.index+1]
+                        start = pc
+                        if limited:
+                            self.checkLimits(self.index+1)
+                        if self.steps >= pause:
+                            pause = self.steps + quantum
+                            await asyncio.sleep(0)
+                    elif opcode in asyncHandlers:
+                        self.steps += pc - start + 1
+                        start = pc + 1
+                        await asyncHandlers[opcode](self, operand)
+                        pc += 1
+                    else:
+                        handler(self, operand)
+                        pc += 1
+            except LimitExceeded as e:
+                self.unwind()
+                self.index += 1
                 raise e
-            finally:
+            except Exception as e:
+                self.steps += pc - start + 1
+                self.index = code[pc][3]
+                self.unwind()
                 self.index += 1
-    
+                raise e
+            self.steps += pc - start
+            self.index = len(entries)
+        finally:
+            self.instructionBudget = budget
+
     def resetIndex(self):
         """
         Reset the index of the executor
@@ -852,11 +5493,21 @@ class Executor:
             None
         """
         self.variables = {}
-        self.stack = []
+        self.slots = []
+        self.slotNames = {}
+        self.slotKeys = []
+        self.stack = NumericStack() if self.compactStack else []
         self.instructions = []
         self.functions = {}
         self.index = 0
         self.terminated = False
+        self.bytecode = []
+        self.entries = []
+        self.frameEntries = self.entries
+        self.callStack = []
+        self.compiledFunctions = {}
+        self.definedFunctions = 0
+        self.verified = False
 
 class NALM(InterfaceDefinition):
     """
@@ -902,10 +5553,12 @@ STORE             -->    Salva un valore nello stack con una chiave
 LOAD              -->    Carica un valore dallo stack con una chiave
 IMPORT            -->    Importa un file di istruzioni, il cui nome è inserito nello stack
 END               -->    Termina l'esecuzione del programma
-DEFINE            -->    Definisce una funzione (funziona solo in modalità interprete)
+DEFINE            -->    Definisce una funzione (i GOTO della funzione sono relativi alla sua prima istruzione)
 COMPILE           -->    Compila il programma in un file C++
 INCLUDE           -->    Includi un file di istruzioni nel programma, ma le istruzioni non vengono eseguite
 INSTR             -->    Carica l'indice dell'istruzione corrente nello stack 
+PRAGMA <modo>     -->    TYPED: i valori di PUSH diventano interi, float o stringhe tra virgolette; LEGACY: i valori di PUSH restano stringhe
+BLOCK             -->    Inizia un blocco di istruzioni, che termina con una riga vuota ed è eseguito tutto insieme
             """,
             "goodbye": "Arrivederci",
             "error": "Si è verificato un errore"
@@ -942,10 +5595,12 @@ STORE             -->    Saves a value into the stack with a key
 LOAD              -->    Loads a value from the stack with a key
 IMPORT            -->    Imports an instruction file, whose name is pushed into the stack
 END               -->    Terminates the program execution
-DEFINE            -->    Defines a function (it works only in the interpreter mode)
+DEFINE            -->    Defines a function (the GOTO targets of the function are relative to its first instruction)
 COMPILE           -->    Compiles the program into a C++ file
 INCLUDE           -->    Includes an instruction file into the program, but the istructions are not executed
 INSTR             -->    Load the index of the current instruction in the stack
+PRAGMA <mode>     -->    TYPED: the PUSH values become integers, floats or quoted strings; LEGACY: the PUSH values stay strings
+BLOCK             -->    Starts a block of instructions, that ends with an empty line and is executed as a whole
             """,
             "goodbye": "Goodbye",
             "error": "An error occurred"
@@ -970,6 +5625,10 @@ INSTR             -->    Load the index of the current instruction in the stack
 
         Returns:
             None
+
+        Note:
+            After BLOCK the lines are collected until an empty line, then they are compiled and executed as one unit,
+            so a pasted program can jump forward
         """
         executor = Executor(TerminalIO(lang))
         super().drowPrologue()
@@ -978,8 +5637,18 @@ INSTR             -->    Load the index of the current instruction in the stack
                 rawChoice = input(">>> ")
                 if(rawChoice.upper() == "HELP"):
                     print(self.languages[lang]["help"])
+                elif(rawChoice.strip() == ""):
+                    continue
                 else:
-                    executor.addInstruction(rawChoice)
+                    if(rawChoice.strip().upper() == "BLOCK"):
+                        lines = []
+                        line = input("... ")
+                        while line.strip() != "":
+                            lines.append(line)
+                            line = input("... ")
+                        executor.addInstructions(lines)
+                    else:
+                        executor.addInstruction(rawChoice)
                     executor.execute()
                     if(executor.terminated):
                         print(self.languages[lang]["goodbye"])
@@ -987,6 +5656,384 @@ INSTR             -->    Load the index of the current instruction in the stack
             except Exception as e:
                 print(self.languages[lang]["error"])
 
+class BatchRunner:
+    """
+    Class that represent the runner of a NALM program without the interactive interface
+
+    Static Attributes:
+        exitCodes (dict): the exit code of every result of the execution
+
+    Attributes:
+        io (IOOperator): the IO operator of the programs
+        instructionBudget (int): the maximum number of bytecode operations of a program, None if there is no limit
+        timeout (float): the maximum number of seconds of a program, None if there is no limit
+        useBytecode (bool): if False, the programs are executed one instruction at a time
+        typedLiterals (bool): if True, the values of the PUSH instructions are parsed into native values
+        profile (str): the file where the JSON report of the profiler is written, None to disable the profiling
+        checkpoint (str): the snapshot file of the periodic checkpoints, None to disable them
+        checkpointInterval (int): the number of bytecode operations between two checkpoints
+        jit (int): the threshold of the JIT that compiles the hot regions into Python functions, None to disable it
+        verify (bool): if True, the programs that can pop an empty stack are rejected before the execution
+        maxStack (int): the maximum number of values of the stack of a program, None if there is no limit
+        maxVariables (int): the maximum number of variables of a program, None if there is no limit
+        maxStringBytes (int): the maximum memory of the strings of a program, in bytes, None if there is no limit
+        compactStack (bool): if True, the programs use a NumericStack of 64-bit integers
+        moduleCache (ModuleCache): the cache of the files loaded with IMPORT and INCLUDE, None to use the cache shared by all the executors
+        eliminateDeadCode (bool): if True, the instructions that can't be executed are removed before the execution
+        sandbox (Sandbox): the limits of the untrusted programs, a copy is used by every program and its limits replace the other limits, None to trust the programs
+        sandboxReport (str): the file where the JSON report of the resources used in the sandbox is written, None to keep it only in usage
+        usage (dict): the resources used in the sandbox by the last program, None without a sandbox
+
+    Methods:
+        run(filename): run a program file and return its exit code
+        execute(filename): run a program file and return its result and its error message
+    """
+
+    exitCodes = {
+        "ok": 0,
+        "error": 1,
+        "usage": 2,
+        "budget": 3,
+        "timeout": 4,
+        "invalid": 5,
+        "memory": 6,
+        "sandbox": 7
+    }
+
+    def __init__(self, io=None, instructionBudget=None, timeout=None, useBytecode=True, typedLiterals=False, profile=None, checkpoint=None, checkpointInterval=1000000, jit=None, verify=False, maxStack=None, maxVariables=None, maxStringBytes=None, compactStack=False, moduleCache=None, eliminateDeadCode=False, sandbox=None, sandboxReport=None):
+        """
+        Constructor of the class
+
+        Args:
+            io (IOOperator): the IO operator of the programs (default: BufferedIO on stdout and stdin)
+            instructionBudget (int): the maximum number of bytecode operations of a program
+            timeout (float): the maximum number of seconds of a program
+            useBytecode (bool): if False, the programs are executed one instruction at a time
+            typedLiterals (bool): if True, the values of the PUSH instructions are parsed into native values
+            profile (str): the file where the JSON report of the profiler is written
+            checkpoint (str): the snapshot file of the periodic checkpoints, if it exists the execution resumes from it
+            checkpointInterval (int): the number of bytecode operations between two checkpoints
+            jit (int): the number of times a jump must land on an operation before its region is compiled into a Python function
+            verify (bool): if True, the programs are verified before the execution and the verified ones use the fast handlers
+            maxStack (int): the maximum number of values of the stack of a program
+            maxVariables (int): the maximum number of variables of a program
+            maxStringBytes (int): the maximum memory of the strings of the stack and of the variables of a program, in bytes
+            compactStack (bool): if True, the programs use a NumericStack, for the programs with only integer values
+            moduleCache (ModuleCache): the cache of the files loaded with IMPORT and INCLUDE (default: the cache shared by all the executors)
+            eliminateDeadCode (bool): if True, the instructions that can't be executed are removed before the verification and the execution
+            sandbox (Sandbox): the limits of the untrusted programs, they replace the budget, the timeout and the memory limits
+            sandboxReport (str): the file where the JSON report of the resources used in the sandbox is written
+
+        Returns:
+            None
+        """
+        self.io = BufferedIO() if io is None else io
+        self.instructionBudget = instructionBudget
+        self.timeout = timeout
+        self.useBytecode = useBytecode
+        self.typedLiterals = typedLiterals
+        self.profile = profile
+        self.checkpoint = checkpoint
+        self.checkpointInterval = checkpointInterval
+        self.jit = jit
+        self.verify = verify
+        self.maxStack = maxStack
+        self.maxVariables = maxVariables
+        self.maxStringBytes = maxStringBytes
+        self.compactStack = compactStack
+        self.moduleCache = moduleCache
+        self.eliminateDeadCode = eliminateDeadCode
+        self.sandbox = sandbox
+        self.sandboxReport = sandboxReport
+        self.usage = None
+
+    def run(self, filename):
+        """
+        Run a program file until it ends, using its compiled bytecode file when it is up to date
+
+        Args:
+            filename (str): the name of the program file
+
+        Returns:
+            int: the exit code of the execution
+
+        Note:
+            The errors are written to stderr, the output of the program is flushed also when the execution fails
+        """
+        result, message = self.execute(filename)
+        if message is not None:
+            print(message, file=sys.stderr)
+        return self.exitCodes[result]
+
+    def execute(self, filename):
+        """
+        Run a program file until it ends, and return the result without writing the errors
+
+        Args:
+            filename (str): the name of the program file
+
+        Returns:
+            tuple: the result of the execution (a key of exitCodes) and the error message, None if there is no error
+
+        Note:
+            The output of the program is flushed also when the execution fails.
+            With a checkpoint file, the execution resumes from it if it exists, and it is removed when the program ends without errors.
+            With the verification, a program that can pop an empty stack is not executed.
+            With the sandbox, the program is loaded without limits and the limits start with the execution
+        """
+        executor = Executor(self.io, self.useBytecode, self.typedLiterals, moduleCache=self.moduleCache)
+        executor.instructionBudget = self.instructionBudget
+        executor.setMemoryLimits(self.maxStack, self.maxVariables, self.maxStringBytes)
+        executor.useCompactStack(self.compactStack)
+        if self.jit is not None:
+            executor.enableJit(PythonJit(self.jit))
+        if self.profile is not None:
+            executor.enableProfiling()
+        try:
+            if self.checkpoint is not None and os.path.exists(self.checkpoint):
+                executor.loadSnapshot(self.checkpoint)
+            else:
+                executor.loadProgram(filename)
+            if self.checkpoint is not None:
+                executor.enableCheckpoints(self.checkpoint, self.checkpointInterval)
+            if self.eliminateDeadCode:
+                executor.eliminateDeadCode()
+            if self.verify:
+                executor.verify()
+        except VerificationError as e:
+            return "invalid", f"{filename}: {e}"
+        except Exception as e:
+            return "error", f"{filename}: {type(e).__name__}: {e}"
+        sandbox = copy.deepcopy(self.sandbox)
+        self.usage = None
+        try:
+            if sandbox is not None:
+                executor.enableSandbox(sandbox)
+            elif self.timeout is not None:
+                executor.deadline = time.monotonic() + self.timeout
+            executor.execute()
+        except LimitExceeded as e:
+            return e.limit, f"{filename}: {e}"
+        except Exception as e:
+            return "error", f"{filename}: instruction {executor.index-1}: {type(e).__name__}: {e}"
+        finally:
+            self.io.flush()
+            if self.profile is not None:
+                with open(self.profile, "w") as file:
+                    file.write(executor.profiler.toJson())
+            if sandbox is not None:
+                self.usage = sandbox.report(executor)
+                if self.sandboxReport is not None:
+                    with open(self.sandboxReport, "w") as file:
+                        file.write(json.dumps(self.usage, indent=4))
+        if self.checkpoint is not None and os.path.exists(self.checkpoint):
+            os.remove(self.checkpoint)
+        return "ok", None
+
+class PoolRunner:
+    """
+    Class that represent the runner of many independent NALM programs on a pool of processes
+
+    Attributes:
+        runner (BatchRunner): the settings of the executions, every program writes into its own MemoryIO
+        processes (int): the number of worker processes
+        shareModules (bool): if True, the files parsed by IMPORT and INCLUDE are shared between the workers
+        chunkSize (int): the number of programs sent to a worker at once, None to compute it from the number of programs
+
+    Methods:
+        collect(path): return the programs of a directory or of a manifest
+        run(filenames): run the programs on the pool and return the report
+        toJson(report): return a report as JSON
+    """
+
+    def __init__(self, runner=None, processes=None, shareModules=True, chunkSize=None):
+        """
+        Constructor of the class
+
+        Args:
+            runner (BatchRunner): the settings of the executions, it is copied without its IO, profile, checkpoint and sandbox report (default: a BatchRunner with the default settings)
+            processes (int): the number of worker processes (default: the number of CPUs)
+            shareModules (bool): if True, the files parsed by IMPORT and INCLUDE are shared between the workers
+            chunkSize (int): the number of programs sent to a worker at once
+
+        Returns:
+            None
+        """
+        self.runner = copy.copy(runner) if runner is not None else BatchRunner(MemoryIO())
+        self.runner.io = MemoryIO()
+        self.runner.profile = None
+        self.runner.checkpoint = None
+        self.runner.sandboxReport = None
+        self.runner.moduleCache = None
+        self.processes = processes or os.cpu_count() or 1
+        self.shareModules = shareModules
+        self.chunkSize = chunkSize
+
+    def collect(self, path):
+        """
+        Return the programs of a directory or of a manifest
+
+        Args:
+            path (str): a directory, whose .nalm files are the programs, or a manifest with a program on every line
+
+        Returns:
+            list: the paths of the programs, sorted for a directory and in order for a manifest
+
+        Note:
+            In a manifest the empty lines and the lines starting with # are ignored, the relative paths are relative to the manifest
+        """
+        if os.path.isdir(path):
+            return sorted(os.path.join(path, name) for name in os.listdir(path) if name.endswith(".nalm"))
+        filenames = []
+        with open(path, "r") as file:
+            for line in file:
+                line = line.strip()
+                if line and not line.startswith("#"):
+                    filenames.append(os.path.join(os.path.dirname(path), line))
+        return filenames
+
+    def run(self, filenames):
+        """
+        Run the programs on the pool, every worker has its own executor for every program and captures its output
+
+        Args:
+            filenames (list): the paths of the programs
+
+        Returns:
+            dict: the result, the exit code, the error message, the output and the time of every program (in the given order),
+                the number of programs for every result, the total time, the sum of the times of the programs and the number of processes
+
+        Note:
+            The timeout of the runner is checked at the control operations of every program, like in BatchRunner
+        """
+        tasks = list(enumerate(filenames))
+        chunkSize = self.chunkSize or max(1, len(tasks) // (self.processes * 4))
+        start = time.perf_counter()
+        manager = multiprocessing.Manager() if self.shareModules else None
+        try:
+            shared = manager.dict() if manager is not None else None
+            with multiprocessing.Pool(self.processes, initPoolWorker, (self.runner, shared)) as pool:
+                programs = sorted(pool.imap_unordered(runPoolProgram, tasks, chunkSize), key=lambda program: program["position"])
+        finally:
+            if manager is not None:
+                manager.shutdown()
+        results = {}
+        for program in programs:
+            del program["position"]
+            results[program["result"]] = results.get(program["result"], 0) + 1
+        return {
+            "programs": programs,
+            "results": results,
+            "time": time.perf_counter() - start,
+            "programTime": sum(program["time"] for program in programs),
+            "processes": self.processes
+        }
+
+    def toJson(self, report):
+        """
+        Return a report as JSON
+
+        Args:
+            report (dict): the report returned by run
+
+        Returns:
+            str: the JSON of the report
+        """
+        return json.dumps(report, indent=4)
+
+poolWorker = None
+
+def initPoolWorker(runner, shared):
+    """
+    Prepare a worker process of PoolRunner
+
+    Args:
+        runner (BatchRunner): the settings of the executions
+        shared (dict): the mapping of the parsed files shared between the workers, None to use a cache of the worker
+
+    Returns:
+        None
+    """
+    global poolWorker
+    poolWorker = runner
+    poolWorker.moduleCache = SharedModuleCache(shared) if shared is not None else ModuleCache()
+
+def runPoolProgram(task):
+    """
+    Run a program in a worker process of PoolRunner
+
+    Args:
+        task (tuple): the position and the path of the program
+
+    Returns:
+        dict: the position, the path, the result, the exit code, the error message, the output, the time and the resources used in the sandbox of the program
+    """
+    position, filename = task
+    poolWorker.io = MemoryIO()
+    start = time.perf_counter()
+    result, message = poolWorker.execute(filename)
+    elapsed = time.perf_counter() - start
+    return {
+        "position": position,
+        "filename": filename,
+        "result": result,
+        "exitCode": poolWorker.exitCodes[result],
+        "message": message,
+        "output": poolWorker.io.getOutput(),
+        "time": elapsed,
+        "usage": poolWorker.usage
+    }
+
+def main(argv=None):
+    """
+    Run a NALM program from the command line, or the interactive interface if no program is given
+
+    Args:
+        argv (list): the arguments of the command line (default: sys.argv)
+
+    Returns:
+        int: the exit code
+    """
+    parser = argparse.ArgumentParser(prog="NALM", description="Run a NALM program without the interactive interface")
+    parser.add_argument("filename", nargs="?", help="the program file, if it is missing the interactive interface is shown")
+    parser.add_argument("--budget", type=int, default=None, help="the maximum number of bytecode operations")
+    parser.add_argument("--timeout", type=float, default=None, help="the maximum number of seconds")
+    parser.add_argument("--legacy", action="store_true", help="execute one instruction at a time, without bytecode")
+    parser.add_argument("--typed", action="store_true", help="parse the PUSH values into native values")
+    parser.add_argument("--profile", default=None, help="the file where the JSON report of the profiler is written")
+    parser.add_argument("--checkpoint", default=None, help="the snapshot file of the periodic checkpoints, the execution resumes from it if it exists")
+    parser.add_argument("--checkpoint-every", type=int, default=1000000, help="the number of bytecode operations between two checkpoints")
+    parser.add_argument("--verify", action="store_true", help="reject the program if it can pop an empty stack, and run it with the fast handlers if it can't")
+    parser.add_argument("--max-stack", type=int, default=None, help="the maximum number of values of the stack")
+    parser.add_argument("--max-variables", type=int, default=None, help="the maximum number of variables")
+    parser.add_argument("--max-string-bytes", type=int, default=None, help="the maximum memory of the strings of the stack and of the variables")
+    parser.add_argument("--compact-stack", action="store_true", help="keep the stack in an array of 64-bit integers, for the programs with only integer values")
+    parser.add_argument("--jit", action="store_true", help="compile the hot regions of the bytecode into Python functions")
+    parser.add_argument("--jit-threshold", type=int, default=50, help="the number of jumps to an operation before its region is compiled")
+    parser.add_argument("--eliminate-dead-code", action="store_true", help="remove the instructions that can't be executed before running the program")
+    parser.add_argument("--sandbox", action="store_true", help="run an untrusted program: COMPILE is not allowed and the budget, the timeout and the memory limits are reported")
+    parser.add_argument("--max-import-depth", type=int, default=None, help="the maximum depth of the imported files in the sandbox")
+    parser.add_argument("--import-path", action="append", default=None, help="a directory whose files can be imported in the sandbox, it can be repeated")
+    parser.add_argument("--sandbox-report", default=None, help="the file where the JSON report of the resources used in the sandbox is written")
+    parser.add_argument("--workers", type=int, default=None, help="run the programs of a directory or of a manifest on a pool of processes and print the JSON report")
+    arguments = parser.parse_args(argv)
+    if arguments.filename is None:
+        NALM().textInterface()
+        return BatchRunner.exitCodes["ok"]
+    sandbox = None
+    if arguments.sandbox:
+        sandbox = Sandbox(arguments.budget, arguments.timeout, arguments.max_import_depth, arguments.import_path, False,
+                          arguments.max_stack, arguments.max_variables, arguments.max_string_bytes)
+    runner = BatchRunner(None, arguments.budget, arguments.timeout, not arguments.legacy, arguments.typed, arguments.profile, arguments.checkpoint, arguments.checkpoint_every, arguments.jit_threshold if arguments.jit else None, arguments.verify,
+                         arguments.max_stack, arguments.max_variables, arguments.max_string_bytes, arguments.compact_stack,
+                         eliminateDeadCode=arguments.eliminate_dead_code, sandbox=sandbox, sandboxReport=arguments.sandbox_report)
+    if arguments.workers is not None:
+        pool = PoolRunner(runner, arguments.workers)
+        report = pool.run(pool.collect(arguments.filename))
+        print(pool.toJson(report))
+        return BatchRunner.exitCodes["ok"] if set(report["results"]) <= {"ok"} else BatchRunner.exitCodes["error"]
+    return runner.run(arguments.filename)
+
 def construct():
     """
     Construct the NALM program
@@ -997,4 +6044,4 @@ def construct():
     return NALM()
 
 if __name__ == "__main__":
-    nalm = NALM().textInterface()
+    sys.exit(main())
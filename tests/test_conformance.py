@@ -0,0 +1,208 @@
+"""
+Differential conformance tests of the NALM engines
+
+Every program of tests/conformance runs on every engine, and the output and the error of every run must be the expected ones.
+A program <name>.nalm has its expected output in <name>.out and, if it stops with an error, the name of the exception in <name>.err.
+The modules of the programs are in tests/conformance/modules, the programs import them as "{directory}/modules/<module>".
+
+Run as a script to measure the speed of the engines: python tests/test_conformance.py [--repeat N] [program ...]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import shutil
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from textPrograms.NALM import Executor, Instruction, MemoryIO, NativeCompiler, PythonJit, VerificationError
+
+programsDirectory = os.path.join(os.path.dirname(os.path.abspath(__file__)), "conformance")
+
+engineNames = ("reference", "bytecode", "verified", "jit", "async", "native")
+
+timeout = 30
+
+programNames = sorted(os.path.splitext(name)[0] for name in os.listdir(programsDirectory) if name.endswith(".nalm"))
+
+def expected(name):
+    """
+    Return the expected result of a program
+
+    Args:
+        name (str): the name of the program
+
+    Returns:
+        tuple: the output and the name of the exception, None if the program ends without errors
+    """
+    with open(os.path.join(programsDirectory, name + ".out")) as file:
+        output = file.read()
+    error = None
+    if os.path.exists(os.path.join(programsDirectory, name + ".err")):
+        with open(os.path.join(programsDirectory, name + ".err")) as file:
+            error = file.read().strip()
+    return output, error
+
+def writePrograms(directory):
+    """
+    Copy the programs and their modules into a directory, replacing {directory} with the directory
+
+    Args:
+        directory (str): the directory
+
+    Returns:
+        None
+    """
+    os.makedirs(os.path.join(directory, "modules"), exist_ok=True)
+    for root, folders, files in os.walk(programsDirectory):
+        for name in files:
+            if name.endswith(".nalm"):
+                with open(os.path.join(root, name)) as file:
+                    source = file.read().replace("{directory}", directory)
+                with open(os.path.join(directory, os.path.relpath(os.path.join(root, name), programsDirectory)), "w") as file:
+                    file.write(source)
+
+def runEngine(engine, name, directory):
+    """
+    Run a program on an engine
+
+    Args:
+        engine (str): the name of the engine, reference executes one instruction at a time
+        name (str): the name of the program
+        directory (str): the directory of the copied programs, where the C++ code and the binaries are written
+
+    Returns:
+        tuple: the output, the name of the exception (None if there is no error), the number of steps (None for native)
+            and the seconds of the execution, without the parsing and the compilation
+
+    Raises:
+        VerificationError: if the verified engine rejects the program
+        RuntimeError: if the native engine can't build the program with native values
+    """
+    io = MemoryIO()
+    executor = Executor(io, engine != "reference")
+    executor.loadProgram(os.path.join(directory, name + ".nalm"))
+    if engine == "native":
+        source = os.path.join(directory, name + ".cpp")
+        executor.nativeCompiler = NativeCompiler()
+        executor.nativeBuild = True
+        instruction = Instruction()
+        instruction.parse("COMPILE")
+        executor.instructions.append(instruction)
+        executor.index = len(executor.instructions)-1
+        executor.stack.append(source)
+        try:
+            executor.executeInstruction()
+        except Exception as e:
+            raise RuntimeError(f"the C++ code can't be generated: {type(e).__name__}: {e}")
+        if not executor.nativeCompiler.native:
+            raise RuntimeError(f"the C++ backend can't compile the program with native values: {executor.nativeCompiler.reason}")
+        binary = os.path.splitext(source)[0]
+        if not os.path.exists(binary):
+            raise RuntimeError(f"the C++ code can't be built: {executor.nativeCompiler.reason}")
+        start = time.perf_counter()
+        result = subprocess.run([binary], capture_output=True, text=True)
+        seconds = time.perf_counter() - start
+        return result.stdout, None if result.returncode == 0 else result.stderr.strip(), None, seconds
+    if engine == "verified":
+        executor.verify()
+    if engine == "jit":
+        executor.enableJit(PythonJit(2))
+    error = None
+    start = time.perf_counter()
+    try:
+        if engine == "async":
+            asyncio.run(executor.executeAsync())
+        else:
+            executor.execute()
+    except Exception as e:
+        error = type(e).__name__
+    return io.getOutput(), error, executor.steps, time.perf_counter() - start
+
+def stop(signum, frame):
+    """
+    Stop a run that takes too long, a diverging engine can loop forever
+
+    Raises:
+        TimeoutError: always
+    """
+    raise TimeoutError(f"the run takes more than {timeout} seconds")
+
+@pytest.fixture(scope="module")
+def directory(tmp_path_factory):
+    directory = str(tmp_path_factory.mktemp("conformance"))
+    writePrograms(directory)
+    return directory
+
+@pytest.mark.parametrize("engine", engineNames)
+@pytest.mark.parametrize("name", programNames)
+def test_conformance(name, engine, directory):
+    output, error = expected(name)
+    if engine == "native":
+        if shutil.which("g++") is None and shutil.which("clang++") is None:
+            pytest.skip("no C++ compiler found")
+        if error is not None:
+            pytest.skip("the native binaries stop with their own error messages")
+    signal.signal(signal.SIGALRM, stop)
+    signal.alarm(timeout)
+    try:
+        result = runEngine(engine, name, directory)
+    except VerificationError as e:
+        pytest.skip(f"the verifier rejects the program: {e}")
+    except RuntimeError as e:
+        if engine != "native":
+            raise
+        pytest.skip(str(e))
+    finally:
+        signal.alarm(0)
+    assert result[:2] == (output, error)
+
+def benchmark(names, repeat):
+    """
+    Run the programs on every engine and measure their speed
+
+    Args:
+        names (list): the names of the programs
+        repeat (int): the number of runs of every program on every engine, the best time is reported
+
+    Returns:
+        dict: for every program the number of instructions executed by the reference engine and,
+            for every engine, its best time and its instructions per second, or why it was skipped
+    """
+    report = {}
+    with tempfile.TemporaryDirectory() as directory:
+        writePrograms(directory)
+        for name in names:
+            results = {}
+            instructions = None
+            for engine in engineNames:
+                try:
+                    best = None
+                    for repetition in range(repeat):
+                        output, error, steps, seconds = runEngine(engine, name, directory)
+                        best = seconds if best is None else min(best, seconds)
+                except (VerificationError, RuntimeError) as e:
+                    results[engine] = {"skipped": str(e)}
+                    continue
+                if engine == "reference":
+                    instructions = steps
+                results[engine] = {"conforming": (output, error) == expected(name), "time": best}
+                if instructions is not None:
+                    results[engine]["instructionsPerSecond"] = instructions / max(best, 1e-9)
+            report[name] = {"instructions": instructions, "engines": results}
+    return report
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="measure the speed of the NALM engines on the conformance programs")
+    parser.add_argument("programs", nargs="*", help="the programs to run (default: all the programs)")
+    parser.add_argument("--repeat", type=int, default=1, help="the number of runs of every program, the best time is reported")
+    arguments = parser.parse_args()
+    print(json.dumps(benchmark(arguments.programs or programNames, arguments.repeat), indent=4))